@@ -0,0 +1,329 @@
+"""
+Parçalı AI doküman iyileştirme
+Markdown başlık sınırlarından token bütçeli parçalara bölünür, parçalar
+sınırlı bir thread havuzuyla, bağlantıları yeniden kullanan tek bir
+requests.Session üzerinden eşzamanlı gönderilir ve sırayla birleştirilir.
+Sunucu adresi (base_url) değiştirilebildiği için yerel bir sahte sunucuyla
+denenebilir. ConversionCache verilirse yanıtlar (model, istem sürümü, parça
+özeti) anahtarıyla saklanır; yalnızca değişen parçalar API'ye gider.
+"""
+
+import os
+import random
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from conversion_cache import ConversionCache
+
+DEFAULT_BASE_URL = 'https://api.openai.com/v1'
+DEFAULT_MODEL = 'gpt-3.5-turbo'
+# Türkçe metinde token başına ortalama karakter (bütçe için kaba tahmin)
+CHARS_PER_TOKEN = 3
+# Yeniden denenecek HTTP durum kodları
+RETRY_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+# Önbellek anahtarına girer: SYSTEM_PROMPT veya CHUNK_PROMPT değiştiğinde artırılmalıdır
+PROMPT_VERSION = 1
+# Parça sınırlarını içerikten belirleyen başlık özeti böleni (bkz. split_markdown_chunks)
+ANCHOR_MODULUS = 4
+
+SYSTEM_PROMPT = "Sen GitBook dokümanları için uzman bir Markdown formatlayıcısın."
+
+CHUNK_PROMPT = """Aşağıdaki metin "{title}" dokümanının {index}/{total}. bölümüdür. Bu bölümü GitBook için optimize et:
+
+1. Başlıkları emoji'lerle zenginleştir
+2. Önemli bilgileri vurgula
+3. Tablo formatlarını düzenle
+4. Code block'ları uygun şekilde formatla
+5. Daha okunabilir hale getir
+
+İçeriği kısaltma veya çıkarma; içindekiler tablosu ve meta bilgi ekleme (doküman
+parçalar halinde işleniyor). Lütfen sadece düzenlenmiş Markdown döndür, başka açıklama ekleme.
+
+{content}"""
+
+
+# Bu durumlarda diğer parçalar da başarısız olacağından gönderim durdurulur
+FATAL_STATUS = {401, 403, 404}
+
+
+class AIEnhancementError(Exception):
+    """AI isteği yeniden denemelere rağmen başarısız oldu"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+def estimate_tokens(text: str) -> int:
+    """Metnin yaklaşık token sayısı"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _split_sections(markdown: str) -> List[str]:
+    """Markdown'ı başlık satırlarından bölümlere ayırır (kod blokları bölünmez)"""
+    sections = []
+    current = []
+    in_code = False
+    for line in markdown.split('\n'):
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+        elif not in_code and line.startswith('#') and current:
+            sections.append('\n'.join(current))
+            current = []
+        current.append(line)
+    if current:
+        sections.append('\n'.join(current))
+    return sections
+
+
+def _split_oversized(text: str, max_chars: int, separators: tuple = ('\n\n', '\n')) -> List[str]:
+    """Bütçeyi aşan metni paragraf, satır ve son çare olarak karakter sınırından böler"""
+    if len(text) <= max_chars:
+        return [text]
+    if not separators:
+        return [text[start:start + max_chars] for start in range(0, len(text), max_chars)]
+
+    separator = separators[0]
+    pieces = []
+    current = None
+    for part in text.split(separator):
+        if current is not None and len(current) + len(separator) + len(part) <= max_chars:
+            current += separator + part
+            continue
+        if current is not None:
+            pieces.append(current)
+        current = part
+        if len(part) > max_chars:
+            pieces.extend(_split_oversized(part, max_chars, separators[1:]))
+            current = None
+    if current is not None:
+        pieces.append(current)
+    return pieces
+
+
+def _is_anchor(section: str) -> bool:
+    """Başlık satırının özetine göre bölümün parça başlatıp başlatmayacağı"""
+    heading = section.split('\n', 1)[0]
+    return heading.startswith('#') and zlib.crc32(heading.encode('utf-8')) % ANCHOR_MODULUS == 0
+
+
+def split_markdown_chunks(markdown: str, max_tokens: int = 1500) -> List[str]:
+    """Markdown'ı başlık sınırlarından, her biri max_tokens bütçesine sığan parçalara böler
+
+    Ardışık küçük bölümler aynı parçada birleştirilir; bütçeyi tek başına
+    aşan bölümler paragraf ve satır sınırlarından bölünür. Başlığının özeti
+    ANCHOR_MODULUS'a bölünen bölümler (parça bütçenin dörtte birini
+    geçmişse) yeni parça başlatır; böylece bir bölüm değiştiğinde sonraki
+    parça sınırları kaymaz ve önbellekteki yanıtlar kullanılmaya devam eder.
+    """
+    max_chars = max(1, max_tokens * CHARS_PER_TOKEN)
+    chunks = []
+    current = None
+    for section in _split_sections(markdown):
+        anchor = _is_anchor(section)
+        for piece in _split_oversized(section, max_chars):
+            if (current is not None and len(current) + 1 + len(piece) <= max_chars
+                    and not (anchor and len(current) >= max_chars // 4)):
+                current += '\n' + piece
+            else:
+                if current is not None:
+                    chunks.append(current)
+                current = piece
+    if current is not None:
+        chunks.append(current)
+    return chunks
+
+
+class AIChunkEnhancer:
+    """Markdown dokümanlarını parça parça, eşzamanlı olarak AI ile iyileştirir
+
+    Başarısız parçalar özgün halleriyle bırakılır ve failed_chunks içinde
+    sayılır; tüm parçalar başarısız olursa AIEnhancementError fırlatılır.
+    """
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None, model: str = DEFAULT_MODEL,
+                 max_workers: int = 4, max_chunk_tokens: int = 1500, max_retries: int = 3,
+                 backoff: float = 1.0, timeout: float = 60, session: Optional[requests.Session] = None,
+                 cache: Optional[ConversionCache] = None):
+        self.api_key = api_key
+        self.base_url = (base_url or os.environ.get('OPENAI_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')
+        self.model = model
+        self.max_workers = max(1, max_workers)
+        self.max_chunk_tokens = max_chunk_tokens
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        # Parça yanıtları için disk önbelleği (None = kapalı)
+        self.cache = cache
+        self.failed_chunks = 0
+        self.errors: List[str] = []
+        # Son enhance çağrısının önbellek istatistikleri
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._stats_lock = threading.Lock()
+
+        # Havuzdaki bağlantılar (keep-alive) tüm parçalar ve çağrılar arasında paylaşılır
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        })
+
+    def enhance(self, markdown: str, title: str,
+                progress: Optional[Callable[[int, int], None]] = None) -> str:
+        """Dokümanı parçalara bölüp eşzamanlı iyileştirir, sonuçları sırayla birleştirir
+
+        progress(tamamlanan, toplam) her parça bittiğinde çağrılır.
+        """
+        chunks = split_markdown_chunks(markdown, self.max_chunk_tokens)
+        if not chunks:
+            return markdown
+
+        self.failed_chunks = 0
+        self.errors = []
+        self.cache_hits = 0
+        self.cache_misses = 0
+        total = len(chunks)
+        done = [0]
+        lock = threading.Lock()
+        abort = threading.Event()
+        first_error = []
+
+        def fail(index: int, error: AIEnhancementError) -> str:
+            with lock:
+                self.failed_chunks += 1
+                self.errors.append(f"Parça {index + 1}: {error}")
+                if not first_error:
+                    first_error.append(error)
+            return chunks[index]
+
+        def run(index: int) -> str:
+            try:
+                if abort.is_set():
+                    with lock:
+                        self.failed_chunks += 1
+                    return chunks[index]
+                try:
+                    return self.enhance_chunk(chunks[index], title, index + 1, total)
+                except AIEnhancementError as e:
+                    if e.status in FATAL_STATUS:
+                        abort.set()
+                    return fail(index, e)
+            finally:
+                with lock:
+                    done[0] += 1
+                    completed = done[0]
+                if progress is not None:
+                    progress(completed, total)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, total),
+                                thread_name_prefix='ai-enhance') as executor:
+            results = list(executor.map(run, range(total)))
+
+        if self.failed_chunks == total:
+            raise first_error[0]
+        return '\n\n'.join(result.strip('\n') for result in results) + '\n'
+
+    def enhance_chunk(self, chunk: str, title: str, index: int = 1, total: int = 1) -> str:
+        """Tek parçayı iyileştirir (önbellekte yoksa API'ye gönderir)"""
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key('ai-chunk', PROMPT_VERSION, self.model, chunk)
+            cached = self.cache.get(key)
+            with self._stats_lock:
+                if cached is not None:
+                    self.cache_hits += 1
+                else:
+                    self.cache_misses += 1
+            if cached is not None:
+                return cached
+
+        content = self._request_chunk(chunk, title, index, total)
+        if key is not None:
+            self.cache.put(key, content)
+        return content
+
+    def _request_chunk(self, chunk: str, title: str, index: int, total: int) -> str:
+        """Parçayı API'ye gönderir (geçici hatalarda üstel bekleme ile yeniden dener)"""
+        payload = {
+            'model': self.model,
+            'messages': [
+                {'role': 'system', 'content': SYSTEM_PROMPT},
+                {'role': 'user', 'content': CHUNK_PROMPT.format(title=title, index=index, total=total,
+                                                                content=chunk)}
+            ],
+            'max_tokens': min(4096, estimate_tokens(chunk) * 2 + 256),
+            'temperature': 0.3
+        }
+        result = self._post('/chat/completions', payload)
+        try:
+            return result['choices'][0]['message']['content']
+        except (KeyError, IndexError, TypeError):
+            raise AIEnhancementError("Beklenmeyen API yanıtı")
+
+    def _post(self, path: str, payload: Dict) -> Dict:
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self._delay(attempt, last_error))
+            try:
+                response = self.session.post(self.base_url + path, json=payload, timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                last_error = e
+                continue
+
+            if response.status_code == 200:
+                try:
+                    return response.json()
+                except ValueError:
+                    raise AIEnhancementError("API yanıtı JSON değil")
+
+            message = f"API Hatası: {response.status_code}"
+            try:
+                body = response.json()
+            except ValueError:
+                body = None
+            # Hata gövdesi her sunucuda {'error': {'message': ...}} biçiminde olmayabilir
+            error = body.get('error') if isinstance(body, dict) else None
+            if isinstance(error, dict):
+                message += f" - {error.get('message', 'Bilinmeyen hata')}"
+            elif isinstance(error, str):
+                message += f" - {error}"
+            if response.status_code not in RETRY_STATUS:
+                raise AIEnhancementError(message, response.status_code)
+            last_error = response
+
+        if isinstance(last_error, requests.Response):
+            raise AIEnhancementError(f"API Hatası: {last_error.status_code} ({self.max_retries} yeniden deneme)",
+                                     last_error.status_code)
+        raise AIEnhancementError(f"Bağlantı hatası: {last_error}")
+
+    def _delay(self, attempt: int, last_error) -> float:
+        """Yeniden deneme beklemesi: Retry-After varsa ona, yoksa üstel beklemeye (jitter ile) göre"""
+        if isinstance(last_error, requests.Response):
+            retry_after = last_error.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return max(0.0, float(retry_after))
+                except ValueError:
+                    pass
+        return self.backoff * (2 ** (attempt - 1)) * (0.5 + random.random() / 2)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self) -> "AIChunkEnhancer":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
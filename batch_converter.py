@@ -0,0 +1,177 @@
+"""
+Toplu PDF dönüştürme
+Dizin, glob deseni veya stdin'den okunan dosya listesini tek süreçte,
+işçi havuzu ve dosya başına zaman aşımı ile dönüştürür; sonunda JSON özet üretir.
+"""
+
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+from concurrent.futures import as_completed
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+from worker_pool import WorkerPool, TaskTimeoutError, task_cancel_token
+
+
+def _glob_base(pattern: str) -> str:
+    """Glob deseninin joker içermeyen baş kısmı ('arsiv/**/*.pdf' -> 'arsiv')"""
+    parts = []
+    for part in pattern.replace(os.sep, '/').split('/'):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return '/'.join(parts) or '.'
+
+
+def expand_inputs(inputs: Iterable[str], stdin=None) -> List[Tuple[str, str]]:
+    """Girdileri (pdf_yolu, göreli_alt_dizin) çiftlerine açar
+
+    - Dizinler alt dizinleriyle birlikte taranır (*.pdf)
+    - Glob desenleri (*, ?, [) genişletilir
+    - '-' girdisi stdin'den satır satır dosya listesi okur
+    Göreli alt dizin, dizin ve glob girdilerinde (desenin joker içermeyen baş
+    kısmına göre) klasör yapısını çıktıda korumak içindir.
+    """
+    results = []
+    seen = set()
+
+    def add(path: str, subdir: str = ''):
+        key = os.path.abspath(path)
+        if key not in seen and path.lower().endswith('.pdf'):
+            seen.add(key)
+            results.append((path, subdir))
+
+    for item in inputs:
+        if item == '-':
+            for line in (stdin or sys.stdin):
+                line = line.strip()
+                if line:
+                    add(line)
+        elif os.path.isdir(item):
+            for path in sorted(glob.glob(os.path.join(glob.escape(item), '**', '*'), recursive=True)):
+                if os.path.isfile(path):
+                    add(path, os.path.relpath(os.path.dirname(path), item))
+        elif glob.has_magic(item):
+            base = _glob_base(item)
+            for path in sorted(glob.glob(item, recursive=True)):
+                if os.path.isfile(path):
+                    add(path, os.path.relpath(os.path.dirname(path), base))
+        else:
+            add(item)
+
+    return results
+
+
+def convert_file(pdf_path: str, output_dir: Optional[str], split_pages: bool = False,
+                 split_chapters: bool = False, shard_bytes: Optional[int] = None, incremental: bool = False, enhanced_format: bool = True,
+                 pages: Optional[List[int]] = None,
+                 cache_dir: Optional[str] = None, use_cache: bool = True,
+                 page_timeout: Optional[float] = None, table_engine: str = 'text',
+                 heading_engine: str = 'text', index_path: Optional[str] = None) -> Dict:
+    """İşçi görevi: tek PDF'yi dönüştürür; çıktı dosyalarını, süreyi ve atlanan sayfaları döndürür
+
+    Dosya zaman sınırı aşılırsa dönüşüm önce sayfalar arasında durdurulur (task_cancel_token).
+    """
+    from pdf_to_markdown import PDFToMarkdownConverter
+    from conversion_cache import ConversionCache
+    from text_index import TextIndex
+
+    start = time.perf_counter()
+    index = TextIndex(index_path) if index_path else None
+    converter = PDFToMarkdownConverter(cache=ConversionCache(cache_dir) if use_cache else None,
+                                       page_timeout=page_timeout, table_engine=table_engine,
+                                       heading_engine=heading_engine, index=index)
+    cancel_token = task_cancel_token()
+
+    # Dosya başına ilerleme çıktısı toplu özetle karışmasın
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if split_pages:
+                outputs = converter.convert_pdf_to_pages(pdf_path, output_dir=output_dir,
+                                                         incremental=incremental, pages=pages,
+                                                         cancel_token=cancel_token)
+            elif split_chapters:
+                outputs = converter.convert_pdf_to_chapters(pdf_path, output_dir=output_dir, pages=pages,
+                                                            cancel_token=cancel_token)
+            elif shard_bytes:
+                outputs = converter.convert_pdf_to_shards(pdf_path, output_dir=output_dir,
+                                                          max_shard_bytes=shard_bytes, pages=pages,
+                                                          cancel_token=cancel_token)
+            else:
+                outputs = [converter.convert_pdf_to_markdown(pdf_path, output_dir=output_dir,
+                                                             enhanced_format=enhanced_format, pages=pages,
+                                                             cancel_token=cancel_token)]
+    finally:
+        if index is not None:
+            index.close()
+
+    return {
+        'outputs': outputs,
+        'seconds': round(time.perf_counter() - start, 3),
+        'failed_pages': converter.failed_pages
+    }
+
+
+def _output_conflicts(files: List[Tuple[str, str]]) -> List[List[str]]:
+    """Aynı çıktı dizinine aynı adla yazılacak dosya grupları (ör. stdin'den a/x.pdf ve b/x.pdf)"""
+    groups = {}
+    for pdf_path, subdir in files:
+        # Tek dosya modunun başlık türetmesiyle aynı: my_file.pdf ve My-File.pdf ikisi de 'My File.md'
+        stem = os.path.splitext(os.path.basename(pdf_path))[0]
+        name = stem.replace('_', ' ').replace('-', ' ').title()
+        groups.setdefault(os.path.normcase(os.path.join(os.path.normpath(subdir), name)), []).append(pdf_path)
+    return [paths for paths in groups.values() if len(paths) > 1]
+
+
+def run_batch(files: List[Tuple[str, str]], output_dir: Optional[str] = None, workers: int = 1,
+              timeout: Optional[float] = None, log: Optional[TextIO] = None, **options) -> Dict:
+    """Dosyaları işçi havuzunda dönüştürür ve iş özetini döndürür
+
+    Dosya başına ilerleme satırları log akışına (varsayılan stdout) yazılır.
+    output_dir verilmişse çıktı adları çakışan girdiler ValueError ile reddedilir.
+    """
+    if output_dir:
+        conflicts = _output_conflicts(files)
+        if conflicts:
+            raise ValueError("Aynı çıktı adına yazılacak dosyalar: "
+                             + '; '.join(', '.join(paths) for paths in conflicts))
+    start = time.perf_counter()
+    results = []
+
+    with WorkerPool(workers) as pool:
+        futures = {}
+        for pdf_path, subdir in files:
+            target_dir = os.path.join(output_dir, subdir) if output_dir else None
+            future = pool.submit(convert_file, pdf_path, target_dir, timeout=timeout, **options)
+            futures[future] = pdf_path
+
+        for future in as_completed(futures):
+            pdf_path = futures[future]
+            entry = {'pdf': pdf_path}
+            try:
+                entry.update(status='ok', **future.result())
+                print(f"✅ {pdf_path} ({entry['seconds']} sn)", file=log)
+                if entry['failed_pages']:
+                    print(f"⏱️ {pdf_path}: {len(entry['failed_pages'])} sayfa zaman sınırını aştı ve atlandı", file=log)
+            except TaskTimeoutError:
+                entry.update(status='timeout', seconds=timeout, error=f"{timeout} sn zaman sınırı aşıldı")
+                print(f"⏱️ {pdf_path}: zaman aşımı", file=log)
+            except Exception as e:
+                entry.update(status='error', error=str(e))
+                print(f"❌ {pdf_path}: {e}", file=log)
+            results.append(entry)
+
+    # Özet girdi sırasını korusun
+    order = {pdf_path: index for index, (pdf_path, _) in enumerate(files)}
+    results.sort(key=lambda entry: order[entry['pdf']])
+
+    return {
+        'total': len(results),
+        'succeeded': sum(1 for entry in results if entry['status'] == 'ok'),
+        'failed': sum(1 for entry in results if entry['status'] != 'ok'),
+        'seconds': round(time.perf_counter() - start, 3),
+        'files': results
+    }
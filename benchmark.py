@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+PDF to Markdown Converter - Performans ölçümleri
+Kullanım: python benchmark.py [--mb 5] [--page-overhead 2000] [--pages 10,100] [--kinds text,table] [--output sonuc.json]
+Kayıt belleği: python benchmark.py --mb 0 --page-overhead 0 --pages "" --memory-pages 10000
+Karşılaştırma: python benchmark.py --compare onceki.json
+"""
+
+import argparse
+import contextlib
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+from create_test_pdf import CORPUS_KINDS, CORPUS_SIZES, create_benchmark_corpus
+from conversion_cache import ConversionCache
+from pdf_to_markdown import PDFToMarkdownConverter
+from line_engine import LineEngine, create_anchor
+from instrumentation import SummaryObserver
+from records import PageRecord, SummaryEntry, TocEntry
+from benchmark_baseline import BaselineConverter, render_page
+
+# instrumentation olaylarının aşama adları ('convert' tüm dönüşümü kapsadığı için dışarıda)
+STAGES = ('extract', 'images', 'clean', 'detect_headings', 'toc', 'format', 'write')
+MODES = ('markdown', 'pages')
+
+WORDS = (
+    "fatura kod tablo ülke kanal giriş sonuç belge ödeme müşteri satış iade "
+    "tevkifat gönderim işlem tarih tutar para birimi açıklama değer"
+).split()
+
+
+def generate_text(size_mb: float, seed: int = 42) -> str:
+    """Başlık, tablo, sayfa numarası ve paragraf satırlarından sentetik metin üretir"""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    lines = []
+    size = 0
+    while size < target:
+        kind = rng.random()
+        if kind < 0.05:
+            line = ' '.join(rng.choice(WORDS) for _ in range(3)).upper()
+        elif kind < 0.10:
+            line = f"{rng.randint(1, 20)}. " + ' '.join(rng.choice(WORDS) for _ in range(4)).capitalize()
+        elif kind < 0.15:
+            line = '\t\t\t'.join(rng.choice(WORDS) for _ in range(4))
+        elif kind < 0.18:
+            line = str(rng.randint(1, 999))
+        elif kind < 0.25:
+            line = '  '
+        else:
+            line = '  '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 16))) + '.'
+        lines.append(line)
+        size += len(line.encode('utf-8')) + 1
+    return '\n'.join(lines)
+
+
+def bench_text_pipeline(text: str, repeat: int = 3) -> dict:
+    """İlk sürümün aşamalı metin işlemesi (benchmark_baseline) ile güncel tek geçişli satır motoru"""
+    mb = len(text.encode('utf-8')) / (1024 * 1024)
+
+    def run_staged():
+        # İlk sürüm: her adım tüm belgeyi yeniden böler, tarar ve birleştirir
+        baseline = BaselineConverter()
+        return baseline.format_for_gitbook(baseline.detect_headings(baseline.clean_text(text)), 'Bench')
+
+    def run_fused():
+        # Güncel: tüm kurallar her satıra tek geçişte uygulanır
+        converter = PDFToMarkdownConverter()
+        body = LineEngine(converter.text_rules() + converter.gitbook_rules()).transform(text)
+        return converter.gitbook_header('Bench') + body
+
+    staged = run_staged()
+    fused = run_fused()
+    if staged != fused:
+        raise AssertionError("Birleşik çıktı ilk sürümden farklı!")
+    staged_time = _time_calls(lambda _: run_staged(), [None], repeat)
+    fused_time = _time_calls(lambda _: run_fused(), [None], repeat)
+
+    return {
+        'size_mb': round(mb, 2),
+        # clean_text, detect_headings, görüntü, kod bloğu ve tablo adımları
+        'staged_passes': 5,
+        'fused_passes': 1,
+        'staged_s_per_mb': round(staged_time / mb, 4),
+        'fused_s_per_mb': round(fused_time / mb, 4),
+        'speedup': round(staged_time / fused_time, 2),
+    }
+
+
+def _time_calls(func, items, repeat: int = 3) -> float:
+    """Öğeler üzerinde func çağrılarının en iyi toplam süresi"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_page_overhead(pages: int, seed: int = 42) -> dict:
+    """Sayfa başına sabit maliyet: ilk sürümün sayfa yolu (benchmark_baseline) ile güncel sayfa yolu
+
+    İlk sürüm her sayfa için yeni dönüştürücü oluşturur, metni üç ayrı
+    geçişte ad-hoc regex dizgeleriyle işler ve anchor'ları str.replace
+    döngüsüyle üretir; güncel yol _render_page'dir (tek dönüştürücü, tek geçiş).
+    """
+    text = generate_text(pages * 2 / 1024, seed)
+    lines = text.split('\n')
+    per_page = max(1, len(lines) // pages)
+    page_texts = ['\n'.join(lines[i:i + per_page]) for i in range(0, len(lines), per_page)][:pages]
+    page_records = [PageRecord(number, page_text) for number, page_text in enumerate(page_texts, 1)]
+
+    # Sayfalarda geçen başlıklar
+    toc = []
+    LineEngine(PDFToMarkdownConverter().text_rules(toc)).transform(text)
+    titles = [entry.title for entry in toc]
+    baseline_anchor = BaselineConverter().create_anchor
+    for title in titles:
+        if baseline_anchor(title) != create_anchor(title):
+            raise AssertionError(f"Anchor farklı: {title!r}")
+    replace_time = _time_calls(baseline_anchor, titles)
+    translate_time = _time_calls(create_anchor, titles)
+
+    converter = PDFToMarkdownConverter()
+
+    def baseline_page(page):
+        return render_page(page.text, f"Bench - Sayfa {page.page_num}")
+
+    def current_page(page):
+        return converter._render_page(page, f"Bench - Sayfa {page.page_num}")
+
+    if [baseline_page(page) for page in page_records] != [current_page(page) for page in page_records]:
+        raise AssertionError("Sayfa çıktıları ilk sürümden farklı!")
+    baseline_time = _time_calls(baseline_page, page_records)
+    current_time = _time_calls(current_page, page_records)
+
+    return {
+        'pages': len(page_records),
+        'headings': len(titles),
+        'unique_headings': len(set(titles)),
+        'anchor_replace_us': round(replace_time / len(titles) * 1e6, 3),
+        'anchor_translate_us': round(translate_time / len(titles) * 1e6, 3),
+        'page_baseline_us': round(baseline_time / len(page_records) * 1e6, 1),
+        'page_current_us': round(current_time / len(page_records) * 1e6, 1),
+        'page_speedup': round(baseline_time / current_time, 2),
+    }
+
+
+def _retained_bytes(build):
+    """build() sonucunun tuttuğu yeni bellek (tracemalloc); sonuç ile birlikte döner"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        return tracemalloc.get_traced_memory()[0] - before, result
+    finally:
+        tracemalloc.stop()
+
+
+def bench_record_memory(entry: Dict) -> dict:
+    """Sayfa, görüntü, TOC ve özet kayıtlarının __slots__ ve sözlük halindeki bellek kullanımı
+
+    Kayıtlar PDF'den bir kez çıkarılır; iki biçim aynı metin nesnelerini
+    paylaşır, fark yalnızca kayıt kaplarından gelir.
+    """
+    converter = PDFToMarkdownConverter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        pages = list(converter.iter_text_from_pdf(entry['path']))
+
+    toc = []
+    summary = []
+    for page in pages:
+        LineEngine(converter.text_rules(toc)).transform(page.text)
+        page_title = f"{entry['name']} - Sayfa {page.page_num}"
+        summary.append(SummaryEntry(f"sayfa-{page.page_num:02d}.md", page_title, page.page_num,
+                                    ConversionCache.make_key('page-md', page_title, page.text)))
+
+    result = {'pages': len(pages), 'images': sum(len(page.images) for page in pages),
+              'toc_entries': len(toc), 'summary_entries': len(summary)}
+    total_dict = total_slots = 0
+    for name, records, record_type in (('page', pages, PageRecord), ('toc', toc, TocEntry),
+                                       ('summary', summary, SummaryEntry)):
+        dict_bytes, dicts = _retained_bytes(lambda: [record.to_dict() for record in records])
+        slots_bytes, _ = _retained_bytes(lambda: [record_type.from_dict(data) for data in dicts])
+        total_dict += dict_bytes
+        total_slots += slots_bytes
+        result[f'{name}_dict_mb'] = round(dict_bytes / 1e6, 2)
+        result[f'{name}_slots_mb'] = round(slots_bytes / 1e6, 2)
+    result['dict_mb'] = round(total_dict / 1e6, 2)
+    result['slots_mb'] = round(total_slots / 1e6, 2)
+    result['reduction'] = round(1 - total_slots / total_dict, 3) if total_dict else 0.0
+    return result
+
+
+def stage_breakdown(pdf_path: str, output_dir: str, title: str, mode: str) -> Dict[str, float]:
+    """Gerçek dönüştürücüyü ölçüm gözlemcisiyle çalıştırıp aşama sürelerini toplar"""
+    summary = SummaryObserver()
+    converter = PDFToMarkdownConverter(observers=[summary])
+    if mode == 'markdown':
+        converter.convert_pdf_to_markdown(pdf_path, output_dir=output_dir, title=title)
+    else:
+        converter.convert_pdf_to_pages(pdf_path, output_dir=output_dir, title=title)
+    return {stage: summary.stages[stage]['elapsed'] if stage in summary.stages else 0.0 for stage in STAGES}
+
+
+def bench_corpus_file(entry: Dict, mode: str) -> Dict:
+    """Tek corpus dosyası için uçtan uca süre ve aşama dökümü"""
+    title = entry['name']
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        converter = PDFToMarkdownConverter()
+        start = time.perf_counter()
+        if mode == 'markdown':
+            converter.convert_pdf_to_markdown(entry['path'], output_dir=os.path.join(tmp, 'e2e'), title=title)
+        else:
+            converter.convert_pdf_to_pages(entry['path'], output_dir=os.path.join(tmp, 'e2e'), title=title)
+        total = time.perf_counter() - start
+
+        # Olay başına ölçüm maliyeti toplam süreye karışmasın diye aşamalar ayrı çalıştırmada ölçülür
+        stages = stage_breakdown(entry['path'], os.path.join(tmp, 'stages'), title, mode)
+
+    return {
+        'corpus': entry['name'],
+        'kind': entry['kind'],
+        'pages': entry['pages'],
+        'size_bytes': os.path.getsize(entry['path']),
+        'mode': mode,
+        'total_s': round(total, 4),
+        'pages_per_s': round(entry['pages'] / total, 2),
+        'stages_s': {stage: round(seconds, 4) for stage, seconds in stages.items()},
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    """Aynı corpus/mod çiftlerinin toplam sürelerini karşılaştırır, yavaşlayanları döndürür"""
+    old_runs = {(run['corpus'], run['mode']): run for run in baseline.get('runs', [])}
+    regressions = []
+    print(f"\n📈 Karşılaştırma ({baseline.get('commit')} → {current.get('commit')})")
+    for run in current['runs']:
+        old = old_runs.get((run['corpus'], run['mode']))
+        if old is None:
+            continue
+        ratio = run['total_s'] / old['total_s'] if old['total_s'] else float('inf')
+        flag = '⚠️' if ratio > threshold else '  '
+        print(f"{flag} {run['corpus']:<16} {run['mode']:<9} {old['total_s']:>9.3f} sn → {run['total_s']:>9.3f} sn  x{ratio:.2f}")
+        if ratio > threshold:
+            regressions.append(f"{run['corpus']}/{run['mode']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dönüştürücü performans ölçümleri')
+    parser.add_argument('--mb', type=float, default=5, help='Sentetik metin boyutu (MB), 0 ise atlanır')
+    parser.add_argument('--page-overhead', type=int, default=2000,
+                        help='Sayfa başına sabit maliyet ölçümündeki sayfa sayısı, 0 ise atlanır')
+    parser.add_argument('--memory-pages', type=int, default=0,
+                        help='Kayıt belleği ölçümündeki corpus sayfa sayısı (örn. 10000), 0 ise atlanır')
+    parser.add_argument('--pages', default=','.join(map(str, CORPUS_SIZES)),
+                        help='Corpus sayfa sayıları (virgülle ayrılmış)')
+    parser.add_argument('--kinds', default=','.join(CORPUS_KINDS),
+                        help='Corpus türleri: ' + ', '.join(CORPUS_KINDS))
+    parser.add_argument('--modes', default=','.join(MODES), help='Ölçülecek modlar: markdown, pages')
+    parser.add_argument('--corpus-dir', default='benchmark_corpus', help='Corpus PDF dizini')
+    parser.add_argument('--output', default='benchmark_results.json', help='Sonuç JSON dosyası')
+    parser.add_argument('--compare', default=None, help='Karşılaştırılacak önceki sonuç JSON dosyası')
+    parser.add_argument('--threshold', type=float, default=1.10,
+                        help='Bu oranın üzerindeki yavaşlama gerileme sayılır (varsayılan: 1.10)')
+    args = parser.parse_args()
+
+    results = {
+        'commit': _git_commit(),
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'runs': [],
+    }
+
+    if args.mb > 0:
+        result = bench_text_pipeline(generate_text(args.mb))
+        results['text_pipeline'] = result
+        print("⏱️ Metin işleme hattı")
+        for key, value in result.items():
+            print(f"  {key}: {value}")
+
+    if args.page_overhead > 0:
+        result = bench_page_overhead(args.page_overhead)
+        results['page_overhead'] = result
+        print("⏱️ Sayfa başına sabit maliyet")
+        for key, value in result.items():
+            print(f"  {key}: {value}")
+
+    if args.memory_pages > 0:
+        entry = create_benchmark_corpus(args.corpus_dir, [args.memory_pages], ['heading'])[0]
+        result = bench_record_memory(entry)
+        results['record_memory'] = result
+        print(f"💾 Kayıt belleği ({entry['name']})")
+        for key, value in result.items():
+            print(f"  {key}: {value}")
+
+    sizes = [int(size) for size in args.pages.split(',') if size]
+    kinds = [kind for kind in args.kinds.split(',') if kind]
+    modes = [mode for mode in args.modes.split(',') if mode]
+    corpus = create_benchmark_corpus(args.corpus_dir, sizes, kinds) if sizes and kinds else []
+
+    if corpus:
+        print(f"\n⏱️ PDF dönüştürme ({', '.join(STAGES)})")
+    for entry in corpus:
+        for mode in modes:
+            run = bench_corpus_file(entry, mode)
+            results['runs'].append(run)
+            stages = ' '.join(f"{stage}={seconds:.3f}" for stage, seconds in run['stages_s'].items())
+            print(f"  {run['corpus']:<16} {mode:<9} {run['total_s']:>9.3f} sn "
+                  f"({run['pages_per_s']} sayfa/sn)  {stages}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n📝 Sonuçlar kaydedildi: {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, results, args.threshold)
+        if regressions:
+            print(f"❌ Gerileme: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Performans karşılaştırmaları için ilk sürümün metin işleme kodu
+benchmark.py yeni satır motorunu ve sayfa yolunu bu dondurulmuş kopyayla
+karşılaştırır: aşamalı clean_text/detect_headings/format_for_gitbook, her
+çağrıda str.replace döngüsüyle anchor ve derlenmemiş regex dizgeleri.
+Ölçümlerin anlamlı kalması için bu dosya değiştirilmemelidir.
+"""
+
+import re
+
+
+class BaselineConverter:
+    """İlk sürümdeki PDFToMarkdownConverter'ın metin işleme metotları (değiştirilmeden)"""
+
+    def __init__(self):
+        self.current_chapter = 1
+        self.current_section = 1
+        self.toc_entries = []
+    
+    def clean_text(self, text: str) -> str:
+        """Metni temizler ve düzenler"""
+        # Gereksiz boşlukları temizle
+        text = re.sub(r'\n\s*\n', '\n\n', text)
+        text = re.sub(r' +', ' ', text)
+        
+        # Sayfa numaralarını kaldır (genellikle tek başına sayılar)
+        text = re.sub(r'^\d+$', '', text, flags=re.MULTILINE)
+        
+        return text.strip()
+    
+    def detect_headings(self, text: str) -> str:
+        """Başlıkları tespit eder ve Markdown formatına çevirir"""
+        lines = text.split('\n')
+        processed_lines = []
+        
+        for line in lines:
+            line = line.strip()
+            if not line:
+                processed_lines.append('')
+                continue
+            
+            # Büyük harflerle yazılmış satırlar (başlık olabilir)
+            if len(line) > 5 and line.isupper() and not line.isdigit():
+                processed_lines.append(f'## {line.title()}')
+                self.toc_entries.append({
+                    'level': 2,
+                    'title': line.title(),
+                    'anchor': self.create_anchor(line.title())
+                })
+            
+            # Sayı ile başlayan başlıklar
+            elif re.match(r'^\d+\.?\s+[A-ZÇĞIİÖŞÜ]', line):
+                processed_lines.append(f'### {line}')
+                self.toc_entries.append({
+                    'level': 3,
+                    'title': line,
+                    'anchor': self.create_anchor(line)
+                })
+            
+            # Büyük harfle başlayan ve sonunda noktalama işareti olmayan kısa satırlar
+            elif (len(line) < 100 and 
+                  line[0].isupper() and 
+                  not line.endswith('.') and 
+                  not line.endswith(',') and
+                  len(line.split()) <= 10):
+                processed_lines.append(f'#### {line}')
+                self.toc_entries.append({
+                    'level': 4,
+                    'title': line,
+                    'anchor': self.create_anchor(line)
+                })
+            
+            else:
+                processed_lines.append(line)
+        
+        return '\n'.join(processed_lines)
+    
+    def create_anchor(self, title: str) -> str:
+        """GitBook uyumlu anchor oluşturur"""
+        # Türkçe karakterleri dönüştür
+        tr_chars = {
+            'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
+            'Ç': 'C', 'Ğ': 'G', 'I': 'I', 'Ö': 'O', 'Ş': 'S', 'Ü': 'U'
+        }
+        
+        for tr_char, en_char in tr_chars.items():
+            title = title.replace(tr_char, en_char)
+        
+        # Özel karakterleri kaldır ve küçük harfe çevir
+        anchor = re.sub(r'[^a-zA-Z0-9\s-]', '', title)
+        anchor = re.sub(r'\s+', '-', anchor.strip().lower())
+        
+        return anchor
+    
+    def format_for_gitbook(self, content: str, title: str = "PDF Dönüştürülmüş Döküman") -> str:
+        """GitBook formatına uygun Markdown oluşturur"""
+        
+        # GitBook meta bilgileri
+        gitbook_header = f"""---
+title: {title}
+description: PDF'den dönüştürülmüş Markdown dökümanı
+---
+
+# {title}
+
+"""
+        
+        # İçindekiler tablosu oluştur
+        if self.toc_entries:
+            toc = "\n## İçindekiler\n\n"
+            for entry in self.toc_entries:
+                indent = "  " * (entry['level'] - 2)
+                toc += f"{indent}- [{entry['title']}](#{entry['anchor']})\n"
+            toc += "\n---\n\n"
+        else:
+            toc = ""
+        
+        # Görüntü referanslarını düzenle
+        content = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', r'![Alt text](\2)\n\n*Resim: \1*\n', content)
+        
+        # Kod bloklarını düzenle (eğer varsa)
+        content = self.format_code_blocks(content)
+        
+        # Tablolar için düzenleme
+        content = self.format_tables(content)
+        
+        return gitbook_header + toc + content
+    
+    def format_code_blocks(self, content: str) -> str:
+        """Kod bloklarını tespit eder ve formatlar"""
+        # Girinti ile kod bloğu gibi görünen kısımları tespit et
+        lines = content.split('\n')
+        processed_lines = []
+        in_code_block = False
+        
+        for line in lines:
+            # 4 veya daha fazla boşlukla başlayan satırlar
+            if line.startswith('    ') or line.startswith('\t'):
+                if not in_code_block:
+                    processed_lines.append('```')
+                    in_code_block = True
+                processed_lines.append(line.lstrip())
+            else:
+                if in_code_block:
+                    processed_lines.append('```\n')
+                    in_code_block = False
+                processed_lines.append(line)
+        
+        if in_code_block:
+            processed_lines.append('```')
+        
+        return '\n'.join(processed_lines)
+    
+    def format_tables(self, content: str) -> str:
+        """Tablo formatını düzenler"""
+        # Basit tablo tespiti ve düzenlemesi
+        lines = content.split('\n')
+        processed_lines = []
+        
+        for i, line in enumerate(lines):
+            # Birden fazla boşlukla ayrılmış kolonlar (tablo olabilir)
+            if re.search(r'\s{3,}', line) and len(line.split()) > 2:
+                # Tablo satırı olarak formatla
+                cells = re.split(r'\s{3,}', line.strip())
+                table_row = '| ' + ' | '.join(cells) + ' |'
+                processed_lines.append(table_row)
+                
+                # İlk satırsa header separator ekle
+                if i == 0 or not re.search(r'\s{3,}', lines[i-1]):
+                    separator = '| ' + ' | '.join(['---'] * len(cells)) + ' |'
+                    processed_lines.append(separator)
+            else:
+                processed_lines.append(line)
+        
+        return '\n'.join(processed_lines)
+
+
+def render_page(text: str, page_title: str) -> str:
+    """İlk sürümdeki sayfa bazlı yol: her sayfa için yeni dönüştürücü ve üç ayrı geçiş"""
+    # Sayfa için yeni converter instance (TOC temizlemek için)
+    page_converter = BaselineConverter()
+    
+    # Metni temizle ve formatla
+    cleaned_text = page_converter.clean_text(text)
+    formatted_text = page_converter.detect_headings(cleaned_text)
+    
+    # GitBook formatında oluştur
+    return page_converter.format_for_gitbook(formatted_text, page_title)
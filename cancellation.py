@@ -0,0 +1,31 @@
+"""
+İş birlikçi iptal
+CancellationToken dönüştürme metotlarına verilir ve sayfalar arasında
+kontrol edilir. Sayfa süresi sınırı (page_timeout) ayrı bir sayfa işçisi
+işlemde uygulanır; bkz. PDFToMarkdownConverter.
+"""
+
+import threading
+
+
+class ConversionCancelled(Exception):
+    """Dönüştürme CancellationToken ile iptal edildi"""
+
+
+class CancellationToken:
+    """Başka bir thread'den (event bir multiprocessing.Event ise başka işlemden) iptal edilebilen bayrak"""
+
+    def __init__(self, event=None):
+        self._event = event if event is not None else threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """İptal istendiyse ConversionCancelled fırlatır"""
+        if self._event.is_set():
+            raise ConversionCancelled("Dönüştürme iptal edildi")
@@ -0,0 +1,138 @@
+"""
+İçerik adresli dönüştürme önbelleği
+PDF içerik özeti, sayfa ve dönüştürücü seçeneklerinden türetilen anahtarlarla
+sayfa metinlerini ve sayfa Markdown çıktılarını diskte saklar.
+Boyut sınırı aşıldığında en uzun süredir kullanılmayan kayıtlar silinir (LRU).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Optional
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pdf_to_markdown')
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class ConversionCache:
+    """Boyut sınırlı, LRU tahliyeli disk önbelleği"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = None  # Toplam boyut, ilk yazmada hesaplanır
+
+    def __getstate__(self) -> Dict:
+        # İşçi işlemlerine giden her kopya dizini yeniden taramasın: boyut bir kez hesaplanıp taşınır
+        if self._size is None:
+            self._size = self.size()
+        return self.__dict__.copy()
+
+    @staticmethod
+    def file_digest(path: str) -> str:
+        """Dosya içeriğinin SHA-256 özeti"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Anahtar parçalarından (JSON uyumlu) sabit uzunlukta anahtar üretir"""
+        payload = json.dumps(parts, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def get(self, key: str) -> Optional[str]:
+        """Kayıt varsa döndürür ve son kullanım zamanını günceller"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                value = f.read()
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: str):
+        """Kaydı atomik olarak yazar, gerekirse eski kayıtları tahliye eder"""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                f.write(value)
+            # Aynı anahtarın üzerine yazılıyorsa eski kaydın boyutu toplamdan düşülür
+            try:
+                previous = os.path.getsize(path)
+            except OSError:
+                previous = 0
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += os.path.getsize(path) - previous
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _entries(self):
+        """(son kullanım, boyut, yol) üçlüleri"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for bucket in os.scandir(self.cache_dir):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def size(self) -> int:
+        """Önbellekteki toplam bayt"""
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """Boyut sınırının %90'ına inene kadar en eski kayıtları siler"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._size = total
+
+    def clear(self) -> int:
+        """Tüm kayıtları siler, silinen kayıt sayısını döndürür"""
+        removed = 0
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        self._size = 0
+        return removed
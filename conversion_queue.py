@@ -0,0 +1,270 @@
+"""
+Çok dosyalı dönüştürme kuyruğu
+GUI'ye eklenen PDF'ler WorkerPool işçi işlemlerinde eşzamanlı dönüştürülür;
+Tk ana thread'i yalnızca poll() ile işçilerden gelen olayları okur, bu yüzden
+yüzlerce sayfalık dosyalar dönüşürken arayüz donmaz. Kuyruktaki işler
+sıradan çıkarılarak iptal edilir; çalışan işler önce sayfalar arasında
+durdurulur (task_cancel_token), kısa sürede durmazsa işçisi sonlandırılır;
+başarısız veya iptal edilen işler yeniden denenebilir.
+"""
+
+import contextlib
+import io
+import itertools
+import multiprocessing
+import os
+import queue
+from concurrent.futures import CancelledError
+from typing import Dict, List, Optional
+
+from worker_pool import WorkerPool, TaskCancelledError, task_cancel_token
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+# İşçiden gelen sayfa ilerlemesi en fazla bu aralıkla gönderilir (saniye)
+PROGRESS_INTERVAL = 0.25
+
+# İşçi işlemindeki olay kuyruğu, önbellek dizini ve AI iyileştirici (_init_worker ile ayarlanır)
+_events = None
+_cache_dir = None
+_ai_enhancer = None
+
+
+def _init_worker(events, cache_dir: Optional[str]):
+    """İşçi başlangıcı: olay kuyruğunu saklar ve dönüştürme modüllerini yükler"""
+    global _events, _cache_dir
+    import pdf_to_markdown  # noqa: F401 - ilk işte yükleme gecikmesi olmasın
+
+    _events = events
+    _cache_dir = cache_dir
+
+
+def _post(task_id: int, kind: str, *payload):
+    _events.put((task_id, kind) + payload)
+
+
+def _enhance_output(task_id: int, output_path: str, title: str, api_key: str) -> List[str]:
+    """Çıktı dosyasını AI ile iyileştirir (hata olursa normal çıktı korunur), log mesajlarını döndürür"""
+    global _ai_enhancer
+    from ai_enhancer import AIChunkEnhancer, AIEnhancementError
+    from conversion_cache import ConversionCache
+
+    # Oturum (keep-alive bağlantılar) aynı anahtarla yapılan işler arasında paylaşılır
+    if _ai_enhancer is None or _ai_enhancer.api_key != api_key:
+        if _ai_enhancer is not None:
+            _ai_enhancer.close()
+        _ai_enhancer = AIChunkEnhancer(api_key, cache=ConversionCache(_cache_dir))
+    enhancer = _ai_enhancer
+
+    with open(output_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    try:
+        enhanced = enhancer.enhance(content, title, progress=lambda done, total: _post(task_id, 'ai', done, total))
+    except AIEnhancementError as e:
+        return [f"⚠️ AI iyileştirme hatası: {e} (normal format korundu)"]
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(enhanced)
+    messages = []
+    if enhancer.failed_chunks:
+        messages.append(f"⚠️ {enhancer.failed_chunks} parça iyileştirilemedi, özgün halleriyle bırakıldı")
+    messages.append(f"💾 AI önbelleği: {enhancer.cache_hits} isabet, {enhancer.cache_misses} ıska")
+    return messages
+
+
+def convert_job(task_id: int, pdf_path: str, output_dir: str, title: str, enhanced_format: bool = True,
+                pages: Optional[List[int]] = None, api_key: Optional[str] = None,
+                page_timeout: Optional[float] = None, table_engine: str = 'text',
+                heading_engine: str = 'text') -> Dict:
+    """İşçi görevi: PDF'yi tek Markdown dosyasına dönüştürür, istenirse AI ile iyileştirir
+
+    Log mesajları sonuçla birlikte döner (olay kuyruğu sonuçtan sonra
+    boşaltılabileceği için orada kaybolabilirler).
+    """
+    from pdf_to_markdown import PDFToMarkdownConverter, format_page_ranges
+    from conversion_cache import ConversionCache
+    from progress import ThrottledProgress
+
+    _post(task_id, 'start')
+    progress = ThrottledProgress(
+        lambda event: _post(task_id, 'progress', event['done'], event['total']),
+        interval=PROGRESS_INTERVAL
+    )
+    converter = PDFToMarkdownConverter(cache=ConversionCache(_cache_dir), progress=progress,
+                                       page_timeout=page_timeout, table_engine=table_engine,
+                                       heading_engine=heading_engine)
+
+    # Dönüştürücünün konsol çıktısı işçide gösterilmez
+    with contextlib.redirect_stdout(io.StringIO()):
+        output_path = converter.convert_pdf_to_markdown(pdf_path, output_dir=output_dir, title=title,
+                                                        enhanced_format=enhanced_format and not api_key,
+                                                        pages=pages, cancel_token=task_cancel_token())
+    messages = []
+    if converter.failed_pages:
+        numbers = format_page_ranges(entry['page_num'] for entry in converter.failed_pages)
+        messages.append(f"⏱️ {len(converter.failed_pages)} sayfa zaman sınırını aştı ve atlandı: {numbers}")
+    if api_key:
+        messages += _enhance_output(task_id, output_path, title, api_key)
+    return {'output': output_path, 'messages': messages}
+
+
+class ConversionJob:
+    """Kuyruktaki tek dönüştürme işi ve son durumu"""
+
+    def __init__(self, job_id: int, pdf_path: str, output_dir: str, title: str, options: Dict):
+        self.job_id = job_id
+        self.pdf_path = pdf_path
+        self.output_dir = output_dir
+        self.title = title
+        self.options = options
+        self.status = QUEUED
+        self.done = 0
+        self.total = 0
+        # 'pages' (sayfa dönüştürme) veya 'ai' (parça iyileştirme)
+        self.phase = 'pages'
+        self.output = None
+        self.error = None
+        # İşçinin bitişte döndürdüğü log mesajları
+        self.messages: List[str] = []
+        self.task_id = None
+        self.future = None
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.pdf_path)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+
+class ConversionQueue:
+    """İşleri sıcak işçi havuzunda eşzamanlı çalıştırır; durumu poll ile günceller
+
+    Tüm metotlar aynı (GUI) thread'inden çağrılmalıdır. İşçi sayısı
+    değiştirildiğinde havuz, çalışan iş kalmadığında yeniden kurulur.
+    """
+
+    def __init__(self, workers: int = 2, cache_dir: Optional[str] = None):
+        self.workers = max(1, workers)
+        self.cache_dir = cache_dir
+        self.jobs: Dict[int, ConversionJob] = {}
+        self._ctx = multiprocessing.get_context()
+        self._events = self._ctx.Queue()
+        self._pool = None
+        self._pool_size = 0
+        self._job_ids = itertools.count(1)
+        self._task_ids = itertools.count(1)
+        self._tasks: Dict[int, ConversionJob] = {}
+
+    def add(self, pdf_path: str, output_dir: str, title: str, **options) -> ConversionJob:
+        """İşi kuyruğa ekler ve gönderir (options: enhanced_format, pages, api_key, page_timeout, table_engine, heading_engine)"""
+        job = ConversionJob(next(self._job_ids), pdf_path, output_dir, title, options)
+        self._submit(job)
+        self.jobs[job.job_id] = job
+        return job
+
+    def _ensure_pool(self) -> WorkerPool:
+        if self._pool is not None and self._pool_size != self.workers and not self.active:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        if self._pool is None:
+            self._pool = WorkerPool(self.workers, initializer=_init_worker,
+                                    initargs=(self._events, self.cache_dir))
+            self._pool_size = self.workers
+        return self._pool
+
+    def _submit(self, job: ConversionJob):
+        pool = self._ensure_pool()
+        job.status = QUEUED
+        job.done = job.total = 0
+        job.phase = 'pages'
+        job.output = job.error = None
+        job.messages = []
+        job.task_id = next(self._task_ids)
+        self._tasks[job.task_id] = job
+        job.future = pool.submit(convert_job, job.task_id, job.pdf_path, job.output_dir, job.title,
+                                 **job.options)
+
+    def cancel(self, job: ConversionJob) -> bool:
+        """Bekleyen veya çalışan işi iptal eder"""
+        if job.finished or job.future is None:
+            return False
+        if job.future.cancel():
+            self._finish(job, CANCELLED)
+            return True
+        return self._pool.cancel(job.future)
+
+    def retry(self, job: ConversionJob) -> bool:
+        """Başarısız veya iptal edilmiş işi yeniden kuyruğa ekler"""
+        if job.status not in (FAILED, CANCELLED):
+            return False
+        self._submit(job)
+        return True
+
+    def remove_finished(self) -> List[ConversionJob]:
+        """Bitmiş işleri listeden çıkarır"""
+        removed = [job for job in self.jobs.values() if job.finished]
+        for job in removed:
+            del self.jobs[job.job_id]
+        return removed
+
+    @property
+    def active(self) -> List[ConversionJob]:
+        return [job for job in self.jobs.values() if not job.finished]
+
+    def _finish(self, job: ConversionJob, status: str, output: Optional[str] = None,
+                error: Optional[str] = None):
+        job.status = status
+        job.output = output
+        job.error = error
+        self._tasks.pop(job.task_id, None)
+
+    def poll(self) -> List[ConversionJob]:
+        """İşçi olaylarını ve biten görevleri işler; durumu değişen işleri döndürür"""
+        changed = {}
+        while True:
+            try:
+                task_id, kind, *payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            job = self._tasks.get(task_id)
+            if job is None:
+                continue  # İptal edilmiş veya yeniden denenmiş eski görev
+            if kind == 'start':
+                job.status = RUNNING
+            elif kind in ('progress', 'ai'):
+                job.phase = 'pages' if kind == 'progress' else 'ai'
+                job.done, job.total = payload
+            changed[job.job_id] = job
+
+        for job in list(self._tasks.values()):
+            if not job.future.done():
+                continue
+            try:
+                result = job.future.result()
+                job.messages = result['messages']
+                self._finish(job, DONE, output=result['output'])
+            except (CancelledError, TaskCancelledError):
+                self._finish(job, CANCELLED)
+            except Exception as e:
+                self._finish(job, FAILED, error=str(e))
+            changed[job.job_id] = job
+
+        if self._pool is not None and self._pool_size != self.workers and not self.active:
+            self._ensure_pool()
+        return list(changed.values())
+
+    def shutdown(self):
+        """Bekleyen işleri iptal eder ve havuzu kapatır (çalışan işçiler sonlandırılır)"""
+        if self._pool is not None:
+            for job in self.active:
+                self._pool.cancel(job.future)
+            self._pool.shutdown(wait=False, cancel_pending=True)
+            self._pool = None
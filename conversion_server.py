@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Yerel HTTP dönüştürme servisi
+Önceden başlatılmış (pdfplumber yüklenmiş) işçi işlemleri, her biri kendi
+PDFToMarkdownConverter örneğiyle, yüklenen PDF'leri dönüştürür.
+
+Kullanım: python conversion_server.py [--port 8765] [--workers 2] [--max-queue 8] [--timeout 120]
+
+Uç noktalar:
+    POST /convert?format=markdown|pages&title=...&pages=1-5&enhanced=0&timeout=SN
+        Gövde: ham PDF (application/pdf) veya multipart/form-data 'file' alanı.
+        markdown: text/markdown yanıtı; pages: {başlık}_pages klasörünün zip'i.
+        Yanıtlar akıtılmaz: dönüşüm bitince tamamı Content-Length ile gönderilir
+        (içindekiler belgenin başında olduğundan tüm başlıklar gerekir).
+    GET /health
+        İşçi, kuyruk ve çalışan istek sayıları (JSON).
+"""
+
+import argparse
+import contextlib
+import email.parser
+import email.policy
+import io
+import json
+import os
+import tempfile
+import threading
+import zipfile
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlsplit
+
+from pdf_to_markdown import parse_page_ranges
+from worker_pool import WorkerPool, TaskTimeoutError, WorkerCrashedError, task_cancel_token
+
+DEFAULT_PORT = 8765
+DEFAULT_MAX_UPLOAD_MB = 200
+
+# İşçi işlemindeki sıcak dönüştürücü (_init_worker ile oluşturulur)
+_converter = None
+
+
+def _init_worker(cache_dir: Optional[str], use_cache: bool):
+    """İşçi başlangıcı: modülleri yükler ve dönüştürücüyü hazırlar"""
+    global _converter
+    from pdf_to_markdown import PDFToMarkdownConverter
+    from conversion_cache import ConversionCache
+
+    _converter = PDFToMarkdownConverter(cache=ConversionCache(cache_dir) if use_cache else None)
+
+
+def _convert_markdown_task(data: bytes, title: Optional[str], pages: Optional[list],
+                           enhanced_format: bool) -> bytes:
+    """İşçi görevi: PDF baytlarını UTF-8 Markdown baytlarına çevirir
+
+    İstek zaman sınırı aşılırsa dönüşüm sayfalar arasında durur (task_cancel_token).
+    """
+    output = io.BytesIO()
+    with contextlib.redirect_stdout(io.StringIO()):
+        _converter.convert_pdf_to_markdown(data, title=title, enhanced_format=enhanced_format,
+                                           pages=pages, output=output, cancel_token=task_cancel_token())
+    return output.getvalue()
+
+
+def _convert_pages_task(data: bytes, title: Optional[str], pages: Optional[list]) -> bytes:
+    """İşçi görevi: sayfa klasörünü geçici dizinde oluşturur ve zip baytlarını döndürür"""
+    with tempfile.TemporaryDirectory(prefix='pdf2md-') as work_dir:
+        with contextlib.redirect_stdout(io.StringIO()):
+            _converter.convert_pdf_to_pages(data, output_dir=work_dir, title=title, pages=pages,
+                                            cancel_token=task_cancel_token())
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for root, _, files in os.walk(work_dir):
+                for filename in sorted(files):
+                    if filename.startswith('.'):
+                        continue  # manifest
+                    path = os.path.join(root, filename)
+                    archive.write(path, os.path.relpath(path, work_dir))
+        return buffer.getvalue()
+
+
+class RequestError(Exception):
+    """İstemciye HTTP durum koduyla dönülecek hata"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ConversionHTTPServer(ThreadingHTTPServer):
+    """İşçi havuzunu ve eşzamanlılık sınırlarını taşıyan HTTP sunucusu
+
+    Aynı anda en fazla workers + max_queue dönüşüm kabul edilir (workers
+    kadarı çalışır, kalanı kuyrukta bekler); fazlası 503 ile reddedilir.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], workers: int = 2, max_queue: int = 8,
+                 timeout: Optional[float] = 120, max_upload_bytes: int = DEFAULT_MAX_UPLOAD_MB * 1024 * 1024,
+                 cache_dir: Optional[str] = None, use_cache: bool = True):
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+        self.max_upload_bytes = max_upload_bytes
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_queue)
+        self._lock = threading.Lock()
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        super().__init__(address, ConversionRequestHandler)
+        # Port açıldıktan sonra işçiler başlatılır
+        self.pool = WorkerPool(self.workers, initializer=_init_worker, initargs=(cache_dir, use_cache))
+
+    def run_task(self, func, *args, timeout: Optional[float] = None):
+        """Görevi havuzda çalıştırır; kapasite doluysa RequestError(503) fırlatır"""
+        if not self._slots.acquire(blocking=False):
+            raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "Sunucu meşgul, daha sonra tekrar deneyin")
+        with self._lock:
+            self.active += 1
+        try:
+            result = self.pool.submit(func, *args, timeout=timeout).result()
+        except BaseException:
+            with self._lock:
+                self.failed += 1
+            raise
+        else:
+            with self._lock:
+                self.completed += 1
+            return result
+        finally:
+            with self._lock:
+                self.active -= 1
+            self._slots.release()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'status': 'ok',
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'active': self.active,
+                'queued': self.pool.queued,
+                'completed': self.completed,
+                'failed': self.failed,
+            }
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=True, cancel_pending=True)
+
+
+class ConversionRequestHandler(BaseHTTPRequestHandler):
+    """/convert ve /health isteklerini işler"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'PDFToMarkdown/2.0'
+    server: ConversionHTTPServer
+
+    def do_GET(self):
+        if urlsplit(self.path).path != '/health':
+            self._send_error(HTTPStatus.NOT_FOUND, "Bulunamadı")
+            return
+        self._send_json(HTTPStatus.OK, self.server.stats())
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != '/convert':
+            self._send_error(HTTPStatus.NOT_FOUND, "Bulunamadı")
+            return
+
+        try:
+            try:
+                options = self._parse_options(parse_qs(url.query))
+            except RequestError:
+                # Gövde okunmadan yanıt veriliyor; bağlantı yeniden kullanılamaz
+                self.close_connection = True
+                raise
+            data = self._read_upload()
+            if options['format'] == 'pages':
+                body = self.server.run_task(_convert_pages_task, data, options['title'], options['pages'],
+                                            timeout=options['timeout'])
+                content_type, extension = 'application/zip', '_pages.zip'
+            else:
+                body = self.server.run_task(_convert_markdown_task, data, options['title'], options['pages'],
+                                            options['enhanced'], timeout=options['timeout'])
+                content_type, extension = 'text/markdown; charset=utf-8', '.md'
+        except RequestError as e:
+            self._send_error(e.status, str(e))
+            return
+        except TaskTimeoutError:
+            self._send_error(HTTPStatus.GATEWAY_TIMEOUT, "Dönüştürme zaman sınırını aştı")
+            return
+        except WorkerCrashedError as e:
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+            return
+        except Exception as e:
+            # pdfminer/pdfplumber okuma hataları: büyük olasılıkla geçersiz PDF
+            self._send_error(HTTPStatus.UNPROCESSABLE_ENTITY, f"PDF dönüştürülemedi: {e}")
+            return
+
+        # Gövde işçide tamamen oluşturulur; hata durumları başlıklardan önce bilinir
+        filename = (options['title'] or 'belge') + extension
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Content-Disposition', f"attachment; filename*=UTF-8''{quote(filename)}")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _parse_options(self, query: Dict) -> Dict:
+        def value(name: str, default: Optional[str] = None) -> Optional[str]:
+            return query.get(name, [default])[0]
+
+        output_format = value('format', 'markdown')
+        if output_format not in ('markdown', 'pages'):
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Geçersiz format: {output_format}")
+
+        title = value('title')
+        if title is not None and (not title.strip() or os.path.basename(title) != title or title in ('.', '..')):
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Geçersiz başlık: {title}")
+
+        try:
+            pages = parse_page_ranges(value('pages')) if value('pages') else None
+        except ValueError as e:
+            raise RequestError(HTTPStatus.BAD_REQUEST, str(e))
+
+        # İstek zaman sınırı sunucu sınırını aşamaz
+        timeout = self.server.timeout
+        if value('timeout'):
+            try:
+                requested = float(value('timeout'))
+            except ValueError:
+                raise RequestError(HTTPStatus.BAD_REQUEST, f"Geçersiz timeout: {value('timeout')}")
+            if requested <= 0:
+                raise RequestError(HTTPStatus.BAD_REQUEST, f"Geçersiz timeout: {value('timeout')}")
+            timeout = requested if timeout is None else min(timeout, requested)
+
+        return {
+            'format': output_format,
+            'title': title,
+            'pages': pages,
+            'enhanced': value('enhanced', '1') not in ('0', 'false', 'no'),
+            'timeout': timeout,
+        }
+
+    def _read_upload(self) -> bytes:
+        """İstek gövdesinden PDF baytlarını okur (ham veya multipart/form-data)"""
+        length = self.headers.get('Content-Length')
+        if length is None:
+            raise RequestError(HTTPStatus.LENGTH_REQUIRED, "Content-Length gerekli")
+        try:
+            length = int(length)
+        except ValueError:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Geçersiz Content-Length")
+        if length > self.server.max_upload_bytes:
+            # Gövde okunmadığı için bağlantı yeniden kullanılamaz
+            self.close_connection = True
+            raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                               f"Yükleme sınırı {self.server.max_upload_bytes} bayt")
+
+        data = self.rfile.read(length)
+        content_type = self.headers.get('Content-Type', '')
+        if content_type.startswith('multipart/form-data'):
+            data = self._multipart_file(content_type, data)
+
+        if not data.startswith(b'%PDF'):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Gövde bir PDF dosyası değil")
+        return data
+
+    @staticmethod
+    def _multipart_file(content_type: str, data: bytes) -> bytes:
+        """multipart gövdesindeki 'file' alanını (yoksa ilk dosya alanını) döndürür"""
+        header = f"Content-Type: {content_type}\r\n\r\n".encode('latin-1')
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(header + data)
+        if not message.is_multipart():
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Geçersiz multipart gövdesi")
+
+        fallback = None
+        for part in message.iter_parts():
+            if part.get_param('name', header='content-disposition') == 'file':
+                return part.get_payload(decode=True) or b''
+            if fallback is None and part.get_filename():
+                fallback = part
+        if fallback is None:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "multipart gövdesinde dosya alanı yok")
+        return fallback.get_payload(decode=True) or b''
+
+    def _send_json(self, status: HTTPStatus, payload: Dict):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            self.send_header('Retry-After', '5')
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str):
+        self._send_json(status, {'error': message, 'status': int(status)})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PDF to Markdown HTTP dönüştürme servisi')
+    parser.add_argument('--host', default='127.0.0.1', help='Dinlenecek adres (varsayılan: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port (varsayılan: {DEFAULT_PORT})')
+    parser.add_argument('-w', '--workers', type=int, default=2, help='Sıcak işçi işlem sayısı (varsayılan: 2)')
+    parser.add_argument('--max-queue', type=int, default=8,
+                        help='İşçiler doluyken kuyrukta bekleyebilecek istek sayısı (varsayılan: 8)')
+    parser.add_argument('--timeout', type=float, default=120,
+                        help='İstek başına dönüştürme zaman sınırı, saniye (varsayılan: 120, 0 = sınırsız)')
+    parser.add_argument('--max-upload-mb', type=float, default=DEFAULT_MAX_UPLOAD_MB,
+                        help=f'En büyük PDF boyutu, MB (varsayılan: {DEFAULT_MAX_UPLOAD_MB})')
+    parser.add_argument('--no-cache', action='store_true', help='Dönüştürme önbelleğini kullanma')
+    parser.add_argument('--cache-dir', default=None, help='Önbellek dizini (varsayılan: ~/.cache/pdf_to_markdown)')
+    args = parser.parse_args()
+
+    server = ConversionHTTPServer(
+        (args.host, args.port),
+        workers=args.workers,
+        max_queue=args.max_queue,
+        timeout=args.timeout or None,
+        max_upload_bytes=int(args.max_upload_mb * 1024 * 1024),
+        cache_dir=args.cache_dir,
+        use_cache=not args.no_cache
+    )
+    host, port = server.server_address[:2]
+    print(f"🚀 Dönüştürme servisi http://{host}:{port} adresinde ({server.workers} işçi, kuyruk {server.max_queue})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Servis durduruluyor...")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 """
 Test PDF dosyası oluşturucu
-Bu script test amaçlı basit bir PDF dosyası oluşturur
+Bu script test amaçlı basit bir PDF dosyası oluşturur.
+create_corpus_pdf / create_benchmark_corpus performans ölçümleri için
+istenen sayfa sayısında metin, tablo, başlık veya Türkçe ağırlıklı PDF üretir.
 """
 
 from reportlab.pdfgen import canvas
@@ -9,6 +11,8 @@ from reportlab.lib.colors import black, blue, red
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import os
+import random
+import reportlab
 
 def create_test_pdf():
     """Test PDF dosyası oluştur"""
@@ -86,6 +90,148 @@ def create_test_pdf():
     print(f"✅ Test PDF oluşturuldu: {filename}")
     return filename
 
+CORPUS_KINDS = ('text', 'table', 'heading', 'turkish')
+CORPUS_SIZES = (10, 100, 1000, 5000)
+
+LATIN_WORDS = (
+    "invoice code table country channel input result document payment customer "
+    "sales refund withholding delivery process date amount currency description value"
+).split()
+
+TURKISH_WORDS = (
+    "ığdır şeker güzel çağrı öğrenci ödeme İstanbul ağaç üçgen şoför çiçek "
+    "değişken ığrıp görüşme işlem düğüm kırılım çözüm ölçüm Şubat Ağustos"
+).split()
+
+
+def _register_unicode_font() -> tuple:
+    """Türkçe karakterleri içeren (reportlab ile gelen) Vera fontunu kaydeder"""
+    font_dir = os.path.join(os.path.dirname(reportlab.__file__), 'fonts')
+    pdfmetrics.registerFont(TTFont('Vera', os.path.join(font_dir, 'Vera.ttf')))
+    pdfmetrics.registerFont(TTFont('VeraBd', os.path.join(font_dir, 'VeraBd.ttf')))
+    return 'Vera', 'VeraBd'
+
+
+def _sentence(rng: random.Random, words: list, count: int, capital: bool = False) -> str:
+    text = ' '.join(rng.choice(words) for _ in range(count))
+    # str.capitalize geri kalanı küçülttüğü için İ -> i̇ olur; yalnızca ilk harf büyütülür
+    return text[:1].upper() + text[1:] if capital else text
+
+
+def _draw_text_page(c, rng, words, font, bold, width, height):
+    """Paragraf ağırlıklı sayfa"""
+    y = height - 60
+    c.setFont(bold, 14)
+    c.drawString(50, y, _sentence(rng, words, 3, capital=True))
+    y -= 30
+    c.setFont(font, 10)
+    while y > 60:
+        for _ in range(rng.randint(3, 8)):
+            if y <= 60:
+                break
+            c.drawString(50, y, _sentence(rng, words, rng.randint(8, 14), capital=True) + '.')
+            y -= 14
+        y -= 10
+
+
+def _draw_table_page(c, rng, words, font, bold, width, height):
+    """Çizgili tablolar ve geniş boşluklu kolonlar içeren sayfa"""
+    y = height - 60
+    while y > 160:
+        rows, cols = rng.randint(4, 8), rng.randint(3, 5)
+        col_width = (width - 100) / cols
+        c.setFont(bold, 12)
+        c.drawString(50, y, f"Table {rng.randint(1, 99)}")
+        y -= 10
+        top = y
+        for row in range(rows):
+            c.setFont(bold if row == 0 else font, 9)
+            for col in range(cols):
+                cell = _sentence(rng, words, 1) if row == 0 else f"{rng.randint(1, 99999) / 100:.2f}"
+                c.drawString(54 + col * col_width, y - 13, cell)
+            y -= 18
+            if y < 80:
+                break
+        # Izgara çizgileri (pdfplumber find_tables için)
+        for line_y in range(int(top), int(y) - 1, -18):
+            c.line(50, line_y, width - 50, line_y)
+        c.line(50, y, width - 50, y)
+        for col in range(cols + 1):
+            c.line(50 + col * col_width, top, 50 + col * col_width, y)
+        y -= 30
+
+
+def _draw_heading_page(c, rng, words, font, bold, width, height):
+    """Büyük harfli, numaralı ve kısa başlıkların yoğun olduğu sayfa"""
+    y = height - 60
+    section = rng.randint(1, 20)
+    while y > 80:
+        kind = rng.random()
+        if kind < 0.25:
+            c.setFont(bold, 16)
+            c.drawString(50, y, _sentence(rng, words, 3).upper())
+            y -= 26
+        elif kind < 0.5:
+            c.setFont(bold, 13)
+            c.drawString(50, y, f"{section}. {_sentence(rng, words, 3, capital=True)}")
+            section += 1
+            y -= 22
+        elif kind < 0.7:
+            c.setFont(bold, 11)
+            c.drawString(50, y, _sentence(rng, words, 2, capital=True))
+            y -= 18
+        else:
+            c.setFont(font, 10)
+            c.drawString(50, y, _sentence(rng, words, rng.randint(8, 14), capital=True) + '.')
+            y -= 14
+
+
+def create_corpus_pdf(filename: str, pages: int, kind: str = 'text', seed: int = 42) -> str:
+    """Belirtilen türde ve sayfa sayısında sentetik PDF oluştur"""
+    if kind not in CORPUS_KINDS:
+        raise ValueError(f"Bilinmeyen corpus türü: {kind}")
+
+    rng = random.Random(f"{kind}-{pages}-{seed}")
+    if kind == 'turkish':
+        font, bold = _register_unicode_font()
+        words = TURKISH_WORDS
+    else:
+        font, bold = 'Helvetica', 'Helvetica-Bold'
+        words = LATIN_WORDS
+
+    draw_page = {
+        'text': _draw_text_page,
+        'table': _draw_table_page,
+        'heading': _draw_heading_page,
+        'turkish': _draw_text_page,
+    }[kind]
+
+    c = canvas.Canvas(filename, pagesize=letter)
+    width, height = letter
+    for page_num in range(1, pages + 1):
+        draw_page(c, rng, words, font, bold, width, height)
+        # Sayfa numarası (clean_text tarafından atılır)
+        c.setFont(font, 9)
+        c.drawString(width / 2, 30, str(page_num))
+        c.showPage()
+
+    c.save()
+    return filename
+
+
+def create_benchmark_corpus(output_dir: str, sizes=CORPUS_SIZES, kinds=CORPUS_KINDS) -> list:
+    """Ölçüm corpus'unu oluşturur; var olan dosyalar yeniden üretilmez"""
+    os.makedirs(output_dir, exist_ok=True)
+    corpus = []
+    for kind in kinds:
+        for pages in sizes:
+            filename = os.path.join(output_dir, f"{kind}_{pages}.pdf")
+            if not os.path.exists(filename):
+                create_corpus_pdf(filename, pages, kind)
+                print(f"✅ Corpus PDF oluşturuldu: {filename}")
+            corpus.append({'name': f"{kind}_{pages}", 'kind': kind, 'pages': pages, 'path': filename})
+    return corpus
+
 if __name__ == "__main__":
     try:
         create_test_pdf()
@@ -0,0 +1,169 @@
+"""
+Yazı tipi boyutuna dayalı başlık tespiti
+Her sayfanın metin haritası (extract_text ile paylaşılan, önbelleğe alınmış
+TextMap) tek geçişte dolaşılır; satır başına ortalama yazı tipi boyutu ve
+kalınlık, sayfa başına da karakter sayısıyla ağırlıklı boyut histogramı
+çıkarılır. Gövde metni boyutu belgenin ilk sayfalarından bir kez hesaplanır;
+satırın bu boyuta oranı başlık seviyesini (##, ###, ####) belirler.
+"""
+
+import itertools
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from line_engine import LineRule
+from records import TocEntry
+
+HEADING_ENGINES = ('text', 'font')
+
+# Gövde metni boyutunun hesaplandığı ilk sayfa sayısı
+FONT_SAMPLE_PAGES = 10
+# Bundan uzun satırlar başlık sayılmaz (ölçüleri de saklanmaz)
+HEADING_MAX_CHARS = 120
+HEADING_MAX_WORDS = 15
+# (gövde boyutuna oran, seviye): büyükten küçüğe
+LEVEL_RATIOS = ((1.6, 2), (1.3, 3), (1.1, 4))
+# Tamamı kalın, gövde boyutundaki kısa satırlar bu seviyede başlık olur
+BOLD_LEVEL = 4
+BOLD_FONT_RE = re.compile(r'bold|black|heavy|demi|semibold', re.IGNORECASE)
+
+
+def _line_key(text: str) -> str:
+    """Satır eşleştirme anahtarı (CleanupRule gibi boşlukları sadeleştirir)"""
+    return ' '.join(text.split())
+
+
+def page_font_metrics(page) -> Dict:
+    """Sayfanın boyut histogramını ve kısa satırlarının ölçülerini tek geçişte çıkarır
+
+    {'sizes': [[boyut, karakter_sayısı], ...], 'lines': [[metin, boyut, kalın], ...]}
+    döner; boyutlar 0.1 pt'ye yuvarlanır, 'lines' yalnızca başlık olabilecek
+    uzunluktaki satırları içerir. Metin haritası extract_text ile aynı
+    parametrelerle alındığından yeniden hesaplanmaz.
+    """
+    sizes: Dict[float, int] = {}
+    lines = []
+    bold_fonts: Dict[str, bool] = {}
+    text: List[str] = []
+    size_sum = 0.0
+    count = 0
+    bold = 0
+
+    def flush():
+        if count:
+            line = _line_key(''.join(text))
+            if line and len(line) <= HEADING_MAX_CHARS:
+                lines.append([line, round(size_sum / count, 1), bold == count])
+
+    for char, obj in page.get_textmap().tuples:
+        if obj is None:
+            if char == '\n':
+                flush()
+                text, size_sum, count, bold = [], 0.0, 0, 0
+            else:
+                text.append(char)
+            continue
+        text.append(char)
+        size = round(obj['size'], 1)
+        sizes[size] = sizes.get(size, 0) + 1
+        size_sum += size
+        count += 1
+        fontname = obj['fontname']
+        is_bold = bold_fonts.get(fontname)
+        if is_bold is None:
+            is_bold = bold_fonts[fontname] = bool(BOLD_FONT_RE.search(fontname))
+        bold += is_bold
+    flush()
+
+    return {'sizes': sorted([size, n] for size, n in sizes.items()), 'lines': lines}
+
+
+def body_font_size(metrics: Iterable[Optional[Dict]]) -> Optional[float]:
+    """Sayfa ölçülerinden gövde metni boyutu (en çok karakterin kullandığı boyut)"""
+    totals: Dict[float, int] = {}
+    for page in metrics:
+        for size, n in (page or {}).get('sizes', ()):
+            totals[size] = totals.get(size, 0) + n
+    if not totals:
+        return None
+    return max(totals.items(), key=lambda item: (item[1], -item[0]))[0]
+
+
+def sample_body_size(records: Iterable[Dict], sample_pages: int = FONT_SAMPLE_PAGES
+                     ) -> Tuple[Optional[float], Iterator[Dict]]:
+    """İlk sample_pages sayfa kaydından gövde boyutunu hesaplar
+
+    (boyut, kayıtları baştan üreten yineleyici) döner; örnek kayıtlar
+    bellekte bekletilir, kaynak yineleyici yeniden başlatılmaz.
+    """
+    records = iter(records)
+    sample = list(itertools.islice(records, sample_pages))
+    return body_font_size(record.get('fonts') for record in sample), itertools.chain(sample, records)
+
+
+def heading_level(text: str, size: float, bold: bool, body_size: Optional[float]) -> Optional[int]:
+    """Satırın başlık seviyesi (2-4) veya başlık değilse None"""
+    if not body_size or len(text.split()) > HEADING_MAX_WORDS or text.isdigit():
+        return None
+    ratio = size / body_size
+    for threshold, level in LEVEL_RATIOS:
+        if ratio >= threshold:
+            return level
+    if bold and ratio >= 0.95 and not text.endswith(('.', ',', ';', ':')):
+        return BOLD_LEVEL
+    return None
+
+
+class FontHeadingRule(LineRule):
+    """detect_headings kuralının yazı tipi sürümü
+
+    Satır seviyeleri set_page ile verilen sayfa ölçülerinden hesaplanır.
+    CleanupRule bir satırı bir sonraki içerik satırına kadar beklettiği için
+    önceki sayfanın seviyeleri de tutulur. Bulunan başlıklar HeadingRule
+    ile aynı biçimde toc_entries listesine eklenir.
+    """
+
+    stage = 'detect_headings'
+
+    def __init__(self, toc_entries: List[Dict], create_anchor: Callable[[str], str],
+                 body_size: Optional[float] = None, table_rows: bool = False):
+        self.toc_entries = toc_entries
+        self.create_anchor = create_anchor
+        self.body_size = body_size
+        self.table_rows = table_rows
+        self._current: Dict[str, int] = {}
+        self._previous: Dict[str, int] = {}
+
+    def set_page(self, metrics: Optional[Dict]):
+        """Sıradaki sayfanın ölçülerinden başlık satırı → seviye tablosunu kurar"""
+        levels = {}
+        for text, size, bold in (metrics or {}).get('lines', ()):
+            level = heading_level(text, size, bold, self.body_size)
+            if level is not None:
+                levels[text] = level
+        self._previous = self._current
+        self._current = levels
+
+    def feed(self, line: str) -> List[str]:
+        line = line.strip()
+        if not line:
+            return ['']
+
+        # Markdown tablo satırları (düzen tabanlı tablo motoru) başlık sayılmaz
+        if self.table_rows and line.startswith('|'):
+            return [line]
+
+        key = _line_key(line)
+        level = self._current.get(key) or self._previous.get(key)
+        if level is None:
+            return [line]
+
+        self.toc_entries.append(TocEntry(level, line, self.create_anchor(line)))
+        return ['#' * level + ' ' + line]
+
+
+def feed_page_metrics(records: Iterable[Dict], rule: FontHeadingRule) -> Iterator[Dict]:
+    """Sayfa kayıtlarını geçirirken her sayfanın ölçülerini, metni kurala ulaşmadan önce kurala verir"""
+    for record in records:
+        rule.set_page(record.get('fonts'))
+        yield record
@@ -9,9 +9,11 @@ from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 import os
 import json
-import requests
 from pathlib import Path
-from pdf_to_markdown import PDFToMarkdownConverter
+from pdf_to_markdown import PDFToMarkdownConverter, parse_page_ranges
+from conversion_cache import ConversionCache
+from conversion_queue import ConversionQueue, QUEUED, RUNNING, DONE, FAILED, CANCELLED
+from ai_enhancer import AIChunkEnhancer, AIEnhancementError
 
 # Drag & Drop için
 try:
@@ -49,50 +51,20 @@ class AIDocumentEnhancer:
         return False
     
     def enhance_markdown_document(self, markdown_content: str, title: str) -> str:
-        """Markdown dokümanını AI ile geliştirir"""
+        """Markdown dokümanını AI ile geliştirir (parçalı, eşzamanlı istekler)"""
         if not self.client:
             return markdown_content
         
         try:
-            prompt = f"""
-Aşağıdaki Markdown dokümanını GitBook için profesyonel bir formata dönüştür. 
-
-GEREKSINIMLER:
-1. GitBook uyumlu meta bilgiler ekle (---title, description---)
-2. Güzel emojiler ve simgeler kullan (📚, 🔧, 💡, ⚡, 🎯, vb.)
-3. İçindekiler tablosu oluştur
-4. Başlıkları kategorilere göre organize et
-5. Tablolar varsa güzel formatla
-6. Önemli terimleri **bold** yap
-7. Kod bloklarını ```language ile formatla
-8. Notları 💡 **Not:** formatında yaz
-9. Bölümler arası ---separator ekle
-10. Alt bilgi ekle (oluşturma tarihi, kaynak bilgisi)
-
-Doküman Başlığı: {title}
-
-İçerik:
-{markdown_content}
-
-Lütfen yukarıdaki gereksinimlere göre profesyonel, okunabilir ve GitBook'ta mükemmel görünecek bir doküman oluştur.
-"""
-
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "Sen bir profesyonel teknik yazı editörüsün. Markdown dokümanlarını GitBook formatında mükemmel şekilde düzenleyebiliyorsun."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=4000,
-                temperature=0.3
-            )
-            
-            enhanced_content = response.choices[0].message.content
-            return enhanced_content
-            
-        except Exception as e:
+            with AIChunkEnhancer(self.api_key, cache=ConversionCache()) as enhancer:
+                return enhancer.enhance(markdown_content, title)
+        except AIEnhancementError as e:
             print(f"AI geliştirme hatası: {e}")
             return markdown_content
+        except Exception as e:
+            # Beklenmeyen hatalarda da iyileştirilmemiş doküman korunur
+            print(f"AI geliştirme hatası (beklenmeyen): {e}")
+            return markdown_content
     
     def create_summary_and_structure(self, content: str, title: str) -> dict:
         """İçerik için özet ve yapı oluşturur"""
@@ -139,7 +111,7 @@ class PDFConverterGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("PDF to GitBook Markdown Converter v2.1 - AI Enhanced")
-        self.root.geometry("800x750")
+        self.root.geometry("800x900")
         self.root.configure(bg='#f0f0f0')
         
         # AI enhancer
@@ -150,6 +122,13 @@ class PDFConverterGUI:
         self.title_var = tk.StringVar()
         self.output_var = tk.StringVar()
         self.api_key_var = tk.StringVar()
+        self.pages_var = tk.StringVar()
+        self.page_timeout_var = tk.StringVar()
+        self.workers_var = tk.IntVar(value=min(2, os.cpu_count() or 1))
+        
+        # Çok dosyalı dönüştürme kuyruğu (işler ayrı işlemlerde, UI thread'i yalnızca olayları okur)
+        self.job_queue = ConversionQueue(workers=self.workers_var.get())
+        self._queue_busy = False
         
         # Load saved API key if exists
         self.load_api_key()
@@ -169,6 +148,7 @@ class PDFConverterGUI:
         self.create_conversion_options()
         self.create_ai_options()
         self.create_convert_button()
+        self.create_queue_area()
         self.create_log_area()
         self.create_status_bar()
         
@@ -176,6 +156,10 @@ class PDFConverterGUI:
         root.columnconfigure(0, weight=1)
         root.rowconfigure(0, weight=1)
         self.main_frame.columnconfigure(1, weight=1)
+        
+        # Kuyruk olaylarını ana thread'de periyodik olarak işle
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(200, self.poll_queue)
     
     def create_header(self):
         """Başlık alanı"""
@@ -265,16 +249,17 @@ class PDFConverterGUI:
             self.drop_area.bind('<Leave>', on_leave)
     
     def on_file_drop(self, event):
-        """Dosya sürüklendiğinde çalışır"""
+        """Dosya sürüklendiğinde çalışır (birden çok PDF doğrudan kuyruğa eklenir)"""
         files = self.root.tk.splitlist(event.data)
-        if files:
-            file_path = files[0]  # İlk dosyayı al
-            if file_path.lower().endswith('.pdf'):
-                self.process_selected_file(file_path)
-                self.log(f"📁 Sürüklenen dosya işlendi: {os.path.basename(file_path)}")
-            else:
-                messagebox.showwarning("⚠️ Uyarı", "Lütfen sadece PDF dosyalarını sürükleyin!")
-                self.log("⚠️ PDF olmayan dosya sürüklendi")
+        pdf_files = [path for path in files if path.lower().endswith('.pdf')]
+        if len(pdf_files) < len(files):
+            messagebox.showwarning("⚠️ Uyarı", "Lütfen sadece PDF dosyalarını sürükleyin!")
+            self.log("⚠️ PDF olmayan dosya sürüklendi")
+        if len(pdf_files) == 1:
+            self.process_selected_file(pdf_files[0])
+            self.log(f"📁 Sürüklenen dosya işlendi: {os.path.basename(pdf_files[0])}")
+        elif pdf_files:
+            self.enqueue_files(pdf_files)
         return 'copy'
     
     def process_selected_file(self, file_path: str):
@@ -322,6 +307,22 @@ class PDFConverterGUI:
             command=self.select_output_dir
         )
         self.output_button.grid(row=1, column=2, padx=(5, 0), pady=(10, 0))
+        
+        # Sayfa seçimi
+        ttk.Label(settings_frame, text="Sayfalar:").grid(row=2, column=0, sticky=tk.W, pady=(10, 0))
+        self.pages_entry = ttk.Entry(settings_frame, textvariable=self.pages_var, width=40)
+        self.pages_entry.grid(row=2, column=1, padx=(10, 0), sticky=(tk.W, tk.E), pady=(10, 0))
+        ttk.Label(settings_frame, text="ör. 120-180,200 (boş = tümü)", foreground='gray').grid(
+            row=2, column=2, padx=(5, 0), pady=(10, 0), sticky=tk.W
+        )
+        
+        # Sayfa başına zaman sınırı
+        ttk.Label(settings_frame, text="Sayfa Süresi (sn):").grid(row=3, column=0, sticky=tk.W, pady=(10, 0))
+        self.page_timeout_entry = ttk.Entry(settings_frame, textvariable=self.page_timeout_var, width=10)
+        self.page_timeout_entry.grid(row=3, column=1, padx=(10, 0), sticky=tk.W, pady=(10, 0))
+        ttk.Label(settings_frame, text="aşan sayfalar atlanır (boş = sınırsız)", foreground='gray').grid(
+            row=3, column=2, padx=(5, 0), pady=(10, 0), sticky=tk.W
+        )
         settings_frame.columnconfigure(1, weight=1)
     
     def create_conversion_options(self):
@@ -346,6 +347,24 @@ class PDFConverterGUI:
             variable=self.enhanced_format_var
         )
         self.enhanced_format_check.grid(row=1, column=0, sticky=tk.W, pady=(0, 10))
+        
+        # Düzen tabanlı tablo tespiti
+        self.layout_tables_var = tk.BooleanVar(value=False)
+        self.layout_tables_check = ttk.Checkbutton(
+            options_frame,
+            text="📊 Tabloları PDF çizgilerinden tespit et (çizgili tablolar için daha doğru)",
+            variable=self.layout_tables_var
+        )
+        self.layout_tables_check.grid(row=2, column=0, sticky=tk.W, pady=(0, 10))
+        
+        # Yazı tipi boyutuna dayalı başlık tespiti
+        self.font_headings_var = tk.BooleanVar(value=False)
+        self.font_headings_check = ttk.Checkbutton(
+            options_frame,
+            text="🔠 Başlıkları yazı tipi boyutundan tespit et (daha az yanlış başlık)",
+            variable=self.font_headings_var
+        )
+        self.font_headings_check.grid(row=3, column=0, sticky=tk.W, pady=(0, 10))
           # AI İyileştirme seçeneği
         self.ai_enhance_var = tk.BooleanVar(value=False)
         self.ai_enhance_check = ttk.Checkbutton(
@@ -354,11 +373,11 @@ class PDFConverterGUI:
             variable=self.ai_enhance_var,
             command=self.toggle_ai_options
         )
-        self.ai_enhance_check.grid(row=2, column=0, sticky=tk.W, pady=(0, 10))
+        self.ai_enhance_check.grid(row=4, column=0, sticky=tk.W, pady=(0, 10))
         
         # OpenAI API Key girişi (gizli)
         self.api_frame = ttk.Frame(options_frame)
-        self.api_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+        self.api_frame.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
         self.api_frame.grid_remove()  # Başlangıçta gizli
         
         ttk.Label(self.api_frame, text="🔑 OpenAI API Key:").grid(row=0, column=0, sticky=tk.W)
@@ -389,7 +408,7 @@ class PDFConverterGUI:
             font=('Arial', 9),
             foreground='#0066cc'
         )
-        desc_label.grid(row=4, column=0, sticky=tk.W)
+        desc_label.grid(row=6, column=0, sticky=tk.W)
         
         self.api_frame.columnconfigure(1, weight=1)
         options_frame.columnconfigure(0, weight=1)
@@ -486,79 +505,6 @@ class PDFConverterGUI:
         except Exception as e:
             self.log(f"⚠️ API anahtarı yüklenemedi: {e}")
     
-    def enhance_with_ai(self, content: str, title: str) -> str:
-        """AI ile doküman içeriğini iyileştir"""
-        if not OPENAI_AVAILABLE:
-            raise Exception("OpenAI kütüphanesi kurulu değil!")
-        
-        api_key = self.api_key_var.get().strip()
-        if not api_key:
-            raise Exception("OpenAI API key gerekli!")
-        
-        try:
-            # OpenAI API isteği
-            headers = {
-                'Authorization': f'Bearer {api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            prompt = f"""Lütfen aşağıdaki Markdown dökümanını GitBook için optimize et:
-
-1. İçindekiler tablosu oluştur
-2. Başlıkları emoji'lerle zenginleştir  
-3. Önemli bilgileri vurgula
-4. Tablo formatlarını düzenle
-5. Code block'ları uygun şekilde formatla
-6. Daha okunabilir hale getir
-
-Başlık: {title}
-
-İçerik:
-{content[:4000]}...  # İlk 4000 karakter (token limiti için)
-
-Lütfen sadece düzenlenmiş Markdown döndür, başka açıklama ekleme."""
-
-            data = {
-                "model": "gpt-3.5-turbo",
-                "messages": [
-                    {
-                        "role": "system", 
-                        "content": "Sen GitBook dokümanları için uzman bir Markdown formatlayıcısın."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                "max_tokens": 2000,
-                "temperature": 0.3
-            }
-            
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                enhanced_content = result['choices'][0]['message']['content']
-                
-                self.log("🤖 AI iyileştirmesi tamamlandı!")
-                return enhanced_content
-            else:
-                error_msg = f"API Hatası: {response.status_code}"
-                if response.text:
-                    error_detail = response.json().get('error', {}).get('message', 'Bilinmeyen hata')
-                    error_msg += f" - {error_detail}"
-                raise Exception(error_msg)
-                
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Bağlantı hatası: {str(e)}")
-        except Exception as e:
-            raise Exception(f"AI iyileştirme hatası: {str(e)}")
-
     def create_convert_button(self):
         """Dönüştür butonu oluştur"""
         button_frame = ttk.Frame(self.main_frame)
@@ -579,14 +525,16 @@ Lütfen sadece düzenlenmiş Markdown döndür, başka açıklama ekleme."""
                        font=('Arial', 12, 'bold'))
 
     def select_pdf_file(self):
-        """PDF dosyası seç"""
-        filename = filedialog.askopenfilename(
+        """PDF dosyası seç (birden çok dosya seçilirse hepsi kuyruğa eklenir)"""
+        filenames = filedialog.askopenfilenames(
             title="PDF Dosyası Seçin",
             filetypes=[("PDF dosyaları", "*.pdf"), ("Tüm dosyalar", "*.*")]
         )
-        if filename:
-            self.pdf_var.set(filename)
-            self.log(f"📄 PDF seçildi: {os.path.basename(filename)}")
+        if len(filenames) == 1:
+            self.pdf_var.set(filenames[0])
+            self.log(f"📄 PDF seçildi: {os.path.basename(filenames[0])}")
+        elif filenames:
+            self.enqueue_files(list(filenames))
 
     def select_output_dir(self):
         """Çıktı dizini seç"""
@@ -619,76 +567,209 @@ Lütfen sadece düzenlenmiş Markdown döndür, başka açıklama ekleme."""
             title = os.path.splitext(os.path.basename(pdf_path))[0]
             self.title_var.set(title)
         
-        # Dönüştürme thread'i başlat
-        thread = threading.Thread(target=self.convert_pdf_thread, args=(pdf_path, output_dir, title))
-        thread.daemon = True
-        thread.start()
+        # Sayfa seçimi kontrolü
+        pages_spec = self.pages_var.get().strip()
+        try:
+            pages = parse_page_ranges(pages_spec) if pages_spec else None
+        except ValueError as e:
+            messagebox.showerror("❌ Hata", str(e))
+            return
         
-        # Butonu devre dışı bırak
-        self.convert_button.config(state='disabled', text='🔄 Dönüştürülüyor...')
+        self.enqueue_job(pdf_path, output_dir, title, pages)
 
-    def convert_pdf_thread(self, pdf_path: str, output_dir: str, title: str):
-        """PDF dönüştürme thread'i"""
+    def conversion_options(self) -> dict:
+        """Kuyruğa eklenen işler için geçerli dönüştürme seçenekleri"""
+        api_key = None
+        if self.ai_enhance_var.get():
+            api_key = self.api_key_var.get().strip()
+            if not api_key:
+                raise ValueError("OpenAI API key gerekli!")
+        
+        page_timeout = None
+        timeout_spec = self.page_timeout_var.get().strip()
+        if timeout_spec:
+            try:
+                page_timeout = float(timeout_spec.replace(',', '.'))
+            except ValueError:
+                page_timeout = 0
+            if page_timeout <= 0:
+                raise ValueError(f"Geçersiz sayfa süresi: {timeout_spec}")
+        return {'enhanced_format': self.enhanced_format_var.get(), 'api_key': api_key,
+                'page_timeout': page_timeout,
+                'table_engine': 'layout' if self.layout_tables_var.get() else 'text',
+                'heading_engine': 'font' if self.font_headings_var.get() else 'text'}
+
+    def enqueue_job(self, pdf_path: str, output_dir: str, title: str, pages: list = None):
+        """Tek PDF'yi dönüştürme kuyruğuna ekler (seçenekler geçersizse None döner)"""
         try:
-            self.root.after(0, lambda: self.log("🚀 PDF dönüştürme başlatıldı..."))
-            
-            # PDF dönüştürücüyü başlat
-            from pdf_to_markdown import PDFToMarkdownConverter, EnhancedDocumentFormatter
-            
-            converter = PDFToMarkdownConverter()
-            
-            # Tek dosya olarak çıktı al
-            self.root.after(0, lambda: self.log("📖 PDF içeriği işleniyor..."))
-              # PDF'i markdown'a dönüştür - dosya oluşturacak
-            enhanced_format = self.enhanced_format_var.get() and not self.ai_enhance_var.get()
-            
-            output_path = converter.convert_pdf_to_markdown(
-                pdf_path=pdf_path,
-                output_dir=output_dir,
-                title=title,
-                enhanced_format=enhanced_format
-            )
-              # AI iyileştirmesi istendiyse, dosyayı oku ve yeniden işle
-            if self.ai_enhance_var.get():
-                self.root.after(0, lambda: self.log("🤖 AI ile doküman iyileştiriliyor..."))
-                try:
-                    # Oluşturulan dosyayı oku
-                    with open(output_path, 'r', encoding='utf-8') as f:
-                        markdown_content = f.read()
-                    
-                    # AI iyileştirmesi uygula
-                    enhanced_content = self.enhance_with_ai(markdown_content, title)
-                    
-                    # İyileştirilmiş içeriği kaydet
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        f.write(enhanced_content)
-                    
-                    self.root.after(0, lambda: self.log("✨ AI iyileştirmesi başarıyla tamamlandı!"))
-                    
-                except Exception as ai_error:
-                    self.root.after(0, lambda: self.log(f"⚠️ AI iyileştirme hatası: {ai_error}"))
-                    self.root.after(0, lambda: self.log("📝 Normal format ile devam ediliyor..."))
-  
-            
-            self.root.after(0, lambda: self.log(f"✅ Dönüştürme tamamlandı: {output_path}"))
-            self.root.after(0, lambda: messagebox.showinfo(
-                "✅ Başarılı!", 
-                f"PDF başarıyla dönüştürüldü!\n\nÇıktı: {output_path}"
-            ))
-            
-        except Exception as e:
-            error_msg = f"Dönüştürme hatası: {str(e)}"
-            self.root.after(0, lambda: self.log(f"❌ {error_msg}"))
-            self.root.after(0, lambda: messagebox.showerror("❌ Hata", error_msg))
+            options = self.conversion_options()
+        except ValueError as e:
+            messagebox.showerror("❌ Hata", str(e))
+            return
+        
+        job = self.job_queue.add(pdf_path, output_dir, title, pages=pages, **options)
+        self.queue_tree.insert('', tk.END, iid=str(job.job_id), values=(job.name, title, '', ''))
+        self.refresh_job(job)
+        self.log(f"📥 Kuyruğa eklendi: {job.name}")
+        return job
+
+    def enqueue_files(self, paths: list):
+        """Birden çok PDF'yi dosya adından başlıkla kuyruğa ekler"""
+        pages_spec = self.pages_var.get().strip()
+        try:
+            pages = parse_page_ranges(pages_spec) if pages_spec else None
+        except ValueError as e:
+            messagebox.showerror("❌ Hata", str(e))
+            return
+        
+        for path in paths:
+            title = os.path.splitext(os.path.basename(path))[0]
+            title = title.replace('_', ' ').replace('-', ' ').title()
+            output_dir = self.output_var.get().strip() or os.path.dirname(path) or os.getcwd()
+            if self.enqueue_job(path, output_dir, title, pages) is None:
+                return
+
+    def create_queue_area(self):
+        """Dönüştürme kuyruğu paneli (iş başına durum ve ilerleme)"""
+        queue_frame = ttk.LabelFrame(self.main_frame, text="📋 Dönüştürme Kuyruğu", padding="10")
+        queue_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 15))
+        
+        columns = ('file', 'title', 'status', 'progress')
+        self.queue_tree = ttk.Treeview(queue_frame, columns=columns, show='headings', height=5)
+        for column, text, width in (('file', "Dosya", 220), ('title', "Başlık", 180),
+                                    ('status', "Durum", 130), ('progress', "İlerleme", 150)):
+            self.queue_tree.heading(column, text=text)
+            self.queue_tree.column(column, width=width, anchor=tk.W)
+        scrollbar = ttk.Scrollbar(queue_frame, orient="vertical", command=self.queue_tree.yview)
+        self.queue_tree.configure(yscrollcommand=scrollbar.set)
+        self.queue_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
-        finally:
-            # Butonu tekrar etkinleştir
-            self.root.after(0, lambda: self.convert_button.config(state='normal', text='🚀 Dönüştür!'))
+        controls = ttk.Frame(queue_frame)
+        controls.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(8, 0))
+        
+        ttk.Label(controls, text="Eşzamanlı iş:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Spinbox(
+            controls,
+            from_=1,
+            to=max(1, os.cpu_count() or 1),
+            width=4,
+            textvariable=self.workers_var,
+            command=self.on_workers_changed
+        ).grid(row=0, column=1, padx=(5, 15))
+        
+        ttk.Button(controls, text="⛔ İptal", command=self.cancel_selected_jobs).grid(row=0, column=2, padx=(5, 0))
+        ttk.Button(controls, text="🔁 Yeniden Dene", command=self.retry_selected_jobs).grid(row=0, column=3, padx=(5, 0))
+        ttk.Button(controls, text="🧹 Bitenleri Temizle", command=self.clear_finished_jobs).grid(row=0, column=4, padx=(5, 0))
+        
+        queue_frame.columnconfigure(0, weight=1)
+        queue_frame.rowconfigure(0, weight=1)
+
+    def selected_jobs(self) -> list:
+        """Kuyruk tablosunda seçili işler"""
+        return [self.job_queue.jobs[int(iid)] for iid in self.queue_tree.selection()
+                if int(iid) in self.job_queue.jobs]
+
+    def cancel_selected_jobs(self):
+        """Seçili işleri iptal et"""
+        for job in self.selected_jobs():
+            if self.job_queue.cancel(job):
+                self.log(f"⛔ İptal ediliyor: {job.name}")
+                self.refresh_job(job)
+
+    def retry_selected_jobs(self):
+        """Başarısız veya iptal edilmiş seçili işleri yeniden kuyruğa ekle"""
+        for job in self.selected_jobs():
+            if self.job_queue.retry(job):
+                self.log(f"🔁 Yeniden deneniyor: {job.name}")
+                self.refresh_job(job)
+
+    def clear_finished_jobs(self):
+        """Biten işleri tablodan kaldır"""
+        for job in self.job_queue.remove_finished():
+            self.queue_tree.delete(str(job.job_id))
+
+    def on_workers_changed(self):
+        """Eşzamanlı iş sayısı değişti (çalışan işler bittiğinde uygulanır)"""
+        try:
+            workers = max(1, int(self.workers_var.get()))
+        except (tk.TclError, ValueError):
+            return
+        self.job_queue.workers = workers
+        if self.job_queue.active:
+            self.log(f"⚙️ Eşzamanlı iş sayısı {workers} olacak (çalışan işler bittiğinde)")
+        else:
+            self.log(f"⚙️ Eşzamanlı iş sayısı: {workers}")
+
+    def refresh_job(self, job):
+        """İşin tablo satırını günceller"""
+        labels = {
+            QUEUED: "⏳ Bekliyor",
+            RUNNING: "🔄 Dönüştürülüyor" if job.phase == 'pages' else "🤖 AI iyileştirme",
+            DONE: "✅ Tamamlandı",
+            FAILED: "❌ Hata",
+            CANCELLED: "⛔ İptal edildi",
+        }
+        if job.total:
+            unit = "sayfa" if job.phase == 'pages' else "parça"
+            progress = f"{job.done}/{job.total} {unit} (%{job.done * 100 // job.total})"
+        else:
+            progress = ''
+        if job.status == FAILED:
+            progress = job.error or ''
+        self.queue_tree.set(str(job.job_id), 'status', labels[job.status])
+        self.queue_tree.set(str(job.job_id), 'progress', progress)
+
+    def poll_queue(self):
+        """İşçi olaylarını okur, tabloyu ve durum çubuğunu günceller (ana thread)"""
+        for job in self.job_queue.poll():
+            if not self.queue_tree.exists(str(job.job_id)):
+                continue
+            self.refresh_job(job)
+            if job.status == DONE:
+                for message in job.messages:
+                    self.log(f"{message} ({job.name})")
+                self.log(f"✅ Dönüştürme tamamlandı: {job.output}")
+            elif job.status == FAILED:
+                self.log(f"❌ {job.name}: Dönüştürme hatası: {job.error}")
+            elif job.status == CANCELLED:
+                self.log(f"⛔ İptal edildi: {job.name}")
+        
+        self.update_queue_status()
+        self.root.after(200, self.poll_queue)
+
+    def update_queue_status(self):
+        """Durum çubuğunda kuyruktaki işlerin toplam ilerlemesini gösterir"""
+        active = self.job_queue.active
+        if active:
+            self._queue_busy = True
+            running = sum(1 for job in active if job.status == RUNNING)
+            done = sum(1.0 if job.finished else job.done / job.total if job.total else 0.0
+                       for job in self.job_queue.jobs.values())
+            self.progress_bar.config(maximum=max(1, len(self.job_queue.jobs)), value=done)
+            self.status_var.set(f"🔄 {running} çalışıyor • {len(active) - running} bekliyor")
+        elif self._queue_busy:
+            # Kuyruk boşaldı: özet göster
+            self._queue_busy = False
+            jobs = list(self.job_queue.jobs.values())
+            succeeded = sum(1 for job in jobs if job.status == DONE)
+            failed = sum(1 for job in jobs if job.status == FAILED)
+            self.progress_bar.config(maximum=1, value=1)
+            self.status_var.set(f"Hazır • {succeeded} tamamlandı, {failed} hata")
+            if failed:
+                messagebox.showwarning("⚠️ Kuyruk tamamlandı", f"{succeeded} dosya dönüştürüldü, {failed} dosyada hata oluştu.")
+            else:
+                messagebox.showinfo("✅ Başarılı!", f"{succeeded} dosya başarıyla dönüştürüldü!")
+
+    def on_close(self):
+        """Pencere kapanırken işçi işlemlerini sonlandır"""
+        self.job_queue.shutdown()
+        self.root.destroy()
 
     def create_log_area(self):
         """Log alanı oluştur"""
         log_frame = ttk.LabelFrame(self.main_frame, text="📜 İşlem Geçmişi", padding="10")
-        log_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 15))
+        log_frame.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 15))
         
         # Log metin alanı ve scrollbar
         self.log_text = tk.Text(
@@ -723,9 +804,17 @@ Lütfen sadece düzenlenmiş Markdown döndür, başka açıklama ekleme."""
             self.log_text.delete("1.0", "100.0")
 
     def create_status_bar(self):
-        """Basit durum çubuğu - şimdilik boş"""
-        pass
-
+        """İlerleme çubuğu ve durum satırı"""
+        status_frame = ttk.Frame(self.main_frame)
+        status_frame.grid(row=7, column=0, columnspan=2, sticky=(tk.W, tk.E))
+        status_frame.columnconfigure(0, weight=1)
+        
+        self.progress_bar = ttk.Progressbar(status_frame, mode='determinate', maximum=1)
+        self.progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        
+        self.status_var = tk.StringVar(value="Hazır")
+        ttk.Label(status_frame, textvariable=self.status_var, width=45).grid(row=0, column=1, padx=(10, 0))
+    
 def main():
     """Ana GUI fonksiyonu"""
     # Drag & Drop desteği için
@@ -0,0 +1,240 @@
+"""
+PDF görüntü çıkarma ve kaydetme
+pdfplumber page.images girdilerindeki XObject akışlarını okur. JPEG (DCTDecode)
+ve JPEG 2000 (JPXDecode) akışları yeniden kodlanmadan, diğerleri Pillow ile
+PNG olarak yazılır. Dosya adları içerik özetinden türetildiği için tekrar eden
+görüntüler (logolar vb.) tek kez kaydedilir.
+"""
+
+import hashlib
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set
+
+from pdfminer.pdftypes import (
+    LITERALS_DCT_DECODE, LITERALS_JPX_DECODE, PDFStream, resolve1
+)
+from pdfminer.psparser import PSLiteral
+
+from records import ImageEntry
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Ham yazılabilen akış filtreleri ve dosya uzantıları
+RAW_FORMATS = (
+    (LITERALS_DCT_DECODE, 'jpg'),
+    (LITERALS_JPX_DECODE, 'jp2'),
+)
+
+# Bileşen sayısına göre Pillow modları (8 bit)
+MODES_BY_COMPONENTS = {1: 'L', 3: 'RGB', 4: 'CMYK'}
+DEVICE_COMPONENTS = {'DeviceGray': 1, 'G': 1, 'DeviceRGB': 3, 'RGB': 3, 'DeviceCMYK': 4, 'CMYK': 4}
+
+
+def _literal_name(value) -> Optional[str]:
+    value = resolve1(value)
+    if isinstance(value, PSLiteral):
+        return value.name if isinstance(value.name, str) else value.name.decode('latin-1')
+    return None
+
+
+def _components(colorspace) -> Optional[int]:
+    """Renk uzayının bileşen sayısı (desteklenmiyorsa None)"""
+    colorspace = resolve1(colorspace)
+    name = _literal_name(colorspace)
+    if name is not None:
+        return DEVICE_COMPONENTS.get(name)
+    if isinstance(colorspace, list) and colorspace:
+        family = _literal_name(colorspace[0])
+        if family == 'ICCBased' and len(colorspace) > 1:
+            profile = resolve1(colorspace[1])
+            if isinstance(profile, PDFStream):
+                return resolve1(profile.get('N'))
+        if family in ('CalRGB', 'CalGray', 'Lab'):
+            return {'CalRGB': 3, 'CalGray': 1, 'Lab': 3}[family]
+    return None
+
+
+def _indexed_palette(colorspace) -> Optional[bytes]:
+    """[/Indexed taban hival tablo] renk uzayından RGB paleti"""
+    colorspace = resolve1(colorspace)
+    if not (isinstance(colorspace, list) and len(colorspace) == 4 and _literal_name(colorspace[0]) == 'Indexed'):
+        return None
+    base = _components(colorspace[1])
+    lookup = resolve1(colorspace[3])
+    if isinstance(lookup, PDFStream):
+        lookup = lookup.get_data()
+    if not isinstance(lookup, bytes) or base not in (1, 3):
+        return None
+    if base == 1:
+        lookup = bytes(value for gray in lookup for value in (gray, gray, gray))
+    return lookup
+
+
+def _image_colorspace(img: Dict):
+    colorspace = img.get('colorspace')
+    if isinstance(colorspace, list) and len(colorspace) == 1:
+        # pdfplumber tek öğeli listeye sarar
+        return colorspace[0]
+    return colorspace
+
+
+def _raw_extension(stream: PDFStream) -> Optional[str]:
+    filters = stream.get_filters()
+    if not filters:
+        return None
+    last = filters[-1][0]
+    for literals, extension in RAW_FORMATS:
+        if last in literals:
+            return extension
+    return None
+
+
+def _encode_png(img: Dict, data: bytes) -> Optional[bytes]:
+    """Çözülmüş piksel verisini PNG'ye çevirir (desteklenmeyen biçimlerde None)"""
+    width, height = (int(value) for value in img['srcsize'])
+    bits = resolve1(img.get('bits')) or 8
+    colorspace = _image_colorspace(img)
+
+    if img.get('imagemask') or bits == 1:
+        mode, raw_mode, row_bytes, palette = '1', '1', (width + 7) // 8, None
+    elif bits == 8:
+        palette = _indexed_palette(colorspace)
+        if palette is not None:
+            mode, raw_mode, row_bytes = 'P', 'P', width
+        else:
+            components = _components(colorspace)
+            if components not in MODES_BY_COMPONENTS:
+                return None
+            mode = raw_mode = MODES_BY_COMPONENTS[components]
+            row_bytes = width * components
+    else:
+        return None
+
+    if len(data) < row_bytes * height:
+        return None
+
+    image = Image.frombuffer(mode, (width, height), data[:row_bytes * height], 'raw', raw_mode, 0, 1)
+    if palette is not None:
+        image.putpalette(palette)
+    if mode == 'CMYK':
+        image = image.convert('RGB')
+
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def image_entry(img: Dict, page_num: int, index: int, with_data: bool = False,
+                known_digests: Optional[Set[str]] = None) -> Optional[ImageEntry]:
+    """page.images girdisinden görüntü kaydı (ImageEntry) üretir
+
+    data yalnızca
+    with_data=True ise dosyaya yazılacak baytları içerir; özeti known_digests
+    içinde olan (daha önce kodlanmış) görüntüler yeniden kodlanmaz. Okunamayan
+    veya desteklenmeyen görüntüler için None döner.
+    """
+    stream = img.get('stream')
+    if not isinstance(stream, PDFStream):
+        return None
+
+    extension = _raw_extension(stream)
+    if extension is None and not PIL_AVAILABLE:
+        return None
+
+    # Ham akışlar (JPEG) olduğu gibi, diğerleri çözülmüş halde gelir
+    data = stream.get_data()
+    if not data:
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(repr((img.get('srcsize'), img.get('bits'), extension)).encode('ascii'))
+    digest.update(data)
+    digest = digest.hexdigest()
+
+    entry = ImageEntry(f"{digest[:16]}.{extension or 'png'}", digest, page_num, index)
+    if with_data and not (known_digests is not None and digest in known_digests):
+        entry.data = data if extension else _encode_png(img, data)
+        if entry.data is None:
+            return None
+        if known_digests is not None:
+            known_digests.add(digest)
+    return entry
+
+
+class ImageWriter:
+    """Görüntüleri sınırlı bir thread havuzuyla, içerik özetine göre tekilleştirerek yazar
+
+    Aynı özet ikinci kez gelirse yazılmaz. Verisi olmayan (önbellekten gelen)
+    kayıtların dosyası yoksa sayfa numarası missing_pages içinde toplanır.
+    """
+
+    def __init__(self, images_dir: str, max_workers: int = 4, max_pending: int = 16):
+        self.images_dir = images_dir
+        self.written = 0
+        self.duplicates = 0
+        self.errors = []
+        self.missing_pages: Set[int] = set()
+        self._submitted: Set[str] = set()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='image-writer')
+        # Bellekte bekleyen görüntü sayısını sınırla
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._dir_ready = False
+
+    def submit(self, entry: ImageEntry):
+        """Görüntü kaydını yazma kuyruğuna ekler"""
+        if entry['digest'] in self._submitted:
+            self.duplicates += 1
+            return
+
+        path = os.path.join(self.images_dir, entry['filename'])
+        if entry['data'] is None:
+            if not os.path.exists(path):
+                self.missing_pages.add(entry['page_num'])
+            return
+
+        self._submitted.add(entry['digest'])
+        if not self._dir_ready:
+            os.makedirs(self.images_dir, exist_ok=True)
+            self._dir_ready = True
+
+        self._slots.acquire()
+        future = self._executor.submit(self._write, path, entry['data'])
+        future.add_done_callback(lambda _: self._slots.release())
+
+    def submit_all(self, entries: Iterable[ImageEntry]):
+        for entry in entries:
+            self.submit(entry)
+
+    def _write(self, path: str, data: bytes):
+        # Aynı içerik önceki bir dönüşümde yazılmışsa dokunma
+        if os.path.exists(path):
+            return
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            with self._lock:
+                self.errors.append(f"{os.path.basename(path)}: {e}")
+            return
+        with self._lock:
+            self.written += 1
+
+    def close(self):
+        """Bekleyen yazmaların bitmesini bekler"""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ImageWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,247 @@
+"""
+Dönüştürme ölçüm altyapısı
+Dönüştürücü aşamaları (extract, clean, detect_headings, format, write ...)
+başlangıç/bitiş olaylarını gözlemcilere iletir. Olaylar sayfa numarası, geçen
+süre, işlenen bayt ve isteğe bağlı tracemalloc tepe değerini taşır.
+Gözlemci yoksa hiçbir ölçüm yapılmaz.
+"""
+
+import contextlib
+import json
+import time
+import tracemalloc
+from typing import Dict, IO, Iterable, List, Optional, Union
+
+from line_engine import LineRule
+
+
+class ConversionObserver:
+    """Aşama olaylarını alan gözlemci temel sınıfı
+
+    Olay sözlüğü anahtarları: stage, page_num, elapsed (sn), bytes (satır
+    kurallarında karakter sayısı), peak_bytes (trace_memory kapalıysa None), detail.
+    """
+
+    def on_stage_start(self, stage: str, page_num: Optional[int] = None):
+        pass
+
+    def on_stage_end(self, event: Dict):
+        pass
+
+    def close(self):
+        pass
+
+
+class Instrumentation:
+    """Gözlemcilere aşama olaylarını dağıtan ölçüm noktası"""
+
+    def __init__(self, observers: Optional[Iterable[ConversionObserver]] = None, trace_memory: bool = False):
+        self.observers = list(observers or [])
+        self.trace_memory = trace_memory
+        self._started_tracing = False
+        self._peaks = []  # İç içe aşamalar için tepe bellek yığını
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.observers)
+
+    def add_observer(self, observer: ConversionObserver):
+        self.observers.append(observer)
+
+    def _tracing(self) -> bool:
+        if not self.trace_memory:
+            return False
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return True
+
+    def emit(self, stage: str, elapsed: float, page_num: Optional[int] = None, size: int = 0,
+             peak_bytes: Optional[int] = None, detail: Optional[str] = None):
+        """Ölçülmüş bir aşamanın bitiş olayını gözlemcilere gönderir"""
+        event = {
+            'stage': stage,
+            'page_num': page_num,
+            'elapsed': elapsed,
+            'bytes': size,
+            'peak_bytes': peak_bytes,
+            'detail': detail,
+        }
+        for observer in self.observers:
+            observer.on_stage_end(event)
+
+    @contextlib.contextmanager
+    def stage(self, name: str, page_num: Optional[int] = None, detail: Optional[str] = None):
+        """Aşamayı ölçer; ölçüm açıksa çağırana 'bytes' yazılabilen sözlük verir, kapalıysa None"""
+        if not self.observers:
+            yield None
+            return
+
+        for observer in self.observers:
+            observer.on_stage_start(name, page_num)
+
+        tracing = self._tracing()
+        if tracing:
+            # Üst aşamanın o ana kadarki tepesini sakla, sonra sayacı sıfırla
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self._peaks.append(0)
+
+        record = {'bytes': 0}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = None
+            if tracing:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+            self.emit(name, elapsed, page_num, record['bytes'], peak, detail)
+
+    def wrap_rules(self, rules: List[LineRule], page_num: Optional[int] = None) -> List[LineRule]:
+        """Kuralları süre ölçen sarmalayıcılarla döndürür (ölçüm kapalıysa aynen)"""
+        if not self.observers:
+            return rules
+        return [TimedRule(rule, self, page_num) for rule in rules]
+
+    @contextlib.contextmanager
+    def timed_output(self, output: IO, detail: Optional[str] = None):
+        """write çağrılarını ölçen dosya sarmalayıcısı verir, çıkışta tek 'write' olayı gönderir"""
+        if not self.observers:
+            yield output
+            return
+        writer = TimedWriter(output)
+        yield writer
+        self.emit('write', writer.elapsed, size=writer.size, detail=detail)
+
+    def replay(self, events: Iterable[Dict]):
+        """Başka süreçte toplanmış olayları gözlemcilere iletir"""
+        for event in events:
+            for observer in self.observers:
+                observer.on_stage_end(event)
+
+    def close(self):
+        for observer in self.observers:
+            observer.close()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+class TimedRule(LineRule):
+    """Bir satır kuralının feed/finish sürelerini toplayıp finish'te tek olay gönderir"""
+
+    def __init__(self, rule: LineRule, instrumentation: Instrumentation, page_num: Optional[int] = None):
+        self.rule = rule
+        self.stage = rule.stage
+        self.instrumentation = instrumentation
+        self.page_num = page_num
+        self.elapsed = 0.0
+        self.size = 0
+
+    def feed(self, line: str) -> List[str]:
+        start = time.perf_counter()
+        output = self.rule.feed(line)
+        self.elapsed += time.perf_counter() - start
+        self.size += len(line) + 1
+        return output
+
+    def finish(self) -> List[str]:
+        start = time.perf_counter()
+        output = self.rule.finish()
+        self.elapsed += time.perf_counter() - start
+        self.instrumentation.emit(self.stage, self.elapsed, self.page_num, self.size,
+                                  detail=type(self.rule).__name__)
+        return output
+
+
+class TimedWriter:
+    """write çağrılarının süresini ve yazılan bayt sayısını toplar"""
+
+    def __init__(self, output: IO):
+        self.output = output
+        self.elapsed = 0.0
+        self.size = 0
+
+    def write(self, text: str) -> int:
+        start = time.perf_counter()
+        written = self.output.write(text)
+        self.elapsed += time.perf_counter() - start
+        self.size += len(text.encode('utf-8'))
+        return written
+
+
+class EventCollector(ConversionObserver):
+    """Bitiş olaylarını listede biriktirir (işlem havuzundan geri taşımak için)"""
+
+    def __init__(self):
+        self.events = []
+
+    def on_stage_end(self, event: Dict):
+        self.events.append(event)
+
+
+class JsonLinesSink(ConversionObserver):
+    """Her olayı bir JSON satırı olarak dosyaya yazar"""
+
+    def __init__(self, target: Union[str, IO]):
+        if isinstance(target, str):
+            self._file = open(target, 'w', encoding='utf-8')
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+        self._origin = time.perf_counter()
+
+    def _write(self, record: Dict):
+        record['t'] = round(time.perf_counter() - self._origin, 6)
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def on_stage_start(self, stage: str, page_num: Optional[int] = None):
+        self._write({'event': 'start', 'stage': stage, 'page_num': page_num})
+
+    def on_stage_end(self, event: Dict):
+        self._write(dict(event, event='end'))
+
+    def close(self):
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class SummaryObserver(ConversionObserver):
+    """Aşama bazında toplam süre, bayt ve tepe bellek özeti"""
+
+    def __init__(self):
+        self.stages = {}
+
+    def on_stage_end(self, event: Dict):
+        totals = self.stages.setdefault(event['stage'], {
+            'count': 0, 'elapsed': 0.0, 'bytes': 0, 'peak_bytes': None
+        })
+        totals['count'] += 1
+        totals['elapsed'] += event['elapsed']
+        totals['bytes'] += event['bytes'] or 0
+        if event.get('peak_bytes') is not None:
+            totals['peak_bytes'] = max(totals['peak_bytes'] or 0, event['peak_bytes'])
+
+    def table(self) -> str:
+        """Aşamaları süreye göre sıralanmış metin tablo olarak döndürür"""
+        # 'convert' tüm dönüşümü kapsar; yüzdeler iç aşamalar üzerinden hesaplanır
+        inner = {name: totals for name, totals in self.stages.items() if name != 'convert'}
+        total_elapsed = sum(totals['elapsed'] for totals in inner.values()) or 1e-9
+
+        rows = [f"{'Aşama':<16}{'Adet':>8}{'Süre (sn)':>12}{'%':>7}{'MB':>10}{'MB/sn':>9}{'Tepe MB':>10}"]
+        rows.append('-' * len(rows[0]))
+        for name, totals in sorted(self.stages.items(), key=lambda item: -item[1]['elapsed']):
+            mb = totals['bytes'] / (1024 * 1024)
+            rate = mb / totals['elapsed'] if totals['elapsed'] else 0.0
+            share = f"{100 * totals['elapsed'] / total_elapsed:.1f}" if name in inner else '-'
+            peak = '-' if totals['peak_bytes'] is None else f"{totals['peak_bytes'] / (1024 * 1024):.1f}"
+            rows.append(f"{name:<16}{totals['count']:>8}{totals['elapsed']:>12.3f}{share:>7}"
+                        f"{mb:>10.2f}{rate:>9.1f}{peak:>10}")
+        return '\n'.join(rows)
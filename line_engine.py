@@ -0,0 +1,325 @@
+"""
+Satır tabanlı tek geçişli dönüştürme motoru
+Temizlik, başlık tespiti, görüntü, kod bloğu ve tablo dönüşümleri sıralı
+kural nesneleri olarak tanımlanır; her satır tüm kurallardan tek seferde geçer.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, Iterator, List
+
+from records import TocEntry
+
+# Önceden derlenmiş desenler (tüm dönüştürücü örnekleri paylaşır)
+MULTI_SPACE_RE = re.compile(r' +')
+NUMBERED_HEADING_RE = re.compile(r'^\d+\.?\s+[A-ZÇĞIİÖŞÜ]')
+IMAGE_REF_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+TABLE_GAP_RE = re.compile(r'\s{3,}')
+TABLE_CELL_GAP_RE = re.compile(r'\t|\s{3,}')
+URL_RE = re.compile(r'(https?://[^\s]+)')
+ANCHOR_INVALID_RE = re.compile(r'[^a-zA-Z0-9\s-]')
+WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+# Vurgulanan terimler (sırayla uygulanır)
+IMPORTANT_TERMS = (
+    ('ISO 4217', '**ISO 4217**'),
+    ('UN/EDIFACT', '**UN/EDIFACT**'),
+    ('GitBook', '**GitBook**'),
+    ('UBL-TR', '**UBL-TR**'),
+    ('SATIS', '`SATIS`'),
+    ('IADE', '`IADE`'),
+    ('TEVKIFAT', '`TEVKIFAT`'),
+)
+
+# Anchor için Türkçe karakter dönüşüm tablosu
+ANCHOR_TRANSLATION = str.maketrans('çğıöşüÇĞIÖŞÜ', 'cgiosuCGIOSU')
+
+
+def create_anchor(title: str) -> str:
+    """GitBook uyumlu anchor oluşturur"""
+    # Türkçe karakterleri dönüştür, özel karakterleri kaldır ve küçük harfe çevir
+    anchor = ANCHOR_INVALID_RE.sub('', title.translate(ANCHOR_TRANSLATION))
+    return WHITESPACE_RUN_RE.sub('-', anchor.strip().lower())
+
+
+def emphasize_terms(text: str) -> str:
+    """Önemli terimleri vurgular"""
+    for term, replacement in IMPORTANT_TERMS:
+        if term in text:
+            text = text.replace(term, replacement)
+    return text
+
+
+class LineRule:
+    """Satır kuralı temel sınıfı
+
+    feed her girdi satırı için üretilen çıktı satırlarını döndürür (sıfır,
+    bir veya daha fazla); finish belge sonunda bekleyen satırları boşaltır.
+    stage, ölçüm olaylarında kuralın raporlandığı aşama adıdır.
+    """
+
+    stage = 'format'
+
+    def feed(self, line: str) -> List[str]:
+        return [line]
+
+    def finish(self) -> List[str]:
+        return []
+
+
+class LineEngine:
+    """Kuralları sırayla uygulayan tek geçişli satır motoru"""
+
+    def __init__(self, rules: Iterable[LineRule]):
+        self.rules = list(rules)
+
+    def run(self, lines: Iterable[str]) -> Iterator[str]:
+        """Satırları tüm kurallardan geçirip sonuç satırlarını üretir (generator)"""
+        feeds = [rule.feed for rule in self.rules]
+
+        for line in lines:
+            batch = [line]
+            for feed in feeds:
+                batch = feed(batch[0]) if len(batch) == 1 else _feed_all(feed, batch)
+                if not batch:
+                    break
+            yield from batch
+
+        # Kuralları sırayla kapat; bekleyen satırlar sonraki kurallardan geçer
+        for index, rule in enumerate(self.rules):
+            batch = rule.finish()
+            for feed in feeds[index + 1:]:
+                if not batch:
+                    break
+                batch = _feed_all(feed, batch)
+            yield from batch
+
+    def transform(self, text: str) -> str:
+        """Metni satırlarına bölüp motordan geçirir"""
+        return '\n'.join(self.run(text.split('\n')))
+
+
+def _feed_all(feed: Callable[[str], List[str]], lines: List[str]) -> List[str]:
+    output = []
+    for line in lines:
+        output.extend(feed(line))
+    return output
+
+
+class CleanupRule(LineRule):
+    """clean_text kuralı
+
+    - Boşluktan oluşan satır grupları tek boş satıra indirilir
+    - Ardışık boşluklar teke indirilir
+    - Tek başına sayı olan satırlar (sayfa numaraları) boşaltılır
+    - Baştaki ve sondaki boşluklar atılır
+    """
+
+    stage = 'clean'
+
+    def __init__(self):
+        self.last = None      # Son içerik satırı (sonda rstrip için bekletilir)
+        self.pending = []     # Son içerik satırından sonra gelen boş satırlar
+        self.in_blank_run = False
+
+    def feed(self, line: str) -> List[str]:
+        # Gereksiz boşlukları temizle
+        if not line.strip():
+            if self.last is not None and not self.in_blank_run:
+                self.pending.append('')
+                self.in_blank_run = True
+            return []
+
+        self.in_blank_run = False
+        if '  ' in line:
+            line = MULTI_SPACE_RE.sub(' ', line)
+
+        # Sayfa numaralarını kaldır (genellikle tek başına sayılar)
+        if line.isdecimal():
+            if self.last is not None:
+                self.pending.append('')
+            return []
+
+        if self.last is None:
+            output = []
+            line = line.lstrip()
+        else:
+            output = [self.last]
+            output.extend(self.pending)
+            self.pending = []
+        self.last = line
+        return output
+
+    def finish(self) -> List[str]:
+        if self.last is None:
+            return []
+        return [self.last.rstrip()]
+
+
+class HeadingRule(LineRule):
+    """detect_headings kuralı, bulunan başlıkları toc_entries listesine ekler
+
+    table_rows=True ise (düzen tabanlı tablo motoru) | ile başlayan Markdown
+    tablo satırları başlık sayılmaz.
+    """
+
+    stage = 'detect_headings'
+
+    def __init__(self, toc_entries: List[Dict], create_anchor: Callable[[str], str], table_rows: bool = False):
+        self.toc_entries = toc_entries
+        self.create_anchor = create_anchor
+        self.table_rows = table_rows
+
+    def feed(self, line: str) -> List[str]:
+        line = line.strip()
+        if not line:
+            return ['']
+
+        # Markdown tablo satırları (düzen tabanlı tablo motoru) başlık sayılmaz
+        if self.table_rows and line.startswith('|'):
+            return [line]
+
+        # Büyük harflerle yazılmış satırlar (başlık olabilir)
+        if len(line) > 5 and line.isupper() and not line.isdigit():
+            title = line.title()
+            self.toc_entries.append(TocEntry(2, title, self.create_anchor(title)))
+            return [f'## {title}']
+
+        # Sayı ile başlayan başlıklar
+        if NUMBERED_HEADING_RE.match(line):
+            self.toc_entries.append(TocEntry(3, line, self.create_anchor(line)))
+            return [f'### {line}']
+
+        # Büyük harfle başlayan ve sonunda noktalama işareti olmayan kısa satırlar
+        if (len(line) < 100 and
+                line[0].isupper() and
+                not line.endswith('.') and
+                not line.endswith(',') and
+                len(line.split()) <= 10):
+            self.toc_entries.append(TocEntry(4, line, self.create_anchor(line)))
+            return [f'#### {line}']
+
+        return [line]
+
+
+class HeadingCollectorRule(LineRule):
+    """## ve ### başlık satırlarını değiştirmeden toplar (gelişmiş TOC için)"""
+
+    stage = 'toc'
+
+    def __init__(self, heading_lines: List[str]):
+        self.heading_lines = heading_lines
+
+    def feed(self, line: str) -> List[str]:
+        if line.startswith('## ') or line.startswith('### '):
+            self.heading_lines.append(line)
+        return [line]
+
+
+class ImageRule(LineRule):
+    """Görüntü referanslarını GitBook formatına çevirir"""
+
+    def feed(self, line: str) -> List[str]:
+        if '![' not in line:
+            return [line]
+        return IMAGE_REF_RE.sub(r'![Alt text](\2)\n\n*Resim: \1*\n', line).split('\n')
+
+
+class CodeBlockRule(LineRule):
+    """Girintili satırları kod bloğuna çevirir (format_code_blocks)"""
+
+    def __init__(self):
+        self.in_code_block = False
+
+    def feed(self, line: str) -> List[str]:
+        # 4 veya daha fazla boşlukla başlayan satırlar
+        if line.startswith('    ') or line.startswith('\t'):
+            if not self.in_code_block:
+                self.in_code_block = True
+                return ['```', line.lstrip()]
+            return [line.lstrip()]
+
+        if self.in_code_block:
+            self.in_code_block = False
+            return ['```', '', line]
+        return [line]
+
+    def finish(self) -> List[str]:
+        return ['```'] if self.in_code_block else []
+
+
+class TableRule(LineRule):
+    """Boşluklarla ayrılmış kolonları Markdown tablosuna çevirir (format_tables)"""
+
+    def __init__(self):
+        self.previous_is_row = False  # Önceki ham satırda kolon boşluğu var mı
+
+    def feed(self, line: str) -> List[str]:
+        has_gap = TABLE_GAP_RE.search(line) is not None
+        previous_is_row, self.previous_is_row = self.previous_is_row, has_gap
+
+        # Birden fazla boşlukla ayrılmış kolonlar (tablo olabilir)
+        if not has_gap or len(line.split()) <= 2:
+            return [line]
+
+        cells = TABLE_GAP_RE.split(line.strip())
+        output = ['| ' + ' | '.join(cells) + ' |']
+
+        # İlk satırsa header separator ekle
+        if not previous_is_row:
+            output.append('| ' + ' | '.join(['---'] * len(cells)) + ' |')
+        return output
+
+
+class EnhancedContentRule(LineRule):
+    """EnhancedDocumentFormatter içerik formatlaması (başlık, tablo, paragraf)"""
+
+    def __init__(self, formatter):
+        self.formatter = formatter
+        self.in_table = False
+        self.previous = None  # Bir önceki ham satır (tablo başlığı tespiti için)
+
+    def feed(self, raw_line: str) -> List[str]:
+        formatter = self.formatter
+        line = raw_line.strip()
+        prev_line, self.previous = self.previous, raw_line
+
+        if not line:
+            return ['']
+
+        # Başlık formatlaması
+        if line.startswith('## '):
+            title = line.replace('## ', '').strip()
+            icon = formatter._get_section_icon(title)
+            return [f"## {icon} {title}", '']
+
+        if line.startswith('### '):
+            return [line, '']
+
+        # Hazır Markdown tablo satırları (düzen tabanlı tablo motoru, önünde ve
+        # arkasında boş satır bulunur) olduğu gibi kalır
+        if not formatter.detect_text_tables and line.startswith('|') and line.endswith('|'):
+            return [line]
+
+        # Tablo formatlaması
+        if formatter.detect_text_tables and formatter._is_table_row(line):
+            output = []
+            if not self.in_table:
+                self.in_table = True
+                output.append('')  # Tablo öncesi boşluk
+
+            output.append(formatter._format_table_row(line))
+
+            # İlk satırsa header separator ekle
+            if prev_line is None or not formatter._is_table_row(prev_line):
+                cells = [cell.strip() for cell in line.split('|') if cell.strip()]
+                output.append('| ' + ' | '.join(['---'] * len(cells)) + ' |')
+            return output
+
+        output = []
+        if self.in_table:
+            output.append('')  # Tablo sonrası boşluk
+            self.in_table = False
+
+        # Normal paragraf
+        output.append(formatter._enhance_paragraph(line))
+        return output
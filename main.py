@@ -2,12 +2,23 @@
 """
 PDF to GitBook Markdown Converter
 Kullanım: python main.py <pdf_dosyasi> [çıktı_dizini] [başlık]
+Toplu:    python main.py <dizin|glob|-> ... [--jobs N] [--timeout SN] [--summary-json dosya]
+Arama:    python main.py --search "sorgu" [--index-path dizin.sqlite3]
 """
 
 import argparse
+import glob
+import json
 import sys
 import os
-from pdf_to_markdown import PDFToMarkdownConverter
+from pdf_to_markdown import PDFToMarkdownConverter, parse_page_ranges
+from table_extractor import TABLE_ENGINES
+from font_headings import HEADING_ENGINES
+from conversion_cache import ConversionCache
+from text_index import DEFAULT_INDEX_PATH, DEFAULT_SEARCH_LIMIT, TextIndex
+from batch_converter import expand_inputs, run_batch
+from instrumentation import JsonLinesSink, SummaryObserver
+from progress import ConsoleProgressMeter
 
 def main():
     parser = argparse.ArgumentParser(
@@ -16,7 +27,8 @@ def main():
     
     parser.add_argument(
         'pdf_file',
-        help='Dönüştürülecek PDF dosyasının yolu'
+        nargs='*',
+        help='Dönüştürülecek PDF dosyası; toplu mod için dizin, glob deseni veya - (stdin listesi)'
     )
     
     parser.add_argument(
@@ -31,29 +43,286 @@ def main():
         help='Döküman başlığı (varsayılan: PDF dosya adı)'
     )
     
+    parser.add_argument(
+        '--pages',
+        default=None,
+        help='Yalnızca bu sayfaları dönüştür (ör. 120-180,200)'
+    )
+    
+    parser.add_argument(
+        '--tables',
+        choices=TABLE_ENGINES,
+        default='text',
+        help='Tablo tespiti: text (boşluk sezgisi) veya layout (PDF çizgilerinden geometrik tespit)'
+    )
+    
+    parser.add_argument(
+        '--headings',
+        choices=HEADING_ENGINES,
+        default='text',
+        help='Başlık tespiti: text (büyük harf/numara sezgisi) veya font (yazı tipi boyutu ve kalınlığı)'
+    )
+    
     parser.add_argument(
         '--create-gitbook',
         action='store_true',
         help='GitBook projesi için SUMMARY.md dosyası oluştur'
     )
     
+    parser.add_argument(
+        '--split-pages',
+        action='store_true',
+        help='Her PDF sayfasını ayrı Markdown dosyası olarak kaydet ({başlık}_pages klasörü)'
+    )
+    
+    parser.add_argument(
+        '--split-chapters',
+        action='store_true',
+        help='Her bölümü (## başlığı) ayrı Markdown dosyası olarak kaydet ({başlık}_chapters klasörü)'
+    )
+    
+    parser.add_argument(
+        '--shard-size',
+        type=float,
+        default=None,
+        metavar='MB',
+        help='Çıktıyı bu boyutta (MB) parça dosyalarına böl ({başlık}_shards klasörü)'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Sayfa bazlı modda yalnızca değişen sayfaları yeniden yaz'
+    )
+    
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Paralel işlem sayısı: toplu modda aynı anda dönüştürülen dosya, '
+             'tek dosyada sayfa bazlı dönüştürme işçisi (varsayılan: 1)'
+    )
+    
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Tek girdi olsa bile toplu modu kullan'
+    )
+    
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=None,
+        help='Toplu modda dosya başına zaman sınırı (saniye)'
+    )
+    
+    parser.add_argument(
+        '--page-timeout',
+        type=float,
+        default=None,
+        help='Sayfa başına zaman sınırı (saniye); aşan sayfalar atlanır ve raporlanır'
+    )
+    
+    parser.add_argument(
+        '--summary-json',
+        default=None,
+        help='Toplu mod özetini JSON olarak bu dosyaya yaz (- ise stdout)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Dönüştürme önbelleğini kullanma'
+    )
+    
+    parser.add_argument(
+        '--clear-cache',
+        action='store_true',
+        help='Dönüştürmeden önce önbelleği temizle'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Önbellek dizini (varsayılan: ~/.cache/pdf_to_markdown)'
+    )
+    
+    parser.add_argument(
+        '--index',
+        action='store_true',
+        help='Çıkarılan sayfa metinlerini, görüntü kayıtlarını ve başlıkları kalıcı SQLite dizinine kaydet; '
+             'dizindeki PDF\'ler yeniden okunmadan dönüştürülür'
+    )
+    
+    parser.add_argument(
+        '--index-path',
+        default=None,
+        help='SQLite dizin dosyası (varsayılan: ~/.cache/pdf_to_markdown/index.sqlite3)'
+    )
+    
+    parser.add_argument(
+        '--search',
+        default=None,
+        metavar='SORGU',
+        help='Dizinlenmiş tüm belgelerde ara ve eşleşen sayfaları listele'
+    )
+    
+    parser.add_argument(
+        '--search-limit',
+        type=int,
+        default=DEFAULT_SEARCH_LIMIT,
+        help=f'Gösterilecek en fazla arama sonucu (varsayılan: {DEFAULT_SEARCH_LIMIT})'
+    )
+    
+    parser.add_argument(
+        '--no-progress',
+        action='store_true',
+        help='Tek satırlık ilerleme göstergesini kapat'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Aşama bazında süre/bayt özet tablosunu yazdır'
+    )
+    
+    parser.add_argument(
+        '--profile-jsonl',
+        default=None,
+        help='Aşama olaylarını JSON satırları olarak bu dosyaya yaz'
+    )
+    
+    parser.add_argument(
+        '--trace-memory',
+        action='store_true',
+        help='Profil olaylarına tracemalloc tepe bellek değerlerini ekle (yavaşlatır)'
+    )
+    
     args = parser.parse_args()
     
+    cache = ConversionCache(args.cache_dir)
+    if args.clear_cache:
+        removed = cache.clear()
+        print(f"🧹 Önbellek temizlendi ({removed} kayıt silindi)")
+        if not args.pdf_file:
+            return
+    
+    if args.search is not None:
+        run_search(args.search, args.index_path, args.search_limit)
+        return
+    
+    if not args.pdf_file:
+        parser.error('pdf_file gerekli')
+    
+    try:
+        args.pages = parse_page_ranges(args.pages) if args.pages else None
+    except ValueError as e:
+        parser.error(str(e))
+    
+    if args.shard_size is not None and args.shard_size <= 0:
+        parser.error('--shard-size pozitif olmalı')
+    if sum([args.split_pages, args.split_chapters, args.shard_size is not None]) > 1:
+        parser.error('--split-pages, --split-chapters ve --shard-size birlikte kullanılamaz')
+    if args.incremental and not args.split_pages:
+        parser.error('--incremental yalnızca --split-pages ile kullanılabilir')
+    
+    batch_mode = args.batch or len(args.pdf_file) > 1 or any(
+        item == '-' or os.path.isdir(item) or glob.has_magic(item) for item in args.pdf_file
+    )
+    if batch_mode and (args.profile or args.profile_jsonl or args.trace_memory):
+        parser.error('--profile, --profile-jsonl ve --trace-memory toplu modda kullanılamaz')
+    if batch_mode:
+        run_batch_mode(args)
+        return
+    
+    args.pdf_file = args.pdf_file[0]
+    
     # PDF dosyasının varlığını kontrol et
     if not os.path.exists(args.pdf_file):
         print(f"Hata: PDF dosyası bulunamadı: {args.pdf_file}")
         sys.exit(1)
     
+    # Profil gözlemcileri
+    observers = []
+    summary_observer = None
+    if args.profile or args.trace_memory:
+        summary_observer = SummaryObserver()
+        observers.append(summary_observer)
+    if args.profile_jsonl:
+        observers.append(JsonLinesSink(args.profile_jsonl))
+    
+    # İlerleme göstergesi yalnızca terminalde (stderr yönlendirilmemişse)
+    meter = None
+    if not args.no_progress and sys.stderr.isatty():
+        meter = ConsoleProgressMeter()
+    
     try:
         # Dönüştürücüyü başlat
-        converter = PDFToMarkdownConverter()
+        converter = PDFToMarkdownConverter(
+            workers=args.jobs,
+            cache=None if args.no_cache else cache,
+            observers=observers,
+            trace_memory=args.trace_memory,
+            progress=meter,
+            page_timeout=args.page_timeout,
+            table_engine=args.tables,
+            heading_engine=args.headings,
+            index=TextIndex(args.index_path) if args.index else None
+        )
+        
+        if args.split_pages:
+            # Sayfa bazlı bölümleme
+            created_files = converter.convert_pdf_to_pages(
+                pdf_path=args.pdf_file,
+                output_dir=args.output,
+                title=args.title,
+                incremental=args.incremental,
+                pages=args.pages
+            )
+            if meter is not None:
+                meter.close()
+            print(f"\n✅ Başarılı! {len(created_files)} sayfa dosyası oluşturuldu")
+            print_profile(converter, summary_observer, args.profile_jsonl)
+            return
+        
+        if args.split_chapters:
+            # Başlık bazlı (## bölüm) bölümleme
+            created_files = converter.convert_pdf_to_chapters(
+                pdf_path=args.pdf_file,
+                output_dir=args.output,
+                title=args.title,
+                pages=args.pages
+            )
+            if meter is not None:
+                meter.close()
+            print(f"\n✅ Başarılı! {len(created_files)} bölüm dosyası oluşturuldu")
+            print_profile(converter, summary_observer, args.profile_jsonl)
+            return
+        
+        if args.shard_size is not None:
+            # Bayt bütçeli parçalara bölme
+            created_files = converter.convert_pdf_to_shards(
+                pdf_path=args.pdf_file,
+                output_dir=args.output,
+                title=args.title,
+                max_shard_bytes=int(args.shard_size * 1024 * 1024),
+                pages=args.pages
+            )
+            if meter is not None:
+                meter.close()
+            print(f"\n✅ Başarılı! {len(created_files)} parça dosyası oluşturuldu")
+            print_profile(converter, summary_observer, args.profile_jsonl)
+            return
         
         # PDF'yi Markdown'a dönüştür
         output_file = converter.convert_pdf_to_markdown(
             pdf_path=args.pdf_file,
             output_dir=args.output,
-            title=args.title
+            title=args.title,
+            pages=args.pages
         )
+        if meter is not None:
+            meter.close()
         
         print(f"\n✅ Başarılı! Markdown dosyası oluşturuldu: {output_file}")
         
@@ -67,9 +336,88 @@ def main():
         print("2. Oluşturulan .md dosyasını SUMMARY.md'ye ekleyin")
         print("3. gitbook serve ile önizleme yapın")
         
+        print_profile(converter, summary_observer, args.profile_jsonl)
+        
     except Exception as e:
+        if meter is not None:
+            meter.close()
         print(f"❌ Hata oluştu: {str(e)}")
         sys.exit(1)
 
+def print_profile(converter, summary_observer, jsonl_path):
+    """Profil gözlemcilerini kapatır ve özet tabloyu yazdırır"""
+    converter.instrumentation.close()
+    if summary_observer is not None:
+        print("\n⏱️ Aşama profili")
+        print(summary_observer.table())
+    if jsonl_path:
+        print(f"📝 Profil olayları kaydedildi: {jsonl_path}")
+
+def run_search(query, index_path, limit):
+    """Dizinlenmiş belgelerde arar ve eşleşen sayfaları yazdırır"""
+    index_path = index_path or DEFAULT_INDEX_PATH
+    if not os.path.exists(index_path):
+        print(f"Hata: Dizin bulunamadı: {index_path} (önce --index ile dönüştürün)")
+        sys.exit(1)
+    
+    with TextIndex(index_path) as index:
+        results = index.search(query, limit)
+    
+    if not results:
+        print(f"🔍 \"{query}\" için sonuç bulunamadı")
+        return
+    print(f"🔍 \"{query}\" için {len(results)} sonuç")
+    for result in results:
+        name = os.path.basename(result['name']) if result['name'] else result['digest'][:12]
+        heading = f" • {result['heading']}" if result['heading'] else ''
+        print(f"\n📄 {name} • Sayfa {result['page_num']}{heading}")
+        print(f"   {result['snippet']}")
+
+def run_batch_mode(args):
+    """Birden fazla PDF'yi işçi havuzunda dönüştürür ve özet yazdırır"""
+    # Özet JSON stdout'a yazılıyorsa ilerleme satırları onunla karışmasın
+    log = sys.stderr if args.summary_json == '-' else sys.stdout
+    files = expand_inputs(args.pdf_file)
+    if not files:
+        print("Hata: Dönüştürülecek PDF dosyası bulunamadı", file=log)
+        sys.exit(1)
+    
+    print(f"📦 {len(files)} PDF dosyası {args.jobs} işlem ile dönüştürülüyor...", file=log)
+    try:
+        summary = run_batch(
+            files,
+            output_dir=args.output,
+            workers=args.jobs,
+            timeout=args.timeout,
+            log=log,
+            split_pages=args.split_pages,
+            split_chapters=args.split_chapters,
+            shard_bytes=None if args.shard_size is None else int(args.shard_size * 1024 * 1024),
+            incremental=args.incremental,
+            pages=args.pages,
+            cache_dir=args.cache_dir,
+            use_cache=not args.no_cache,
+            page_timeout=args.page_timeout,
+            table_engine=args.tables,
+            heading_engine=args.headings,
+            index_path=(args.index_path or DEFAULT_INDEX_PATH) if args.index else None
+        )
+    except ValueError as e:
+        print(f"Hata: {e}", file=log)
+        sys.exit(1)
+    
+    print(f"\n📊 Toplam: {summary['total']} • Başarılı: {summary['succeeded']} • "
+          f"Başarısız: {summary['failed']} • Süre: {summary['seconds']} sn", file=log)
+    
+    if args.summary_json == '-':
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    elif args.summary_json:
+        with open(args.summary_json, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"📝 Özet kaydedildi: {args.summary_json}")
+    
+    if summary['failed']:
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,136 @@
+"""
+PDF girdi kaynakları
+Dönüştürücü dosya yolunun yanında bellekteki PDF'leri de kabul eder: bytes,
+bytearray, memoryview, mmap veya okunabilir ikili dosya nesnesi. Kaynaklar
+pdfplumber'a kopyalanmadan verilir; yalnızca aranamayan (seek desteklemeyen)
+akışlar (ör. pipe) bir kez belleğe okunur.
+"""
+
+import hashlib
+import io
+import mmap
+import os
+from typing import BinaryIO, Optional, Union
+
+from conversion_cache import ConversionCache
+
+PDFSource = Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap, BinaryIO]
+
+# Akıştan özet hesaplanırken okunan blok boyutu
+DIGEST_BLOCK_SIZE = 1024 * 1024
+
+
+class BufferReader(io.RawIOBase):
+    """memoryview üzerinde salt okunur, aranabilir dosya nesnesi (veri kopyalanmaz)"""
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast('B')
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._pos + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Geçersiz whence: {whence}")
+        if position < 0:
+            raise ValueError("Negatif konuma gidilemez")
+        self._pos = position
+        return position
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(len(self._view), self._pos + size)
+        data = self._view[self._pos:end].tobytes() if end > self._pos else b''
+        self._pos = max(self._pos, end)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def getbuffer(self) -> memoryview:
+        return self._view
+
+
+def source_path(source: PDFSource) -> Optional[str]:
+    """Kaynak bir dosya yoluysa yolu, değilse None döndürür"""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    return None
+
+
+def source_name(source: PDFSource) -> Optional[str]:
+    """Başlık ve ölçüm olayları için kaynak adı (yol veya dosya nesnesinin adı)"""
+    path = source_path(source)
+    if path is not None:
+        return path
+    name = getattr(source, 'name', None)
+    return name if isinstance(name, str) else None
+
+
+def prepare_source(source: PDFSource) -> Union[str, BinaryIO]:
+    """Kaynağı pdfplumber.open'a verilebilir hale getirir
+
+    Yollar olduğu gibi döner (yoksa FileNotFoundError). bytes BytesIO ile
+    (CPython'da tampon paylaşılır), bytearray/memoryview BufferReader ile
+    kopyalanmadan sarılır; mmap ve aranabilir dosya nesneleri aynen kullanılır.
+    """
+    path = source_path(source)
+    if path is not None:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"PDF dosyası bulunamadı: {path}")
+        return path
+
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    if isinstance(source, (bytearray, memoryview)):
+        return BufferReader(source)
+    if isinstance(source, mmap.mmap):
+        return source
+
+    if not hasattr(source, 'read'):
+        raise TypeError(f"Desteklenmeyen PDF kaynağı: {type(source).__name__}")
+    seekable = getattr(source, 'seekable', None)
+    if seekable is not None and seekable():
+        return source
+    # Pipe gibi aranamayan akışlar bir kez belleğe alınır
+    return io.BytesIO(source.read())
+
+
+def source_digest(source: Union[str, BinaryIO]) -> str:
+    """prepare_source ile hazırlanmış kaynağın SHA-256 içerik özeti"""
+    path = source_path(source)
+    if path is not None:
+        return ConversionCache.file_digest(path)
+
+    # Bellekteki tamponlar doğrudan özetlenir (BytesIO.getvalue paylaşılan
+    # bytes nesnesini kopyalamadan döndürür)
+    if isinstance(source, io.BytesIO):
+        return hashlib.sha256(source.getvalue()).hexdigest()
+    if isinstance(source, BufferReader):
+        return hashlib.sha256(source.getbuffer()).hexdigest()
+    if isinstance(source, mmap.mmap):
+        return hashlib.sha256(source).hexdigest()
+
+    position = source.tell()
+    digest = hashlib.sha256()
+    try:
+        source.seek(0)
+        for block in iter(lambda: source.read(DIGEST_BLOCK_SIZE), b''):
+            digest.update(block)
+    finally:
+        source.seek(position)
+    return digest.hexdigest()
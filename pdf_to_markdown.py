@@ -1,20 +1,182 @@
 import pdfplumber
 import os
-import re
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Iterable, Set, TextIO, IO
 import io
+import contextlib
+import heapq
+import itertools
+import json
 import datetime
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, wait
+from line_engine import (
+    LineEngine, LineRule, CleanupRule, HeadingRule, HeadingCollectorRule,
+    ImageRule, CodeBlockRule, TableRule, EnhancedContentRule,
+    TABLE_CELL_GAP_RE, URL_RE, create_anchor, emphasize_terms
+)
+from conversion_cache import ConversionCache
+from instrumentation import Instrumentation, ConversionObserver, EventCollector, TimedWriter
+from progress import ProgressCallback, ProgressTracker
+from image_extractor import ImageWriter, image_entry
+from records import PageRecord, SummaryEntry
+from pdf_source import PDFSource, prepare_source, source_digest, source_name, source_path
+from cancellation import CancellationToken
+from table_extractor import TABLE_ENGINES, extract_text_with_tables
+from font_headings import (
+    HEADING_ENGINES, FONT_SAMPLE_PAGES, FontHeadingRule, body_font_size, feed_page_metrics, page_font_metrics,
+    sample_body_size
+)
+from shard_writer import DEFAULT_SHARD_BYTES, ChapterWriter, ShardWriter, remove_stale_shards
+from text_index import TextIndex
+from worker_pool import TaskTimeoutError, WorkerCrashedError, WorkerPool
+
+# Önbellek anahtarlarına giren sürümler: çıkarma veya çıktı biçimi
+# değiştiğinde artırılmalıdır
+EXTRACT_VERSION = 2
+RENDER_VERSION = 1
+
+# Sayfa klasöründeki parmak izi manifest dosyası
+MANIFEST_FILENAME = '.manifest.json'
+
+# Adı olmayan (bellekteki) PDF'ler için varsayılan başlık
+UNTITLED = 'Belge'
+
+# Sayfa işçisi beklenirken iptal bayrağının kontrol aralığı (saniye)
+CANCEL_POLL_INTERVAL = 0.1
+
+def _iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Metin parçalarını birleştirmeden satırlara böler (''.join(chunks).split('\\n') ile aynı)"""
+    carry = ''
+    for chunk in chunks:
+        parts = chunk.split('\n')
+        parts[0] = carry + parts[0]
+        carry = parts.pop()
+        yield from parts
+    yield carry
+
+def _write_lines(output: TextIO, lines: Iterable[str], batch_size: int = 1024):
+    """Satırları '\\n' ile birleştirerek küçük gruplar halinde yazar"""
+    separator = ''
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= batch_size:
+            output.write(separator + '\n'.join(batch))
+            separator = '\n'
+            batch = []
+    if batch:
+        output.write(separator + '\n'.join(batch))
+
+@contextlib.contextmanager
+def _text_output(output: IO) -> Iterator[TextIO]:
+    """Yazılabilir akışı metin akışı olarak verir (ikili akışlar UTF-8 ile sarılır)"""
+    binary = isinstance(output, (io.RawIOBase, io.BufferedIOBase)) or (
+        not isinstance(output, io.TextIOBase) and 'b' in getattr(output, 'mode', '')
+    )
+    if not binary:
+        yield output
+        return
+    wrapper = io.TextIOWrapper(output, encoding='utf-8', newline='\n', write_through=True)
+    try:
+        yield wrapper
+    finally:
+        wrapper.flush()
+        # Sarmalayıcı kapanırken çağıranın akışını kapatmasın
+        wrapper.detach()
+
+def parse_page_ranges(spec: str) -> List[int]:
+    """'120-180,200' biçimindeki sayfa seçimini sıralı sayfa numaralarına çevirir"""
+    numbers = set()
+    for part in spec.replace(' ', '').split(','):
+        if not part:
+            continue
+        start, dash, end = part.partition('-')
+        try:
+            first = int(start)
+            last = int(end) if dash else first
+        except ValueError:
+            raise ValueError(f"Geçersiz sayfa aralığı: {part}")
+        if first < 1 or last < first:
+            raise ValueError(f"Geçersiz sayfa aralığı: {part}")
+        numbers.update(range(first, last + 1))
+    if not numbers:
+        raise ValueError("Sayfa seçimi boş")
+    return sorted(numbers)
+
+def format_page_ranges(numbers: Iterable[int]) -> str:
+    """Sayfa numaralarını '120-180, 200' biçiminde kısaltır"""
+    parts = []
+    start = previous = None
+    for number in sorted(set(numbers)):
+        if previous is not None and number == previous + 1:
+            previous = number
+            continue
+        if start is not None:
+            parts.append(str(start) if start == previous else f"{start}-{previous}")
+        start = previous = number
+    if start is not None:
+        parts.append(str(start) if start == previous else f"{start}-{previous}")
+    return ', '.join(parts)
+
+def _shard_label(shard: Dict) -> str:
+    """SUMMARY/README için parça adı: 'Bölüm 2: Sayfa 14-27'"""
+    label = shard['title']
+    first, last = shard['first_page'], shard['last_page']
+    if first is None:
+        return label
+    return f"{label}: Sayfa {first}" if first == last else f"{label}: Sayfa {first}-{last}"
+
+
+def _file_content_equals(path: str, content: str, ignore_prefix: Optional[str] = None) -> bool:
+    """Dosya içeriği verilen metinle aynı mı (ignore_prefix ile başlayan satırlar hariç)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            existing = f.read()
+    except OSError:
+        return False
+    if ignore_prefix is None:
+        return existing == content
+    
+    def relevant(text: str) -> List[str]:
+        return [line for line in text.split('\n') if not line.startswith(ignore_prefix)]
+    
+    return relevant(existing) == relevant(content)
 
 class EnhancedDocumentFormatter:
     """Gelişmiş doküman formatı oluşturucu"""
     
-    def __init__(self):
+    def __init__(self, instrumentation: Optional[Instrumentation] = None, detect_text_tables: bool = True):
         self.toc_entries = []
         self.sections = []
+        # Aşama ölçümleri (gözlemci yoksa ölçüm yapılmaz)
+        self.instrumentation = instrumentation or Instrumentation()
+        # Boşluklarla ayrılmış kolonlardan tablo tahmini (düzen tabanlı motorda kapalı)
+        self.detect_text_tables = detect_text_tables
+    
+    def add_observer(self, observer: ConversionObserver):
+        """Aşama olaylarını alacak gözlemci ekler"""
+        self.instrumentation.add_observer(observer)
     
     def create_enhanced_gitbook_document(self, content: str, title: str) -> str:
         """Gelişmiş GitBook dokümanı oluşturur"""
+        lines = content.split('\n')
+        
+        # İçerik işleme
+        rules = self.instrumentation.wrap_rules(self.content_rules())
+        enhanced_content = '\n'.join(LineEngine(rules).run(lines))
+        
+        with self.instrumentation.stage('toc'):
+            header = self.document_header(title, lines)
+        return header + enhanced_content + self.document_footer()
+    
+    def content_rules(self) -> List[LineRule]:
+        """İçerik formatlaması için satır kuralları"""
+        return [EnhancedContentRule(self)]
+    
+    def document_header(self, title: str, heading_lines: Iterable[str]) -> str:
+        """Meta bilgiler, ana başlık ve içindekiler tablosu"""
         
         # Meta bilgiler
         meta_section = f"""---
@@ -35,13 +197,13 @@ tags: [pdf, markdown, gitbook, documentation]
 """
         
         # İçindekiler tablosu
-        toc_section = self._create_enhanced_toc(content)
-        
-        # İçerik işleme
-        enhanced_content = self._enhance_content(content)
+        toc_section = self._build_enhanced_toc(heading_lines)
         
-        # Alt bilgiler
-        footer_section = f"""
+        return meta_section + header_section + toc_section
+    
+    def document_footer(self) -> str:
+        """Alt bilgiler"""
+        return f"""
 
 ---
 
@@ -56,18 +218,19 @@ Bu doküman hakkında daha fazla bilgi için [buraya tıklayın](#).
 **📖 Format:** GitBook Uyumlu Markdown
 
 """
-        
-        return meta_section + header_section + toc_section + enhanced_content + footer_section
     
     def _create_enhanced_toc(self, content: str) -> str:
         """Gelişmiş içindekiler tablosu oluşturur"""
+        return self._build_enhanced_toc(content.split('\n'))
+    
+    def _build_enhanced_toc(self, lines: Iterable[str]) -> str:
+        """Satırlardaki ## ve ### başlıklarından içindekiler tablosu oluşturur"""
         
         toc = """## 📋 İçindekiler
 
 """
         
         # Başlıkları tespit et
-        lines = content.split('\n')
         chapter_count = 1
         section_count = 1
         
@@ -113,64 +276,17 @@ Bu doküman hakkında daha fazla bilgi için [buraya tıklayın](#).
     
     def _enhance_content(self, content: str) -> str:
         """İçeriği geliştirir ve formatlar"""
-        lines = content.split('\n')
-        enhanced_lines = []
-        in_table = False
-        
-        for i, line in enumerate(lines):
-            line = line.strip()
-            
-            if not line:
-                enhanced_lines.append('')
-                continue
-            
-            # Başlık formatlaması
-            if line.startswith('## '):
-                title = line.replace('## ', '').strip()
-                icon = self._get_section_icon(title)
-                enhanced_lines.append(f"## {icon} {title}")
-                enhanced_lines.append('')
-                continue
-            
-            elif line.startswith('### '):
-                enhanced_lines.append(line)
-                enhanced_lines.append('')
-                continue
-            
-            # Tablo formatlaması
-            if self._is_table_row(line):
-                if not in_table:
-                    in_table = True
-                    enhanced_lines.append('')  # Tablo öncesi boşluk
-                
-                formatted_row = self._format_table_row(line)
-                enhanced_lines.append(formatted_row)
-                
-                # İlk satırsa header separator ekle
-                if i == 0 or not self._is_table_row(lines[i-1]):
-                    cells = [cell.strip() for cell in line.split('|') if cell.strip()]
-                    separator = '| ' + ' | '.join(['---'] * len(cells)) + ' |'
-                    enhanced_lines.append(separator)
-            else:
-                if in_table:
-                    enhanced_lines.append('')  # Tablo sonrası boşluk
-                    in_table = False
-                
-                # Normal paragraf
-                enhanced_line = self._enhance_paragraph(line)
-                enhanced_lines.append(enhanced_line)
-        
-        return '\n'.join(enhanced_lines)
+        return LineEngine(self.content_rules()).transform(content)
     
     def _is_table_row(self, line: str) -> bool:
         """Satırın tablo satırı olup olmadığını kontrol eder"""
         # Birden fazla tab veya çok boşlukla ayrılmış kolonlar
-        return bool(re.search(r'\t|\s{3,}', line)) and len(line.split()) > 2
+        return bool(TABLE_CELL_GAP_RE.search(line)) and len(line.split()) > 2
     
     def _format_table_row(self, line: str) -> str:
         """Tablo satırını formatlar"""
         # Tab veya çoklu boşluklarla ayrılmış hücreleri ayır
-        cells = re.split(r'\t|\s{3,}', line.strip())
+        cells = TABLE_CELL_GAP_RE.split(line.strip())
         cells = [cell.strip() for cell in cells if cell.strip()]
         
         if len(cells) > 1:
@@ -180,159 +296,474 @@ Bu doküman hakkında daha fazla bilgi için [buraya tıklayın](#).
     def _enhance_paragraph(self, text: str) -> str:
         """Paragrafı geliştirir"""
         # Önemli terimleri vurgula
-        important_terms = [
-            ('ISO 4217', '**ISO 4217**'),
-            ('UN/EDIFACT', '**UN/EDIFACT**'),
-            ('GitBook', '**GitBook**'),
-            ('UBL-TR', '**UBL-TR**'),
-            ('SATIS', '`SATIS`'),
-            ('IADE', '`IADE`'),
-            ('TEVKIFAT', '`TEVKIFAT`'),
-        ]
-        
-        for term, replacement in important_terms:
-            text = text.replace(term, replacement)
+        text = emphasize_terms(text)
         
         # Not: ifadelerini özel formatla
         if text.startswith('Not:') or text.startswith('NOTE:'):
             text = f"📝 **Not:** {text[4:].strip()}"
         
         # URL'leri tespit et ve formatla
-        url_pattern = r'(https?://[^\s]+)'
-        text = re.sub(url_pattern, r'[\1](\1)', text)
+        if '://' in text:
+            text = URL_RE.sub(r'[\1](\1)', text)
         
         return text
     
     def _create_anchor(self, title: str) -> str:
         """GitBook uyumlu anchor oluşturur"""
-        # Türkçe karakterleri dönüştür
-        tr_chars = {
-            'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
-            'Ç': 'C', 'Ğ': 'G', 'I': 'I', 'Ö': 'O', 'Ş': 'S', 'Ü': 'U'
-        }
-        
-        for tr_char, en_char in tr_chars.items():
-            title = title.replace(tr_char, en_char)
-        
-        # Özel karakterleri kaldır ve küçük harfe çevir
-        anchor = re.sub(r'[^a-zA-Z0-9\s-]', '', title)
-        anchor = re.sub(r'\s+', '-', anchor.strip().lower())
-        
-        return anchor
+        return create_anchor(title)
 
 class PDFToMarkdownConverter:
-    def __init__(self):
+    def __init__(self, workers: int = 1, cache: Optional[ConversionCache] = None,
+                 observers: Optional[List[ConversionObserver]] = None, trace_memory: bool = False,
+                 progress: Optional[ProgressCallback] = None, page_timeout: Optional[float] = None,
+                 table_engine: str = 'text', heading_engine: str = 'text',
+                 index: Optional[TextIndex] = None):
+        if table_engine not in TABLE_ENGINES:
+            raise ValueError(f"Geçersiz tablo motoru: {table_engine} ({', '.join(TABLE_ENGINES)})")
+        if heading_engine not in HEADING_ENGINES:
+            raise ValueError(f"Geçersiz başlık motoru: {heading_engine} ({', '.join(HEADING_ENGINES)})")
         self.current_chapter = 1
         self.current_section = 1
         self.toc_entries = []
-        
-    def extract_text_from_pdf(self, pdf_path: str) -> List[Dict]:
-        """PDF'den metin ve görüntüleri çıkarır"""
-        pages_content = []
-        
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                # Metin çıkar
-                text = page.extract_text() or ""
-                
-                # Görüntüleri çıkar (pdfplumber ile basit görüntü çıkarma)
-                images = []
+        # convert_pdf_to_pages için paralel işlem sayısı (1 = seri)
+        self.workers = max(1, workers)
+        # Sayfa metni ve sayfa Markdown'ı için disk önbelleği (None = kapalı)
+        self.cache = cache
+        # Çıkarılan sayfaları, görüntü kayıtlarını ve başlıkları saklayan SQLite dizini (None = kapalı)
+        self.index = index
+        self._digests = {}
+        # Aşama ölçümleri (gözlemci yoksa ölçüm yapılmaz)
+        self.instrumentation = Instrumentation(observers, trace_memory)
+        # Sayfa başına ilerleme olayı alan geri çağırım (progress.ProgressTracker olayları)
+        self.progress = progress
+        # Sayfa başına süre sınırı (saniye); aşan sayfalar atlanıp failed_pages'e eklenir
+        self.page_timeout = page_timeout
+        self.failed_pages = []
+        # 'text': boşluk sezgisi, 'layout': pdfplumber find_tables ile geometrik tablo tespiti
+        self.table_engine = table_engine
+        # 'text': büyük harf/numara sezgisi, 'font': yazı tipi boyutu ve kalınlığı
+        self.heading_engine = heading_engine
+        # Font motorunda belgenin gövde metni boyutu (ilk sayfalardan, dönüşüm başında)
+        self.font_body_size = None
+    
+    def add_observer(self, observer: ConversionObserver):
+        """Aşama olaylarını (extract, clean, detect_headings, format, write) alacak gözlemci ekler"""
+        self.instrumentation.add_observer(observer)
+        
+    def extract_text_from_pdf(self, pdf_path: PDFSource,
+                              cancel_token: Optional[CancellationToken] = None) -> List[Dict]:
+        """PDF'den metin ve görüntüleri çıkarır (dizin açıksa sayfalar dizine de yazılır)"""
+        return list(self.iter_text_from_pdf(pdf_path, image_data=True, cancel_token=cancel_token))
+    
+    def iter_text_from_pdf(self, pdf_path: PDFSource, pages: Optional[List[int]] = None,
+                           image_data: bool = False,
+                           cancel_token: Optional[CancellationToken] = None) -> Iterator[Dict]:
+        """PDF sayfalarını tek tek işleyip sayfa kaydı üretir (generator)
+        
+        pdf_path dosya yolu ya da bellekteki PDF olabilir (bkz. pdf_source).
+        pages verilirse yalnızca bu (1'den başlayan) sayfa numaraları okunur.
+        image_data=True ise görüntü kayıtları yazılacak baytları da taşır
+        (önbellekten gelen kayıtlarda data her zaman None'dır).
+        cancel_token her sayfadan önce kontrol edilir (ConversionCancelled);
+        page_timeout verilmişse sayfalar ayrı bir sayfa işçisinde çıkarılır;
+        süreyi aşan sayfalar üretilmez, failed_pages'e eklenir.
+        index verilmişse dizindeki sayfalar PDF açılmadan okunur, eksikler
+        çıkarılıp dizine yazılır.
+        """
+        pdf_path = prepare_source(pdf_path)
+        self.failed_pages = []
+        # Bu çağrıda kodlanmış görüntü özetleri (tekrar eden görüntüler yeniden kodlanmaz)
+        image_digests = set() if image_data else None
+        if self.index is not None:
+            yield from self._iter_text_indexed(pdf_path, pages, image_digests, cancel_token)
+        elif self.cache is not None:
+            yield from self._iter_text_cached(pdf_path, pages, image_digests, cancel_token)
+        else:
+            yield from self._iter_text_direct(pdf_path, pages, image_digests, cancel_token)
+    
+    def _iter_text_direct(self, pdf_path, pages: Optional[List[int]], image_digests: Optional[Set[str]] = None,
+                          cancel_token: Optional[CancellationToken] = None) -> Iterator[PageRecord]:
+        """Sayfaları pdfplumber ile sırayla çıkarır (page_timeout verilmişse sayfa işçisinde)"""
+        if self.page_timeout is not None:
+            yield from self._iter_text_isolated(pdf_path, pages, image_digests, cancel_token)
+            return
+        
+        with pdfplumber.open(pdf_path, pages=pages) as pdf:
+            tracker = self._progress_tracker(len(pdf.pages))
+            for page in pdf.pages:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
                 try:
-                    # Sayfadaki görüntüleri tespit et
-                    if hasattr(page, 'images') and page.images:
-                        for img_index, img in enumerate(page.images):
-                            images.append({
-                                'data': None,  # pdfplumber ile görüntü verisi çıkarımı sınırlı
-                                'filename': f'page_{page_num + 1}_img_{img_index + 1}.png'
-                            })
-                except:
-                    pass
+                    record = self._extract_page(page, page.page_number - 1, image_digests)
+                finally:
+                    # Sayfanın önbelleğe alınmış layout nesnelerini bırak
+                    page.flush_cache()
+                    page.get_textmap.cache_clear()
+                
+                if tracker is not None:
+                    tracker.advance(page.page_number, len(record['text'].encode('utf-8')))
+                yield record
+    
+    def _iter_text_isolated(self, pdf_path, pages: Optional[List[int]], image_digests: Optional[Set[str]] = None,
+                            cancel_token: Optional[CancellationToken] = None) -> Iterator[PageRecord]:
+        """Sayfaları page_timeout ile sınırlanan sayfa işçisinde sırayla çıkarır"""
+        with self._isolated_pages(pdf_path, pages, image_digests is not None) as pool:
+            numbers = pool.submit(_isolated_page_numbers).result()
+            tracker = self._progress_tracker(len(numbers))
+            for number in numbers:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                record = self._extract_page_isolated(pool, number, cancel_token)
+                
+                if tracker is not None:
+                    tracker.advance(number, len(record['text'].encode('utf-8')) if record else 0)
+                if record is not None:
+                    yield record
+    
+    def _progress_tracker(self, total: int) -> Optional[ProgressTracker]:
+        """İlerleme geri çağırımı varsa sayaç oluşturur"""
+        if self.progress is None:
+            return None
+        return ProgressTracker(self.progress, total)
+    
+    def _iter_text_cached(self, pdf_path: str, pages: Optional[List[int]], image_digests: Optional[Set[str]] = None,
+                          cancel_token: Optional[CancellationToken] = None) -> Iterator[Dict]:
+        """Önbellekteki sayfa kayıtlarını kullanır; PDF yalnızca eksik sayfa varsa açılır"""
+        digest = self._file_digest(pdf_path)
+        pdf = None
+        pool = None
+        try:
+            page_count = self._page_count(pdf_path, digest)
+            if pages is None:
+                numbers = range(1, page_count + 1)
+            else:
+                numbers = [number for number in sorted(set(pages)) if 1 <= number <= page_count]
+            tracker = self._progress_tracker(len(numbers))
+            
+            for number in numbers:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                key = self.cache.make_key('page-text', EXTRACT_VERSION, digest, number, *self._engine_key())
+                cached = self.cache.get(key)
+                if cached is not None:
+                    record = PageRecord.from_dict(json.loads(cached))
+                    if tracker is not None:
+                        tracker.advance(number, len(record['text'].encode('utf-8')))
+                    yield record
+                    continue
                 
-                pages_content.append({
-                    'page_num': page_num + 1,
-                    'text': text,
-                    'images': images
-                })
+                if self.page_timeout is not None:
+                    if pool is None:
+                        pool = self._isolated_pages(pdf_path, None, image_digests is not None)
+                    record = self._extract_page_isolated(pool, number, cancel_token)
+                else:
+                    if pdf is None:
+                        pdf = pdfplumber.open(pdf_path)
+                    page = pdf.pages[number - 1]
+                    try:
+                        record = self._extract_page(page, number - 1, image_digests)
+                    finally:
+                        page.flush_cache()
+                        page.get_textmap.cache_clear()
+                
+                if record is None:
+                    # Süresi aşan sayfa önbelleğe alınmaz, sonraki dönüşümde yeniden denenir
+                    if tracker is not None:
+                        tracker.advance(number, 0)
+                    continue
+                
+                # Görüntü baytları önbelleğe alınmaz, yalnızca özet ve dosya adı
+                self.cache.put(key, json.dumps(record.to_dict(image_data=False), ensure_ascii=False))
+                if tracker is not None:
+                    tracker.advance(number, len(record['text'].encode('utf-8')))
+                yield record
+        finally:
+            if pdf is not None:
+                pdf.close()
+            if pool is not None:
+                pool.shutdown(cancel_pending=True)
+    
+    def _index_key(self) -> str:
+        """Dizindeki belge kaydının çıkarma seçenekleri anahtarı (sürüm, tablo/başlık motoru)"""
+        return json.dumps([EXTRACT_VERSION, *self._engine_key()])
+    
+    def _iter_text_indexed(self, pdf_path, pages: Optional[List[int]], image_digests: Optional[Set[str]] = None,
+                           cancel_token: Optional[CancellationToken] = None) -> Iterator[PageRecord]:
+        """Sayfaları kalıcı dizinden okur; dizinde olmayanları çıkarıp dizine yazar
+        
+        Belge kaydı PDF içerik özeti ve çıkarma seçenekleriyle eşleşir. İstenen
+        sayfaların tümü dizindeyse PDF açılmaz; dizinden gelen görüntü
+        kayıtlarında data None'dır. Yeni sayfaların başlıkları çıkarma
+        bittiğinde (veya yarıda kaldığında) tespit edilip saklanır.
+        """
+        digest = self._file_digest(pdf_path)
+        extract_key = self._index_key()
+        document = self.index.document(digest, extract_key)
+        if document is None:
+            page_count = self._page_count(pdf_path, digest)
+            document_id = self.index.add_document(digest, extract_key, source_path(pdf_path), page_count)
+        else:
+            document_id, page_count = document['id'], document['page_count']
+        
+        numbers = range(1, page_count + 1) if pages is None else [n for n in pages if 1 <= n <= page_count]
+        stored = self.index.stored_pages(document_id)
+        missing = [number for number in numbers if number not in stored]
+        if not missing:
+            tracker = self._progress_tracker(len(numbers))
+            for record in self.index.iter_pages(document_id, None if pages is None else numbers):
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                if tracker is not None:
+                    tracker.advance(record.page_num, len(record.text.encode('utf-8')))
+                yield record
+            return
+        
+        if document is not None:
+            # Yeni çıkarılan sayfalar belge adını güncel yoluyla kaydeder
+            self.index.add_document(digest, extract_key, source_path(pdf_path), page_count)
+        present = [number for number in numbers if number in stored]
+        extract = self._iter_text_cached if self.cache is not None else self._iter_text_direct
+        added = []
+        
+        def store(records: Iterable[PageRecord]) -> Iterator[PageRecord]:
+            for record in records:
+                # Sayfa başına commit: paralel işçiler yazma kilidini çıkarma süresince tutmaz
+                self.index.add_page(document_id, record)
+                self.index.commit()
+                added.append(record.page_num)
+                yield record
+        
+        # Dizindeki sayfalar önceden okunur (yazma sırasında açık okuma imleci kalmaz)
+        indexed = list(self.index.iter_pages(document_id, present)) if present else []
+        try:
+            yield from heapq.merge(indexed, store(extract(pdf_path, missing, image_digests, cancel_token)),
+                                   key=lambda record: record.page_num)
+        finally:
+            self._index_headings(document_id, added)
+            self.index.commit()
+    
+    def _index_headings(self, document_id: int, page_numbers: List[int]):
+        """Dizine yeni yazılan sayfaların başlıklarını sayfa bazlı çıktıdaki gibi tespit edip saklar"""
+        if not page_numbers:
+            return
+        body_size = self.font_body_size
+        if self.heading_engine == 'font' and body_size is None:
+            sample = itertools.islice(self.index.iter_pages(document_id), FONT_SAMPLE_PAGES)
+            body_size = body_font_size(record.fonts for record in sample)
+        
+        for record in self.index.iter_pages(document_id, page_numbers):
+            page_toc = []
+            rules = self.text_rules(page_toc)
+            for rule in rules:
+                if isinstance(rule, FontHeadingRule):
+                    rule.body_size = body_size
+                    rule.set_page(record.fonts)
+            LineEngine(rules).transform(record.text)
+            self.index.set_headings(document_id, record.page_num, page_toc)
+    
+    def _file_digest(self, pdf_path) -> str:
+        """PDF içerik özeti (dosya değişmedikçe yeniden hesaplanmaz)"""
+        if source_path(pdf_path) is None:
+            # Bellekteki PDF'ler her dönüşümde bir kez özetlenir
+            return source_digest(pdf_path)
+        
+        stat = os.stat(pdf_path)
+        signature = (stat.st_size, stat.st_mtime_ns)
+        cached = self._digests.get(pdf_path)
+        if cached is None or cached[0] != signature:
+            cached = (signature, ConversionCache.file_digest(pdf_path))
+            self._digests[pdf_path] = cached
+        return cached[1]
+    
+    def _page_count(self, pdf_path, digest: Optional[str] = None) -> int:
+        """PDF sayfa sayısı (önbellek açıksa önbellekten)"""
+        if self.cache is not None:
+            if digest is None:
+                digest = self._file_digest(pdf_path)
+            key = self.cache.make_key('page-count', EXTRACT_VERSION, digest)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return int(cached)
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
         
-        return pages_content
+        if self.cache is not None:
+            self.cache.put(key, str(page_count))
+        return page_count
+    
+    def _isolated_pages(self, pdf_path, pages: Optional[List[int]], image_data: bool) -> WorkerPool:
+        """page_timeout için tek işçili sayfa havuzu; işçi PDF'yi kendisi açar
+        
+        Süresi aşan sayfanın işçisi sonlandırılır (C kodunda takılmış olsa da)
+        ve yerine başlatılan işçi PDF'yi yeniden açar; yarıda kalan
+        pdfminer durumu sonraki sayfalara taşınmaz.
+        """
+        options = {
+            'image_data': image_data,
+            'instrument': self.instrumentation.enabled,
+            'trace_memory': self.instrumentation.trace_memory,
+            'table_engine': self.table_engine,
+            'heading_engine': self.heading_engine,
+        }
+        # Sayfa çıkarma token kontrol etmez; süre dolunca işçi beklemeden sonlandırılır
+        return WorkerPool(1, initializer=_open_isolated_pdf, initargs=(pdf_path, pages, options), cancel_grace=0)
+    
+    def _extract_page_isolated(self, pool: WorkerPool, page_num: int,
+                               cancel_token: Optional[CancellationToken] = None) -> Optional[PageRecord]:
+        """Sayfayı işçide page_timeout ile çıkarır; süre aşılırsa sayfayı failed_pages'e ekleyip None döner
+        
+        cancel_token beklerken de kontrol edilir; iptalde çalışan sayfanın işçisi sonlandırılır.
+        """
+        future = pool.submit(_extract_isolated_page, page_num, timeout=self.page_timeout)
+        if cancel_token is not None:
+            while not wait([future], timeout=CANCEL_POLL_INTERVAL).done:
+                if cancel_token.cancelled:
+                    pool.cancel(future)
+                    cancel_token.raise_if_cancelled()
+        try:
+            record, events = future.result()
+        except TaskTimeoutError:
+            error = f"{self.page_timeout:g} sn zaman sınırı aşıldı"
+        except WorkerCrashedError as e:
+            error = str(e)
+        else:
+            self.instrumentation.replay(events)
+            return record
+        self.failed_pages.append({'page_num': page_num, 'error': error})
+        return None
+    
+    def _engine_key(self) -> tuple:
+        """Varsayılan dışı tablo/başlık motorlarının önbellek anahtarı/parmak izi parçası"""
+        key = () if self.table_engine == 'text' else (self.table_engine,)
+        if self.heading_engine != 'text':
+            key += ('headings-' + self.heading_engine,)
+        return key
+    
+    def _font_key(self, page: Dict) -> tuple:
+        """Font motorunda sayfa çıktısını etkileyen ölçüler (parmak izi parçası)"""
+        if self.heading_engine != 'font':
+            return ()
+        return (self.font_body_size, (page.get('fonts') or {}).get('lines'))
+    
+    def _sample_font_statistics(self, records: Iterable[Dict]) -> Iterable[Dict]:
+        """Font motorunda ilk FONT_SAMPLE_PAGES sayfa kaydından gövde metni boyutunu hesaplar
+        
+        Örnek kayıtlar bekletilip yeniden üretildiğinden sayfalar iki kez
+        çıkarılmaz; dönen yineleyici tüm kayıtları sırayla verir.
+        """
+        if self.heading_engine != 'font':
+            return records
+        self.font_body_size, records = sample_body_size(records, FONT_SAMPLE_PAGES)
+        return records
+    
+    def _prepare_font_statistics(self, pdf_path, pages: Optional[List[int]] = None):
+        """Paralel sayfa modunda gövde metni boyutunu işçilere dağıtmadan önce örnek sayfalardan hesaplar
+        
+        Örnek sayfalar önbellek açıksa önbelleğe girer ve işçilerde yeniden
+        çıkarılmaz; ilerleme bildirimi örnekleme sırasında kapatılır.
+        """
+        if self.heading_engine != 'font':
+            return
+        sample = list(range(1, FONT_SAMPLE_PAGES + 1)) if pages is None else pages[:FONT_SAMPLE_PAGES]
+        progress, self.progress = self.progress, None
+        try:
+            self.font_body_size = body_font_size(
+                record.get('fonts') for record in self.iter_text_from_pdf(pdf_path, sample)
+            )
+        finally:
+            self.progress = progress
+    
+    def _attach_font_metrics(self, records: Iterable[Dict], rules: List[LineRule]) -> Iterable[Dict]:
+        """Font motorunda sayfa kayıtlarının ölçülerini başlık kuralına iletir"""
+        for rule in rules:
+            if isinstance(rule, FontHeadingRule):
+                return feed_page_metrics(records, rule)
+        return records
+    
+    def _report_failed_pages(self):
+        """Süresi aşıldığı için atlanan sayfaları yazdırır"""
+        if self.failed_pages:
+            numbers = [entry['page_num'] for entry in self.failed_pages]
+            print(f"⏱️ {len(numbers)} sayfa zaman sınırını aştı ve atlandı: {format_page_ranges(numbers)}")
+    
+    def _extract_page(self, page, page_num: int, image_digests: Optional[Set[str]] = None) -> PageRecord:
+        """Tek bir pdfplumber sayfasından metin ve görüntüleri çıkarır"""
+        # Metin çıkar
+        with self.instrumentation.stage('extract', page_num + 1) as record:
+            text = None
+            if self.table_engine == 'layout':
+                # Tablolar Markdown olarak yerinde; çizgisiz sayfalarda None
+                text = extract_text_with_tables(page)
+            if text is None:
+                text = page.extract_text() or ""
+            fonts = page_font_metrics(page) if self.heading_engine == 'font' else None
+            if record is not None:
+                record['bytes'] = len(text.encode('utf-8'))
+        
+        # Görüntüleri çıkar (XObject akışlarından)
+        images = []
+        try:
+            with self.instrumentation.stage('images', page_num + 1) as record:
+                for img_index, img in enumerate(page.images):
+                    entry = image_entry(img, page_num + 1, img_index + 1, with_data=image_digests is not None,
+                                        known_digests=image_digests)
+                    if entry is not None:
+                        images.append(entry)
+                        if record is not None and entry['data']:
+                            record['bytes'] += len(entry['data'])
+        except Exception:
+            # Bozuk görüntü akışı metin çıkarmayı engellemesin
+            pass
+        
+        return PageRecord(page_num + 1, text, images, fonts)
     
     def clean_text(self, text: str) -> str:
         """Metni temizler ve düzenler"""
-        # Gereksiz boşlukları temizle
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
-        
-        # Sayfa numaralarını kaldır (genellikle tek başına sayılar)
-        text = re.sub(r'^\d+$', '', text, flags=re.MULTILINE)
-        
-        return text.strip()
+        return LineEngine([CleanupRule()]).transform(text)
     
     def detect_headings(self, text: str) -> str:
         """Başlıkları tespit eder ve Markdown formatına çevirir"""
-        lines = text.split('\n')
-        processed_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                processed_lines.append('')
-                continue
-            
-            # Büyük harflerle yazılmış satırlar (başlık olabilir)
-            if len(line) > 5 and line.isupper() and not line.isdigit():
-                processed_lines.append(f'## {line.title()}')
-                self.toc_entries.append({
-                    'level': 2,
-                    'title': line.title(),
-                    'anchor': self.create_anchor(line.title())
-                })
-            
-            # Sayı ile başlayan başlıklar
-            elif re.match(r'^\d+\.?\s+[A-ZÇĞIİÖŞÜ]', line):
-                processed_lines.append(f'### {line}')
-                self.toc_entries.append({
-                    'level': 3,
-                    'title': line,
-                    'anchor': self.create_anchor(line)
-                })
-            
-            # Büyük harfle başlayan ve sonunda noktalama işareti olmayan kısa satırlar
-            elif (len(line) < 100 and 
-                  line[0].isupper() and 
-                  not line.endswith('.') and 
-                  not line.endswith(',') and
-                  len(line.split()) <= 10):
-                processed_lines.append(f'#### {line}')
-                self.toc_entries.append({
-                    'level': 4,
-                    'title': line,
-                    'anchor': self.create_anchor(line)
-                })
-            
-            else:
-                processed_lines.append(line)
-        
-        return '\n'.join(processed_lines)
+        return LineEngine([self.heading_rule()]).transform(text)
+    
+    def heading_rule(self, toc_entries: Optional[List[Dict]] = None) -> LineRule:
+        """Bulunan başlıkları toc_entries listesine (varsayılan: bu dönüştürücününki) ekleyen kural
+        
+        Font motorunda FontHeadingRule döner; sayfa ölçüleri set_page ile
+        verilmedikçe (ör. detect_headings ile düz metin) başlık bulunmaz.
+        """
+        if toc_entries is None:
+            toc_entries = self.toc_entries
+        # Düzen tabanlı motorun Markdown tablo satırları başlık tespitine girmez
+        table_rows = self.table_engine == 'layout'
+        if self.heading_engine == 'font':
+            return FontHeadingRule(toc_entries, create_anchor, self.font_body_size, table_rows)
+        return HeadingRule(toc_entries, create_anchor, table_rows)
+    
+    def text_rules(self, toc_entries: Optional[List[Dict]] = None) -> List[LineRule]:
+        """clean_text ve detect_headings adımlarının satır kuralları"""
+        return [CleanupRule(), self.heading_rule(toc_entries)]
     
     def create_anchor(self, title: str) -> str:
         """GitBook uyumlu anchor oluşturur"""
-        # Türkçe karakterleri dönüştür
-        tr_chars = {
-            'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
-            'Ç': 'C', 'Ğ': 'G', 'I': 'I', 'Ö': 'O', 'Ş': 'S', 'Ü': 'U'
-        }
-        
-        for tr_char, en_char in tr_chars.items():
-            title = title.replace(tr_char, en_char)
-        
-        # Özel karakterleri kaldır ve küçük harfe çevir
-        anchor = re.sub(r'[^a-zA-Z0-9\s-]', '', title)
-        anchor = re.sub(r'\s+', '-', anchor.strip().lower())
-        
-        return anchor
+        return create_anchor(title)
     
     def format_for_gitbook(self, content: str, title: str = "PDF Dönüştürülmüş Döküman") -> str:
         """GitBook formatına uygun Markdown oluşturur"""
+        body = LineEngine(self.gitbook_rules()).transform(content)
+        return self.gitbook_header(title) + body
+    
+    def gitbook_rules(self) -> List[LineRule]:
+        """Görüntü, kod bloğu ve tablo düzenlemelerinin satır kuralları"""
+        if self.table_engine == 'layout':
+            # Tablolar çıkarma sırasında Markdown'a çevrildi; metin sezgisi gereksiz
+            return [ImageRule(), CodeBlockRule()]
+        return [ImageRule(), CodeBlockRule(), TableRule()]
+    
+    def gitbook_header(self, title: str, toc_entries: Optional[List[Dict]] = None) -> str:
+        """GitBook meta bilgileri ve toc_entries'ten içindekiler tablosu"""
+        if toc_entries is None:
+            toc_entries = self.toc_entries
         
         # GitBook meta bilgileri
         gitbook_header = f"""---
@@ -345,155 +776,215 @@ description: PDF'den dönüştürülmüş Markdown dökümanı
 """
         
         # İçindekiler tablosu oluştur
-        if self.toc_entries:
+        if toc_entries:
             toc = "\n## İçindekiler\n\n"
-            for entry in self.toc_entries:
-                indent = "  " * (entry['level'] - 2)
-                toc += f"{indent}- [{entry['title']}](#{entry['anchor']})\n"
+            for entry in toc_entries:
+                indent = "  " * (entry.level - 2)
+                toc += f"{indent}- [{entry.title}](#{entry.anchor})\n"
             toc += "\n---\n\n"
         else:
             toc = ""
         
-        # Görüntü referanslarını düzenle
-        content = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', r'![Alt text](\2)\n\n*Resim: \1*\n', content)
-        
-        # Kod bloklarını düzenle (eğer varsa)
-        content = self.format_code_blocks(content)
-        
-        # Tablolar için düzenleme
-        content = self.format_tables(content)
-        
-        return gitbook_header + toc + content
+        return gitbook_header + toc
     
     def format_code_blocks(self, content: str) -> str:
         """Kod bloklarını tespit eder ve formatlar"""
-        # Girinti ile kod bloğu gibi görünen kısımları tespit et
-        lines = content.split('\n')
-        processed_lines = []
-        in_code_block = False
-        
-        for line in lines:
-            # 4 veya daha fazla boşlukla başlayan satırlar
-            if line.startswith('    ') or line.startswith('\t'):
-                if not in_code_block:
-                    processed_lines.append('```')
-                    in_code_block = True
-                processed_lines.append(line.lstrip())
-            else:
-                if in_code_block:
-                    processed_lines.append('```\n')
-                    in_code_block = False
-                processed_lines.append(line)
-        
-        if in_code_block:
-            processed_lines.append('```')
-        
-        return '\n'.join(processed_lines)
+        return LineEngine([CodeBlockRule()]).transform(content)
     
     def format_tables(self, content: str) -> str:
         """Tablo formatını düzenler"""
-        # Basit tablo tespiti ve düzenlemesi
-        lines = content.split('\n')
-        processed_lines = []
-        
-        for i, line in enumerate(lines):
-            # Birden fazla boşlukla ayrılmış kolonlar (tablo olabilir)
-            if re.search(r'\s{3,}', line) and len(line.split()) > 2:
-                # Tablo satırı olarak formatla
-                cells = re.split(r'\s{3,}', line.strip())
-                table_row = '| ' + ' | '.join(cells) + ' |'
-                processed_lines.append(table_row)
-                
-                # İlk satırsa header separator ekle
-                if i == 0 or not re.search(r'\s{3,}', lines[i-1]):
-                    separator = '| ' + ' | '.join(['---'] * len(cells)) + ' |'
-                    processed_lines.append(separator)
-            else:
-                processed_lines.append(line)
-        
-        return '\n'.join(processed_lines)
-    
-    def save_images(self, images: List[Dict], output_dir: str):
-        """Görüntüleri kaydet (pdfplumber sınırlı görüntü desteği)"""
-        images_dir = os.path.join(output_dir, 'images')
-        os.makedirs(images_dir, exist_ok=True)        
-        # pdfplumber ile görüntü verisi sınırlı olduğu için basit placeholder
-        for img in images:
-            if img['data']:  # Sadece veri varsa kaydet
-                img_path = os.path.join(images_dir, img['filename'])
-                with open(img_path, 'wb') as f:
-                    f.write(img['data'])
-    
-    def convert_pdf_to_markdown(self, pdf_path: str, output_dir: str = None, title: str = None, enhanced_format: bool = True) -> str:
-        """Ana dönüştürme fonksiyonu"""
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"PDF dosyası bulunamadı: {pdf_path}")
+        return LineEngine([TableRule()]).transform(content)
+    
+    def save_images(self, images: List[Dict], output_dir: str) -> ImageWriter:
+        """Görüntüleri output_dir/images altına kaydeder (tekrar edenler bir kez)"""
+        with ImageWriter(os.path.join(output_dir, 'images')) as image_writer:
+            image_writer.submit_all(images)
+        return image_writer
+    
+    def _recover_images(self, pdf_path, page_numbers: List[int], image_writer: ImageWriter):
+        """Önbellekten gelen sayfaların eksik görüntü dosyalarını PDF'den yeniden çıkarır"""
+        with pdfplumber.open(pdf_path, pages=sorted(page_numbers)) as pdf:
+            for page in pdf.pages:
+                try:
+                    for img_index, img in enumerate(page.images):
+                        entry = image_entry(img, page.page_number, img_index + 1, with_data=True)
+                        if entry is not None:
+                            image_writer.submit(entry)
+                except Exception:
+                    pass
+                finally:
+                    page.flush_cache()
+                    page.get_textmap.cache_clear()
+    
+    def convert_pdf_to_markdown(self, pdf_path: PDFSource, output_dir: str = None, title: str = None,
+                                enhanced_format: bool = True, pages: Optional[Iterable[int]] = None,
+                                output: Optional[IO] = None,
+                                cancel_token: Optional[CancellationToken] = None) -> Optional[str]:
+        """Ana dönüştürme fonksiyonu
+        
+        pdf_path dosya yolu, bytes/bytearray/memoryview/mmap veya aranabilir
+        ikili dosya nesnesi olabilir; bellekteki PDF'ler diske yazılmaz.
+        pages verilirse yalnızca bu (1'den başlayan) sayfalar açılır ve dönüştürülür.
+        output (metin veya ikili yazılabilir akış) verilirse Markdown dosya
+        yerine bu akışa yazılır ve None döner; görüntüler yalnızca output_dir
+        verilmişse kaydedilir ve Markdown'da output_dir'e göreli images/
+        bağlantılarıyla gösterilir. cancel_token iptal edilirse sayfalar arasında
+        ConversionCancelled fırlatılır ve Markdown dosyası yazılmaz.
+        """
+        source = prepare_source(pdf_path)
+        name = source_name(pdf_path)
+        
+        with self.instrumentation.stage('convert', detail=os.path.basename(name) if name else None):
+            return self._convert_to_markdown(source, name, output_dir, title, enhanced_format,
+                                             None if pages is None else sorted(set(pages)), output, cancel_token)
+    
+    def _convert_to_markdown(self, pdf_path, name: Optional[str], output_dir: Optional[str], title: Optional[str],
+                             enhanced_format: bool, pages: Optional[List[int]] = None,
+                             output: Optional[IO] = None,
+                             cancel_token: Optional[CancellationToken] = None) -> Optional[str]:
           # Çıktı dizini belirle
-        if output_dir is None:
-            output_dir = os.path.dirname(pdf_path)
+        if output_dir is None and output is None:
+            output_dir = os.path.dirname(name) if name else ''
             if not output_dir:  # Eğer dosya mevcut dizindeyse
                 output_dir = os.getcwd()
         
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # PDF'den içerik çıkar
-        print("📄 PDF içeriği çıkarılıyor...")
-        pages_content = self.extract_text_from_pdf(pdf_path)
-        
-        # Tüm metinleri birleştir
-        full_text = ""
-        all_images = []
-        
-        for page in pages_content:
-            if page['text'].strip():
-                full_text += f"\n\n<!-- Sayfa {page['page_num']} -->\n\n"
-                full_text += page['text']
-            
-            all_images.extend(page['images'])
-        
-        # Metni temizle ve başlıkları tespit et
-        print("🔧 Metin işleniyor...")
-        cleaned_text = self.clean_text(full_text)
-        formatted_text = self.detect_headings(cleaned_text)
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
         
         # Başlık belirle
         if title is None:
-            title = Path(pdf_path).stem.replace('_', ' ').replace('-', ' ').title()
+            title = Path(name).stem.replace('_', ' ').replace('-', ' ').title() if name else UNTITLED
         
-        # Format seçimi
-        if enhanced_format:
-            print("🎨 Gelişmiş GitBook formatına dönüştürülüyor...")
-            formatter = EnhancedDocumentFormatter()
-            gitbook_content = formatter.create_enhanced_gitbook_document(formatted_text, title)
-        else:
-            print("📚 Standart GitBook formatına dönüştürülüyor...")
-            gitbook_content = self.format_for_gitbook(formatted_text, title)
+        output_file = os.path.join(output_dir, f"{title}.md") if output is None else None
         
-        # Markdown dosyasını kaydet
-        output_file = os.path.join(output_dir, f"{title}.md")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(gitbook_content)
+        # Aynı dönüştürücüyle yapılan önceki dönüşümün başlıkları taşınmasın
+        self.toc_entries = []
         
-        # Görüntüleri kaydet
-        if all_images:
-            print(f"🖼️ {len(all_images)} görüntü kaydediliyor...")
-            self.save_images(all_images, output_dir)
+        # Görüntüler sayfalar okunurken arka planda yazılır
+        image_writer = ImageWriter(os.path.join(output_dir, 'images')) if output_dir is not None else None
         
-        print(f"✅ Dönüştürme tamamlandı! Çıktı: {output_file}")
+        try:
+            # PDF'den içerik çıkar (sayfalar tek tek okunur)
+            print("📄 PDF içeriği çıkarılıyor...")
+            records = self._sample_font_statistics(
+                self.iter_text_from_pdf(pdf_path, pages, image_data=image_writer is not None,
+                                        cancel_token=cancel_token)
+            )
+            
+            # Temizlik, başlık tespiti ve formatlama tek geçişte uygulanır
+            print("🔧 Metin işleniyor...")
+            rules = self.text_rules()
+            chunks = self._iter_page_chunks(self._attach_font_metrics(records, rules), image_writer)
+            heading_lines = []
+            if enhanced_format:
+                print("🎨 Gelişmiş GitBook formatına dönüştürülüyor...")
+                formatter = EnhancedDocumentFormatter(self.instrumentation,
+                                                      detect_text_tables=self.table_engine == 'text')
+                rules += [HeadingCollectorRule(heading_lines)] + formatter.content_rules()
+            else:
+                print("📚 Standart GitBook formatına dönüştürülüyor...")
+                rules += self.gitbook_rules()
+            
+            # İçindekiler içeriğin önünde yer aldığı için gövde geçici dosyada
+            # biriktirilir; bellekte yalnızca başlıklar tutulur
+            engine = LineEngine(self.instrumentation.wrap_rules(rules))
+            with tempfile.TemporaryFile('w+', encoding='utf-8', newline='\n') as spool:
+                with self.instrumentation.timed_output(spool, 'spool') as spool_output:
+                    _write_lines(spool_output, engine.run(_iter_lines(chunks)))
+                spool.seek(0)
+            
+                # Markdown dosyasını kaydet (veya verilen akışa yaz)
+                detail = os.path.basename(output_file) if output_file else 'stream'
+                with self.instrumentation.stage('write', detail=detail) as record:
+                    with self._open_output(output_file, output) as f:
+                        if output_file is None and record is not None:
+                            f = TimedWriter(f)
+                        if enhanced_format:
+                            f.write(formatter.document_header(title, heading_lines))
+                            shutil.copyfileobj(spool, f)
+                            f.write(formatter.document_footer())
+                        else:
+                            f.write(self.gitbook_header(title))
+                            shutil.copyfileobj(spool, f)
+                    if record is not None:
+                        record['bytes'] = os.path.getsize(output_file) if output_file else f.size
+            
+            # Önbellekten gelen sayfaların eksik görüntülerini tamamla
+            if image_writer is not None and image_writer.missing_pages:
+                self._recover_images(pdf_path, list(image_writer.missing_pages), image_writer)
+        finally:
+            if image_writer is not None:
+                image_writer.close()
+        
+        if image_writer is not None:
+            if image_writer.written or image_writer.duplicates:
+                print(f"🖼️ {image_writer.written} görüntü kaydedildi "
+                      f"({image_writer.duplicates} tekrar eden görüntü atlandı)")
+            for error in image_writer.errors:
+                print(f"⚠️  Görüntü yazılamadı: {error}")
+        self._report_failed_pages()
+        
+        print(f"✅ Dönüştürme tamamlandı! Çıktı: {output_file or 'akış'}")
         return output_file
     
-    def convert_pdf_to_pages(self, pdf_path: str, output_dir: str = None, title: str = None) -> List[str]:
-        """PDF'yi sayfa sayfa ayrı Markdown dosyalarına dönüştürür"""
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"PDF dosyası bulunamadı: {pdf_path}")
-        
+    @contextlib.contextmanager
+    def _open_output(self, output_file: Optional[str], output: Optional[IO]) -> Iterator[TextIO]:
+        """Çıktı dosyasını açar ya da verilen akışı metin akışı olarak döndürür (akış kapatılmaz)"""
+        if output is None:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                yield f
+        else:
+            with _text_output(output) as f:
+                yield f
+    
+    def _iter_page_chunks(self, pages: Iterable[Dict], image_writer: Optional[ImageWriter] = None) -> Iterator[str]:
+        """Sayfa işaretleri ve sayfa metinlerini parça parça üretir (generator)
+        
+        image_writer verilirse sayfanın görüntüleri yazılır ve metnin ardından
+        images/ klasörüne göreli ![...](images/dosya) bağlantıları eklenir.
+        """
+        for page in pages:
+            images = page['images'] if image_writer is not None else []
+            if images:
+                image_writer.submit_all(images)
+            
+            if page['text'].strip() or images:
+                yield f"\n\n<!-- Sayfa {page['page_num']} -->\n\n"
+                yield page['text']
+                for image in images:
+                    yield f"\n\n![Sayfa {page['page_num']} - Görüntü {image.index}](images/{image.filename})"
+    
+    def convert_pdf_to_pages(self, pdf_path: PDFSource, output_dir: str = None, title: str = None, incremental: bool = False,
+                             pages: Optional[Iterable[int]] = None,
+                             cancel_token: Optional[CancellationToken] = None) -> List[str]:
+        """PDF'yi sayfa sayfa ayrı Markdown dosyalarına dönüştürür
+        
+        incremental=True ise klasördeki manifest ile karşılaştırılır: yalnızca
+        içeriği değişen sayfalar yeniden yazılır, artık olmayan sayfaların
+        dosyaları silinir, değişmeyen dosyalara (mtime dahil) dokunulmaz.
+        pages verilirse yalnızca bu sayfalar açılır; SUMMARY.md ve README.md
+        yalnızca dönüştürülen sayfaları listeler, seçim dışındaki sayfaların
+        dosyalarına ve manifest kayıtlarına dokunulmaz. pdf_path bellekteki
+        bir PDF de olabilir (bkz. convert_pdf_to_markdown). cancel_token iptal
+        edilirse o ana kadar yazılan sayfalar kalır, manifest güncellenmez.
+        """
+        source = prepare_source(pdf_path)
+        name = source_name(pdf_path)
+        
+        with self.instrumentation.stage('convert', detail=os.path.basename(name) if name else None):
+            return self._convert_to_pages(source, name, output_dir, title, incremental,
+                                          None if pages is None else sorted(set(pages)), cancel_token)
+    
+    def _convert_to_pages(self, pdf_path, name: Optional[str], output_dir: Optional[str], title: Optional[str],
+                          incremental: bool, pages: Optional[List[int]] = None,
+                          cancel_token: Optional[CancellationToken] = None) -> List[str]:
         # Ana klasör adı
         if title is None:
-            title = Path(pdf_path).stem
+            title = Path(name).stem if name else UNTITLED
         
         # Çıktı dizini
         if output_dir is None:
-            output_dir = os.path.dirname(pdf_path)
+            output_dir = os.path.dirname(name) if name else os.getcwd()
         
         # Ana klasör oluştur
         main_folder = os.path.join(output_dir, f"{title}_pages")
@@ -503,58 +994,228 @@ description: PDF'den dönüştürülmüş Markdown dökümanı
         
         # PDF'den içerik çıkar
         print("📄 PDF sayfa sayfa işleniyor...")
-        pages_content = self.extract_text_from_pdf(pdf_path)
-        
         created_files = []
         summary_entries = []
         
-        for page in pages_content:
-            if not page['text'].strip():
-                print(f"⚠️  Sayfa {page['page_num']} boş, atlanıyor")
+        # Önceki dönüşümün sayfa parmak izleri
+        manifest = self._load_manifest(main_folder)
+        previous = manifest if incremental else {}
+        
+        # İşçiler PDF'yi yolundan yeniden açar; bellekteki PDF'ler seri işlenir
+        if self.workers > 1 and source_path(pdf_path) is not None:
+            print(f"⚙️ {self.workers} paralel işlem kullanılıyor")
+            self._prepare_font_statistics(pdf_path, pages)
+            results = self._iter_pages_parallel(pdf_path, main_folder, title, previous, pages, cancel_token)
+        else:
+            # Sayfalar okundukça işlenir ve diske yazılır
+            records = self._sample_font_statistics(self.iter_text_from_pdf(pdf_path, pages, cancel_token=cancel_token))
+            results = (
+                (page['page_num'], self._write_page(page, main_folder, title, previous))
+                for page in records
+            )
+        
+        # Sayfa başına ilerleme self.progress ile bildirilir; burada yalnızca sayılır
+        unchanged_count = 0
+        empty_count = 0
+        for page_num, entry in results:
+            if entry is None:
+                empty_count += 1
                 continue
             
-            # Sayfa için yeni converter instance (TOC temizlemek için)
-            page_converter = PDFToMarkdownConverter()
-            
-            # Metni temizle ve formatla
-            cleaned_text = page_converter.clean_text(page['text'])
-            formatted_text = page_converter.detect_headings(cleaned_text)
-            
-            # Sayfa başlığı
-            page_title = f"{title} - Sayfa {page['page_num']}"
-            
-            # GitBook formatında oluştur
-            gitbook_content = page_converter.format_for_gitbook(formatted_text, page_title)
+            created_files.append(os.path.join(main_folder, entry['filename']))
+            summary_entries.append(entry)
             
-            # Dosya adı
-            filename = f"sayfa-{page['page_num']:02d}.md"
-            output_file = os.path.join(main_folder, filename)
-            
-            # Dosyayı kaydet
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(gitbook_content)
-            
-            created_files.append(output_file)
-            summary_entries.append({
-                'filename': filename,
-                'title': page_title,
-                'page_num': page['page_num']
-            })
-            
-            print(f"✅ Sayfa {page['page_num']} oluşturuldu: {filename}")
+            if not entry['written']:
+                unchanged_count += 1
+        
+        if empty_count:
+            print(f"⚠️  {empty_count} boş sayfa atlandı")
+        self._report_failed_pages()
+        
+        # Süresi aşılan sayfaların önceki dosyaları korunur (sonraki dönüşümde yeniden denenir)
+        for failed in self.failed_pages:
+            old_entry = manifest.get(str(failed['page_num']))
+            if old_entry and os.path.exists(os.path.join(main_folder, old_entry['filename'])):
+                summary_entries.append(SummaryEntry(old_entry['filename'], f"{title} - Sayfa {failed['page_num']}",
+                                                    failed['page_num'], old_entry['fingerprint']))
+        summary_entries.sort(key=lambda entry: entry.page_num)
+        
+        new_manifest = {
+            str(entry['page_num']): {'filename': entry['filename'], 'fingerprint': entry['fingerprint']}
+            for entry in summary_entries
+        }
+        
+        # Seçim dışındaki sayfaların kayıtları korunur
+        selected = None if pages is None else set(map(str, pages))
+        if selected is not None:
+            kept = {key: old_entry for key, old_entry in manifest.items() if key not in selected}
+            new_manifest = dict(kept, **new_manifest)
+        
+        # Artık bulunmayan sayfaların dosyalarını sil
+        removed_count = 0
+        if incremental:
+            for key, old_entry in manifest.items():
+                if key in new_manifest:
+                    continue
+                old_file = os.path.join(main_folder, old_entry['filename'])
+                if os.path.exists(old_file):
+                    os.remove(old_file)
+                    removed_count += 1
+                    print(f"🗑️  Sayfa {key} kaldırıldı: {old_entry['filename']}")
+        
+        if new_manifest != manifest:
+            self._save_manifest(main_folder, new_manifest)
         
         # SUMMARY.md dosyası oluştur
-        self.create_pages_summary(summary_entries, main_folder, title)
+        self.create_pages_summary(summary_entries, main_folder, title, only_if_changed=incremental)
         
         # README.md oluştur
-        self.create_pages_readme(main_folder, title, len(created_files))
+        self.create_pages_readme(main_folder, title, len(summary_entries), only_if_changed=incremental,
+                                 entries=summary_entries, selection=pages)
         
+        if incremental:
+            print(f"♻️  {len(created_files) - unchanged_count} sayfa güncellendi, "
+                  f"{unchanged_count} sayfa değişmedi, {removed_count} sayfa silindi")
         print(f"🎉 {len(created_files)} sayfa başarıyla dönüştürüldü!")
         print(f"📚 GitBook klasörü: {main_folder}")
         
         return created_files
     
-    def create_pages_summary(self, entries: List[Dict], output_dir: str, title: str):
+    def _write_page(self, page: PageRecord, main_folder: str, title: str, previous: Optional[Dict] = None) -> Optional[SummaryEntry]:
+        """Tek sayfayı GitBook formatında yazar, boş sayfalar için None döner
+        
+        previous (manifest) içindeki parmak izi aynıysa ve dosya duruyorsa
+        sayfa yeniden oluşturulmaz ve dosyaya dokunulmaz.
+        """
+        if not page['text'].strip():
+            return None
+        
+        # Sayfa başlığı
+        page_title = f"{title} - Sayfa {page['page_num']}"
+        
+        # Dosya adı
+        filename = f"sayfa-{page['page_num']:02d}.md"
+        output_file = os.path.join(main_folder, filename)
+        
+        # Sayfa metni ve seçeneklerden türetilen parmak izi
+        fingerprint = ConversionCache.make_key('page-md', RENDER_VERSION, page_title, page['text'], *self._engine_key(),
+                                               *self._font_key(page))
+        entry = SummaryEntry(filename, page_title, page['page_num'], fingerprint)
+        
+        old_entry = (previous or {}).get(str(page['page_num']))
+        if (old_entry and old_entry.get('fingerprint') == fingerprint
+                and old_entry.get('filename') == filename and os.path.exists(output_file)):
+            return entry
+        
+        # Aynı sayfa metni ve seçenekler için önbellekteki çıktıyı kullan
+        gitbook_content = None
+        if self.cache is not None:
+            gitbook_content = self.cache.get(fingerprint)
+        
+        if gitbook_content is None:
+            gitbook_content = self._render_page(page, page_title)
+            if self.cache is not None:
+                self.cache.put(fingerprint, gitbook_content)
+        
+        # Dosyayı kaydet
+        with self.instrumentation.stage('write', page['page_num']) as record:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(gitbook_content)
+            if record is not None:
+                record['bytes'] = len(gitbook_content.encode('utf-8'))
+        
+        entry.written = True
+        return entry
+    
+    def _render_page(self, page: PageRecord, page_title: str) -> str:
+        """Sayfa metnini başlık ve sayfaya özel içindekilerle GitBook Markdown'ına çevirir"""
+        # Sayfaya özel TOC listesi (dönüştürücünün toc_entries'i değişmez)
+        page_toc = []
+        
+        # Metni temizle, başlıkları tespit et ve formatla (tek geçiş)
+        rules = self.text_rules(page_toc) + self.gitbook_rules()
+        # Font motorunda sayfanın ölçüleri başlık kuralına verilir
+        for rule in rules:
+            if isinstance(rule, FontHeadingRule):
+                rule.set_page(page.get('fonts'))
+        rules = self.instrumentation.wrap_rules(rules, page['page_num'])
+        body = LineEngine(rules).transform(page['text'])
+        
+        # GitBook formatında oluştur
+        return self.gitbook_header(page_title, page_toc) + body
+    
+    def _load_manifest(self, main_folder: str) -> Dict:
+        """Sayfa klasöründeki manifest dosyasını okur (yoksa boş sözlük)"""
+        manifest_path = os.path.join(main_folder, MANIFEST_FILENAME)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != RENDER_VERSION:
+            return {}
+        return data.get('pages', {})
+    
+    def _save_manifest(self, main_folder: str, pages: Dict):
+        """Sayfa parmak izlerini manifest dosyasına atomik olarak yazar"""
+        manifest_path = os.path.join(main_folder, MANIFEST_FILENAME)
+        tmp_path = manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': RENDER_VERSION, 'pages': pages}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
+    
+    def _iter_pages_parallel(self, pdf_path: str, main_folder: str, title: str, previous: Optional[Dict] = None,
+                             pages: Optional[List[int]] = None,
+                             cancel_token: Optional[CancellationToken] = None) -> Iterator[tuple]:
+        """Sayfa aralıklarını işlem havuzuna dağıtır, sonuçları sayfa sırasıyla döndürür
+        
+        cancel_token aralık sonuçları beklenirken de kontrol edilir; iptalde
+        başlamamış aralıklar kuyruktan çıkarılır ve çalışan aralıklar
+        beklenmez (işçiler o aralığı bitirip çıkar).
+        """
+        self.failed_pages = []
+        page_count = self._page_count(pdf_path)
+        numbers = list(range(1, page_count + 1)) if pages is None else [n for n in pages if 1 <= n <= page_count]
+        page_count = len(numbers)
+        
+        # Yük dengesi için işlem sayısından daha fazla aralık oluştur
+        chunk_size = max(1, -(-page_count // (self.workers * 4)))
+        ranges = [numbers[start:start + chunk_size] for start in range(0, page_count, chunk_size)]
+        
+        executor = ProcessPoolExecutor(max_workers=self.workers)
+        cancelled = False
+        try:
+            # İşçilerdeki aşama olayları toplanıp bu süreçteki gözlemcilere aktarılır
+            futures = [
+                executor.submit(_convert_page_range, pdf_path, page_numbers, main_folder, title, self.cache, previous,
+                                self.instrumentation.enabled, self.instrumentation.trace_memory, self.page_timeout,
+                                self.table_engine, self.heading_engine, self.font_body_size, self.index)
+                for page_numbers in ranges
+            ]
+            tracker = self._progress_tracker(page_count)
+            for future in futures:
+                if cancel_token is not None:
+                    while not wait([future], timeout=CANCEL_POLL_INTERVAL).done:
+                        if cancel_token.cancelled:
+                            break
+                    if cancel_token.cancelled:
+                        cancelled = True
+                        cancel_token.raise_if_cancelled()
+                results, events, failed_pages = future.result()
+                self.instrumentation.replay(events)
+                self.failed_pages.extend(failed_pages)
+                for entry in failed_pages:
+                    if tracker is not None:
+                        tracker.advance(entry['page_num'])
+                for result in results:
+                    if tracker is not None:
+                        tracker.advance(result[0])
+                    yield result
+        finally:
+            # İptalde başlamamış aralıklar atılır, çalışanlar beklenmez
+            executor.shutdown(wait=not cancelled, cancel_futures=cancelled)
+    
+    def create_pages_summary(self, entries: List[Dict], output_dir: str, title: str, only_if_changed: bool = False):
         """Sayfa bazında SUMMARY.md oluşturur"""
         summary_content = f"""# {title}
 
@@ -566,20 +1227,33 @@ description: PDF'den dönüştürülmüş Markdown dökümanı
             summary_content += f"* [Sayfa {entry['page_num']}]({entry['filename']})\n"
         
         summary_path = os.path.join(output_dir, "SUMMARY.md")
+        if only_if_changed and _file_content_equals(summary_path, summary_content):
+            print(f"⏭️  SUMMARY.md değişmedi")
+            return
+        
         with open(summary_path, 'w', encoding='utf-8') as f:
             f.write(summary_content)
         
         print(f"📑 SUMMARY.md oluşturuldu")
     
-    def create_pages_readme(self, output_dir: str, title: str, page_count: int):
-        """Ana README.md oluşturur"""
+    def create_pages_readme(self, output_dir: str, title: str, page_count: int, only_if_changed: bool = False,
+                            entries: Optional[List[Dict]] = None, selection: Optional[List[int]] = None):
+        """Ana README.md oluşturur
+        
+        entries verilirse sayfa listesi yalnızca bu sayfa dosyalarından oluşur;
+        selection verilirse dönüştürülen sayfa aralığı istatistiklere eklenir.
+        """
+        selection_line = ''
+        if selection is not None:
+            selection_line = f"- **Sayfa Seçimi:** {format_page_ranges(selection)}\n"
+        
         readme_content = f"""# {title}
 
 Bu klasör **{title}** PDF dosyasının sayfa sayfa Markdown dönüşümünü içerir.
 
 ## 📊 İstatistikler
 - **Toplam Sayfa:** {page_count}
-- **Dönüştürme Tarihi:** {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M')}
+{selection_line}- **Dönüştürme Tarihi:** {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M')}
 - **Format:** GitBook uyumlu Markdown
 
 ## 📖 GitBook ile Kullanım
@@ -593,15 +1267,190 @@ Bu klasör **{title}** PDF dosyasının sayfa sayfa Markdown dönüşümünü i
 """
         
         # Sayfa dosyalarını listele
-        for i in range(1, page_count + 1):
-            readme_content += f"- [Sayfa {i:02d}](sayfa-{i:02d}.md)\n"
+        if entries is None:
+            entries = [{'page_num': i, 'filename': f"sayfa-{i:02d}.md"} for i in range(1, page_count + 1)]
+        for entry in entries:
+            readme_content += f"- [Sayfa {entry['page_num']:02d}]({entry['filename']})\n"
         
         readme_path = os.path.join(output_dir, "README.md")
+        # Yalnızca dönüştürme tarihi farklıysa README yeniden yazılmaz
+        if only_if_changed and _file_content_equals(readme_path, readme_content, ignore_prefix='- **Dönüştürme Tarihi:**'):
+            print(f"⏭️  README.md değişmedi")
+            return
+        
         with open(readme_path, 'w', encoding='utf-8') as f:
             f.write(readme_content)
         
         print(f"📖 README.md oluşturuldu")
     
+    def convert_pdf_to_shards(self, pdf_path: PDFSource, output_dir: str = None, title: str = None,
+                              max_shard_bytes: int = DEFAULT_SHARD_BYTES, pages: Optional[Iterable[int]] = None,
+                              cancel_token: Optional[CancellationToken] = None) -> List[str]:
+        """PDF'yi bayt bütçeli parça dosyalarına (bolum-001.md, ...) dönüştürür
+        
+        Sayfalar akış halinde sıradaki parçaya yazılır; parça bütçeye
+        yaklaşınca bir sonraki ## başlığında, bütçe aşılınca ilk paragraf
+        sınırında yeni parçaya geçilir. SUMMARY.md başlıkları bulundukları
+        parçaya (dosya.md#anchor) bağlar. Önceki dönüşümden kalan fazla
+        parçalar silinir. pdf_path bellekteki bir PDF de olabilir.
+        """
+        source = prepare_source(pdf_path)
+        name = source_name(pdf_path)
+        
+        with self.instrumentation.stage('convert', detail=os.path.basename(name) if name else None):
+            return self._convert_to_shards(source, name, output_dir, title,
+                                           None if pages is None else sorted(set(pages)), cancel_token,
+                                           max_shard_bytes=max_shard_bytes)
+    
+    def convert_pdf_to_chapters(self, pdf_path: PDFSource, output_dir: str = None, title: str = None,
+                                pages: Optional[Iterable[int]] = None,
+                                cancel_token: Optional[CancellationToken] = None) -> List[str]:
+        """PDF'yi her ## başlığı (bölüm) için ayrı Markdown dosyasına dönüştürür
+        
+        Başlık tespitinin toc_entries kayıtları tek akış geçişinde dosya
+        sınırlarını belirler; sayfa sınırlarını aşan bölümler tek dosyada
+        kalır, belge bellekte tutulmaz. İlk bölümden önceki içerik
+        001-onsoz.md dosyasına yazılır. SUMMARY.md bölümleri ve ### alt
+        başlıklarını (dosya.md#anchor) listeler.
+        """
+        source = prepare_source(pdf_path)
+        name = source_name(pdf_path)
+        
+        with self.instrumentation.stage('convert', detail=os.path.basename(name) if name else None):
+            return self._convert_to_shards(source, name, output_dir, title,
+                                           None if pages is None else sorted(set(pages)), cancel_token,
+                                           chapters=True)
+    
+    def _convert_to_shards(self, pdf_path, name: Optional[str], output_dir: Optional[str], title: Optional[str],
+                           pages: Optional[List[int]] = None, cancel_token: Optional[CancellationToken] = None,
+                           max_shard_bytes: int = DEFAULT_SHARD_BYTES, chapters: bool = False) -> List[str]:
+        # Ana klasör adı ve çıktı dizini (sayfa modu ile aynı kurallar)
+        if title is None:
+            title = Path(name).stem if name else UNTITLED
+        if output_dir is None:
+            output_dir = os.path.dirname(name) if name else os.getcwd()
+        
+        main_folder = os.path.join(output_dir, f"{title}_chapters" if chapters else f"{title}_shards")
+        os.makedirs(main_folder, exist_ok=True)
+        print(f"📁 Ana klasör oluşturuldu: {main_folder}")
+        
+        self.toc_entries = []
+        image_writer = ImageWriter(os.path.join(main_folder, 'images'))
+        
+        try:
+            print("📄 PDF içeriği çıkarılıyor...")
+            records = self._sample_font_statistics(
+                self.iter_text_from_pdf(pdf_path, pages, image_data=True, cancel_token=cancel_token)
+            )
+            
+            # Standart GitBook kuralları tek geçişte uygulanır, satırlar parçalara akar
+            if chapters:
+                print("✂️  Bölümlere yazılıyor (her ## başlığı ayrı dosya)...")
+                writer = ChapterWriter(main_folder, title, self.toc_entries)
+            else:
+                print(f"✂️  Parçalara yazılıyor (parça bütçesi {max_shard_bytes / 1024:.0f} KB)...")
+                writer = ShardWriter(main_folder, title, self.toc_entries, max_shard_bytes)
+            rules = self.text_rules() + self.gitbook_rules()
+            chunks = self._iter_page_chunks(self._attach_font_metrics(records, rules), image_writer)
+            with writer:
+                writer.write_lines(LineEngine(self.instrumentation.wrap_rules(rules)).run(_iter_lines(chunks)))
+            
+            if image_writer.missing_pages:
+                self._recover_images(pdf_path, list(image_writer.missing_pages), image_writer)
+        finally:
+            image_writer.close()
+        
+        shards = writer.shards
+        removed_count = remove_stale_shards(main_folder, shards, writer.filename_re)
+        if removed_count:
+            print(f"🗑️  {removed_count} eski dosya silindi")
+        if image_writer.written or image_writer.duplicates:
+            print(f"🖼️ {image_writer.written} görüntü kaydedildi "
+                  f"({image_writer.duplicates} tekrar eden görüntü atlandı)")
+        for error in image_writer.errors:
+            print(f"⚠️  Görüntü yazılamadı: {error}")
+        self._report_failed_pages()
+        
+        self.create_shards_summary(shards, self.toc_entries, main_folder, title, chapters=chapters)
+        self.create_shards_readme(shards, main_folder, title, selection=pages, chapters=chapters)
+        
+        print(f"🎉 {len(shards)} {'bölüm' if chapters else 'parça'} dosyası oluşturuldu!")
+        print(f"📚 GitBook klasörü: {main_folder}")
+        return [os.path.join(main_folder, shard['filename']) for shard in shards]
+    
+    def create_shards_summary(self, shards: List[Dict], toc_entries: List[Dict], output_dir: str, title: str,
+                              chapters: bool = False):
+        """Parçaları ve ##/### başlıklarını (dosya.md#anchor) listeleyen SUMMARY.md oluşturur
+        
+        chapters=True ise her dosya zaten bir ## başlığı olduğundan bölüm
+        adıyla listelenir, altında yalnızca ### başlıkları yer alır.
+        """
+        min_level = 3 if chapters else 2
+        headings = {}
+        for entry in toc_entries:
+            if min_level <= entry.level <= 3 and entry.filename:
+                headings.setdefault(entry.filename, []).append(entry)
+        
+        summary_content = f"""# {title}
+
+## İçindekiler
+
+* [Giriş](README.md)
+"""
+        
+        for shard in shards:
+            label = shard['title'] if chapters else _shard_label(shard)
+            summary_content += f"* [{label}]({shard['filename']})\n"
+            top_level = 3
+            for entry in headings.get(shard['filename'], []):
+                # Parçanın ## başlığından önce gelen ### başlıkları bir üst seviyede gösterilir
+                top_level = min(top_level, entry.level)
+                indent = "  " * (entry.level - top_level + 1)
+                summary_content += f"{indent}* [{entry.title}]({shard['filename']}#{entry.anchor})\n"
+        
+        with open(os.path.join(output_dir, "SUMMARY.md"), 'w', encoding='utf-8') as f:
+            f.write(summary_content)
+        
+        print(f"📑 SUMMARY.md oluşturuldu")
+    
+    def create_shards_readme(self, shards: List[Dict], output_dir: str, title: str,
+                             selection: Optional[List[int]] = None, chapters: bool = False):
+        """Parça (veya bölüm) listesini ve boyutlarını içeren README.md oluşturur"""
+        selection_line = ''
+        if selection is not None:
+            selection_line = f"- **Sayfa Seçimi:** {format_page_ranges(selection)}\n"
+        total_kb = sum(shard['bytes'] for shard in shards) / 1024
+        kind, kind_text = ('Bölüm', 'bölümlere') if chapters else ('Parça', 'parçalara')
+        kind_text += ' bölünmüş'
+        
+        readme_content = f"""# {title}
+
+Bu klasör **{title}** PDF dosyasının {kind_text} Markdown dönüşümünü içerir.
+
+## 📊 İstatistikler
+- **{kind} Sayısı:** {len(shards)}
+- **Toplam Boyut:** {total_kb:.0f} KB
+{selection_line}- **Dönüştürme Tarihi:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}
+- **Format:** GitBook uyumlu Markdown
+
+## 📖 GitBook ile Kullanım
+
+1. Bu klasörü GitBook projenize kopyalayın
+2. `SUMMARY.md` dosyasını kullanın
+3. `gitbook serve` ile önizleme yapın
+
+## 📄 {kind} Listesi
+
+"""
+        
+        for shard in shards:
+            readme_content += f"- [{_shard_label(shard)}]({shard['filename']}) ({shard['bytes'] / 1024:.0f} KB)\n"
+        
+        with open(os.path.join(output_dir, "README.md"), 'w', encoding='utf-8') as f:
+            f.write(readme_content)
+        
+        print(f"📖 README.md oluşturuldu")
+    
     def create_gitbook_summary(self, markdown_files: List[str], output_dir: str, title: str = "PDF Dönüştürülmüş Döküman") -> str:
         """Tek dosya için GitBook SUMMARY.md oluşturur"""
         summary_content = f"""# {title}
@@ -621,3 +1470,67 @@ Bu klasör **{title}** PDF dosyasının sayfa sayfa Markdown dönüşümünü i
         
         print(f"📑 GitBook SUMMARY.md oluşturuldu")
         return summary_path
+
+
+# Sayfa işçisindeki açık PDF sayfaları ve dönüştürücü (_open_isolated_pdf ile hazırlanır)
+_isolated = None
+
+
+def _open_isolated_pdf(pdf_path, pages: Optional[List[int]], options: Dict):
+    """Sayfa işçisi başlangıcı: PDF'yi açar ve çıkarma seçenekleriyle dönüştürücü oluşturur"""
+    global _isolated
+    collector = EventCollector()
+    converter = PDFToMarkdownConverter(observers=[collector] if options['instrument'] else None,
+                                       trace_memory=options['trace_memory'], table_engine=options['table_engine'],
+                                       heading_engine=options['heading_engine'])
+    pdf = pdfplumber.open(pdf_path, pages=pages)
+    _isolated = {
+        'converter': converter,
+        'collector': collector,
+        'pages': {page.page_number: page for page in pdf.pages},
+        # Bu işçide kodlanmış görüntü özetleri (işçi yeniden başlarsa sıfırlanır)
+        'digests': set() if options['image_data'] else None,
+    }
+
+
+def _isolated_page_numbers() -> List[int]:
+    """Sayfa işçisi görevi: açılan sayfaların numaraları"""
+    return sorted(_isolated['pages'])
+
+
+def _extract_isolated_page(page_num: int) -> tuple:
+    """Sayfa işçisi görevi: sayfayı çıkarır, (sayfa kaydı, aşama olayları) döndürür"""
+    page = _isolated['pages'][page_num]
+    try:
+        record = _isolated['converter']._extract_page(page, page_num - 1, _isolated['digests'])
+    finally:
+        page.flush_cache()
+        page.get_textmap.cache_clear()
+    events, _isolated['collector'].events = _isolated['collector'].events, []
+    return record, events
+
+
+def _convert_page_range(pdf_path: str, page_numbers: List[int], main_folder: str, title: str,
+                        cache: Optional[ConversionCache] = None, previous: Optional[Dict] = None,
+                        instrument: bool = False, trace_memory: bool = False,
+                        page_timeout: Optional[float] = None, table_engine: str = 'text',
+                        heading_engine: str = 'text', font_body_size: Optional[float] = None,
+                        index: Optional[TextIndex] = None) -> tuple:
+    """İşlem havuzu görevi: PDF'yi bir kez açar ve verilen sayfaları yazar
+    
+    (sonuçlar, aşama olayları, süresi aşan sayfalar) döndürür; olaylar
+    yalnızca instrument=True ise toplanır.
+    """
+    collector = EventCollector()
+    converter = PDFToMarkdownConverter(cache=cache, observers=[collector] if instrument else None,
+                                       trace_memory=trace_memory, page_timeout=page_timeout,
+                                       table_engine=table_engine, heading_engine=heading_engine, index=index)
+    converter.font_body_size = font_body_size
+    results = [
+        (page['page_num'], converter._write_page(page, main_folder, title, previous))
+        for page in converter.iter_text_from_pdf(pdf_path, pages=page_numbers)
+    ]
+    converter.instrumentation.close()
+    if index is not None:
+        index.close()
+    return results, collector.events, converter.failed_pages
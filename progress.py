@@ -0,0 +1,103 @@
+"""
+Yapılandırılmış ilerleme bildirimi
+Dönüştürücü her sayfa işlendiğinde ilerleme olayı üretir:
+{'page_num', 'done', 'total', 'bytes', 'elapsed', 'rate', 'eta'}.
+GUI ve CLI bu olayları ThrottledProgress ile seyrelterek gösterir.
+"""
+
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional, TextIO
+
+ProgressCallback = Callable[[Dict], None]
+
+
+class ProgressTracker:
+    """Tamamlanan sayfa ve bayt sayısından hız ve kalan süre hesaplar"""
+
+    def __init__(self, callback: ProgressCallback, total: int):
+        self.callback = callback
+        self.total = total
+        self.done = 0
+        self.size = 0
+        self.start = time.perf_counter()
+
+    def advance(self, page_num: Optional[int] = None, size: int = 0):
+        """Bir sayfanın bittiğini bildirir"""
+        self.done += 1
+        self.size += size
+        elapsed = time.perf_counter() - self.start
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        remaining = max(0, self.total - self.done)
+        self.callback({
+            'page_num': page_num,
+            'done': self.done,
+            'total': self.total,
+            'bytes': self.size,
+            'elapsed': elapsed,
+            'rate': rate,
+            'eta': remaining / rate if rate > 0 else None,
+        })
+
+
+class ThrottledProgress:
+    """Olayları en fazla interval saniyede bir iletir; son olay her zaman iletilir"""
+
+    def __init__(self, callback: ProgressCallback, interval: float = 0.1):
+        self.callback = callback
+        self.interval = interval
+        self._last = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Dict):
+        now = time.monotonic()
+        with self._lock:
+            if event['done'] < event['total'] and now - self._last < self.interval:
+                return
+            self._last = now
+        self.callback(event)
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Saniyeyi SS:DD:ss biçimine çevirir"""
+    if seconds is None:
+        return '--:--'
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+class ConsoleProgressMeter:
+    """Tek satırda güncellenen terminal ilerleme göstergesi"""
+
+    def __init__(self, stream: TextIO = None, width: int = 30, interval: float = 0.1):
+        self.stream = stream or sys.stderr
+        self.width = width
+        self._throttle = ThrottledProgress(self._render, interval)
+        self._drawn = False
+
+    def __call__(self, event: Dict):
+        self._throttle(event)
+
+    def _render(self, event: Dict):
+        total = max(1, event['total'])
+        ratio = min(1.0, event['done'] / total)
+        filled = int(self.width * ratio)
+        bar = '█' * filled + '░' * (self.width - filled)
+        line = (f"\r{bar} {event['done']}/{event['total']} sayfa %{ratio * 100:.0f} • "
+                f"{event['bytes'] / (1024 * 1024):.1f} MB • {event['rate']:.1f} sayfa/sn • "
+                f"kalan {format_duration(event['eta'])} ")
+        self.stream.write(line)
+        self.stream.flush()
+        self._drawn = True
+
+    def close(self):
+        """Gösterge satırını sonlandırır"""
+        if self._drawn:
+            self.stream.write('\n')
+            self.stream.flush()
+            self._drawn = False
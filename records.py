@@ -0,0 +1,118 @@
+"""
+Sayfa, görüntü, içindekiler ve özet kayıtları
+Binlerce sayfa ve başlık içeren toplu dönüşümlerde sözlük başına bellek yükü
+birikir; kayıtlar __slots__ kullanan küçük sınıflardır. Mevcut kodla uyum için
+sözlük gibi de okunup yazılabilirler (record['text'], record.get('fonts')).
+Önbelleğe ve işlem havuzuna giderken to_dict/from_dict ile dönüştürülürler.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+class Record:
+    """__slots__ kayıtlarının ortak temeli: alan erişimi hem öznitelik hem anahtar ile"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def keys(self) -> tuple:
+        return self.__slots__
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Record":
+        return cls(**data)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class ImageEntry(Record):
+    """Sayfadaki görüntü: içerik özetinden türetilen dosya adı ve (varsa) yazılacak baytlar"""
+
+    __slots__ = ('filename', 'digest', 'page_num', 'index', 'data')
+
+    def __init__(self, filename: str, digest: str, page_num: int, index: int, data: Optional[bytes] = None):
+        self.filename = filename
+        self.digest = digest
+        self.page_num = page_num
+        self.index = index
+        self.data = data
+
+
+class PageRecord(Record):
+    """Çıkarılmış sayfa: metin, görüntüler ve (font başlık motorunda) yazı tipi ölçüleri"""
+
+    __slots__ = ('page_num', 'text', 'images', 'fonts')
+
+    def __init__(self, page_num: int, text: str, images: Optional[List[ImageEntry]] = None,
+                 fonts: Optional[Dict] = None):
+        self.page_num = page_num
+        self.text = text
+        self.images = images if images is not None else []
+        self.fonts = fonts
+
+    def to_dict(self, image_data: bool = True) -> Dict:
+        """Önbellek JSON'u için sözlük; image_data=False ise görüntü baytları atılır"""
+        images = [image.to_dict() for image in self.images]
+        if not image_data:
+            for image in images:
+                image['data'] = None
+        data = {'page_num': self.page_num, 'text': self.text, 'images': images}
+        if self.fonts is not None:
+            data['fonts'] = self.fonts
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PageRecord":
+        return cls(data['page_num'], data['text'],
+                   [ImageEntry.from_dict(image) for image in data.get('images', ())],
+                   data.get('fonts'))
+
+
+class TocEntry(Record):
+    """İçindekiler girdisi; filename parçalı/bölüm çıktısında başlığın düştüğü dosyadır"""
+
+    __slots__ = ('level', 'title', 'anchor', 'filename')
+
+    def __init__(self, level: int, title: str, anchor: str, filename: Optional[str] = None):
+        self.level = level
+        self.title = title
+        self.anchor = anchor
+        self.filename = filename
+
+
+class SummaryEntry(Record):
+    """Sayfa bazlı çıktıda yazılan (veya değişmediği için atlanan) sayfa dosyası"""
+
+    __slots__ = ('filename', 'title', 'page_num', 'fingerprint', 'written')
+
+    def __init__(self, filename: str, title: str, page_num: int, fingerprint: str, written: bool = False):
+        self.filename = filename
+        self.title = title
+        self.page_num = page_num
+        self.fingerprint = fingerprint
+        self.written = written
@@ -0,0 +1,213 @@
+"""
+Parçalı (shard) ve bölüm bazlı Markdown çıktısı
+Dönüştürülmüş satırlar akış halinde sıradaki parça dosyasına yazılır; parça
+bayt bütçesine yaklaşınca bir sonraki ## başlığında, bütçe aşılınca ilk
+paragraf sınırında yeni dosyaya geçilir. ChapterWriter her ## başlığında
+(bölüm) yeni dosya açar. Kod blokları ve tablolar bölünmez. Başlıkların hangi
+dosyaya düştüğü kaydedilir; SUMMARY.md bağlantıları (dosya.md#anchor) bu
+kayıtlardan üretilir.
+"""
+
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+
+from records import TocEntry
+
+SHARD_FILENAME = 'bolum-{:03d}.md'
+SHARD_FILENAME_RE = re.compile(r'^bolum-\d{3,}\.md$')
+DEFAULT_SHARD_BYTES = 1024 * 1024
+# Bütçenin bu oranı dolduktan sonra gelen ilk ## başlığında yeni parçaya geçilir
+HEADING_SPLIT_RATIO = 0.8
+
+CHAPTER_FILENAME = '{:03d}-{}.md'
+CHAPTER_FILENAME_RE = re.compile(r'^\d{3,}-[^/\\]*\.md$')
+# Dosya adına giren anchor uzunluğu
+CHAPTER_SLUG_LENGTH = 50
+INTRO_TITLE = 'Önsöz'
+
+PAGE_MARKER_RE = re.compile(r'^<!-- Sayfa (\d+) -->$')
+
+
+class ShardWriter:
+    """Satırları bayt bütçeli parça dosyalarına yazar
+
+    toc_entries, dönüştürme kurallarının (HeadingRule) doldurduğu listedir;
+    kayıtlı bir başlığın satırı yazıldığında kayda o anki parça dosyası
+    ('filename') eklenir. Kurallar satır biriktirebildiği için kayıt, satır
+    parçaya ulaştığında atanır. Boş satırlar ve sayfa işaretleri sonraki
+    içerik satırıyla aynı dosyaya yazılır; böylece yeni parça, başladığı
+    sayfanın işaretini de içerir.
+    """
+
+    filename_re = SHARD_FILENAME_RE
+
+    def __init__(self, folder: str, title: str, toc_entries: List[TocEntry],
+                 max_bytes: int = DEFAULT_SHARD_BYTES):
+        self.folder = folder
+        self.title = title
+        self.toc_entries = toc_entries
+        self.max_bytes = max(1, max_bytes)
+        self.shards: List[Dict] = []
+        self._file = None
+        self._size = 0
+        self._assigned = 0
+        self._in_code = False
+        self._pending: List[str] = []  # Henüz yazılmamış boş satırlar ve sayfa işaretleri
+        self._page = None   # Son sayfa işaretinin sayfa numarası
+        self._has_content = False  # Açık parçaya içerik satırı yazıldı mı
+
+    def _next_heading(self, line: str) -> Optional[TocEntry]:
+        """Satır, sıradaki atanmamış başlık kaydının satırıysa o kaydı döndürür"""
+        if not line.startswith('#') or self._assigned >= len(self.toc_entries):
+            return None
+        entry = self.toc_entries[self._assigned]
+        if line == '#' * entry.level + ' ' + entry.title:
+            return entry
+        return None
+
+    def _should_split(self, line: str) -> bool:
+        """Bu içerik satırından önce yeni parçaya geçilmeli mi"""
+        if self._file is None:
+            return True
+        if self._in_code or not self._has_content:
+            return False
+        if line.startswith('## ') and self._size >= self.max_bytes * HEADING_SPLIT_RATIO:
+            return True
+        # Bütçe aşıldı: ilk paragraf sınırında geç (tablo satırı ortasında değil)
+        return self._size >= self.max_bytes and bool(self._pending) and not line.startswith('|')
+
+    def _shard_name(self, number: int, line: str) -> tuple:
+        """Yeni parçanın (dosya adı, başlık) çifti"""
+        return SHARD_FILENAME.format(number), f"Bölüm {number}"
+
+    def _shard_header(self, shard_title: str) -> str:
+        return f"""---
+title: {self.title} - {shard_title}
+description: PDF'den dönüştürülmüş Markdown dökümanı
+---
+
+# {self.title} - {shard_title}
+
+"""
+
+    def _open_shard(self, line: str):
+        self._close_shard()
+        number = len(self.shards) + 1
+        filename, shard_title = self._shard_name(number, line)
+        self._file = open(os.path.join(self.folder, filename), 'w', encoding='utf-8')
+        self._file.write(self._shard_header(shard_title))
+        self._size = 0
+        self._has_content = False
+        # Sayfa ortasında açılan parça önceki sayfadan devam eder
+        self.shards.append({'number': number, 'filename': filename, 'title': shard_title,
+                            'first_page': self._page, 'last_page': self._page, 'bytes': 0})
+
+    def _close_shard(self):
+        if self._file is not None:
+            self._file.write('\n')
+            self.shards[-1]['bytes'] = self._file.tell()
+            self._file.close()
+            self._file = None
+
+    def _write(self, line: str):
+        marker = PAGE_MARKER_RE.match(line)
+        if marker:
+            shard = self.shards[-1]
+            self._page = int(marker.group(1))
+            if shard['first_page'] is None or not self._has_content:
+                shard['first_page'] = self._page
+            shard['last_page'] = self._page
+
+        self._file.write(line + '\n')
+        self._size += len(line.encode('utf-8')) + 1
+
+    def write_lines(self, lines: Iterable[str]):
+        for line in lines:
+            if not self._in_code and (not line.strip() or PAGE_MARKER_RE.match(line)):
+                self._pending.append(line)
+                continue
+
+            if self._should_split(line):
+                self._open_shard(line)
+            for pending in self._pending:
+                self._write(pending)
+            self._pending = []
+
+            self._write(line)
+            self._has_content = True
+            if line.startswith('```'):
+                self._in_code = not self._in_code
+
+            entry = self._next_heading(line)
+            if entry is not None:
+                entry.filename = self.shards[-1]['filename']
+                self._assigned += 1
+
+    def close(self) -> List[Dict]:
+        """Son parçayı kapatır ve parça kayıtlarını döndürür"""
+        if self._file is not None:
+            for pending in self._pending:
+                self._write(pending)
+        self._pending = []
+        self._close_shard()
+        # Satırı eşleşmeyen başlıklar (olmamalı) son parçaya bağlanır
+        for entry in self.toc_entries[self._assigned:]:
+            if entry.filename is None:
+                entry.filename = self.shards[-1]['filename'] if self.shards else None
+        self._assigned = len(self.toc_entries)
+        return self.shards
+
+    def __enter__(self) -> "ShardWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ChapterWriter(ShardWriter):
+    """Her ## başlığında (bölüm) yeni dosya açar; ilk bölümden önceki içerik giriş dosyasına yazılır
+
+    Bölümler sayfa sınırlarını aşabilir; dosya yalnızca bölüm başlığında
+    değişir, bayt bütçesi uygulanmaz.
+    """
+
+    filename_re = CHAPTER_FILENAME_RE
+
+    def __init__(self, folder: str, title: str, toc_entries: List[TocEntry]):
+        super().__init__(folder, title, toc_entries)
+
+    def _should_split(self, line: str) -> bool:
+        if self._file is None:
+            return True
+        if self._in_code or not self._has_content:
+            return False
+        entry = self._next_heading(line)
+        return entry is not None and entry.level == 2
+
+    def _shard_name(self, number: int, line: str) -> tuple:
+        entry = self._next_heading(line)
+        if entry is None or entry.level != 2:
+            return CHAPTER_FILENAME.format(number, 'onsoz'), INTRO_TITLE
+        slug = entry.anchor[:CHAPTER_SLUG_LENGTH].strip('-') or 'bolum'
+        return CHAPTER_FILENAME.format(number, slug), entry.title
+
+    def _shard_header(self, shard_title: str) -> str:
+        # Bölüm dosyası kendi ## başlığıyla başlar; anchor'lar tek dosya çıktısıyla aynı kalır
+        return f"""---
+title: {shard_title}
+description: {self.title} - PDF'den dönüştürülmüş Markdown dökümanı
+---
+
+"""
+
+
+def remove_stale_shards(folder: str, shards: List[Dict], filename_re=SHARD_FILENAME_RE) -> int:
+    """Önceki dönüşümden kalan, artık kullanılmayan parça dosyalarını siler"""
+    current = {shard['filename'] for shard in shards}
+    removed = 0
+    for filename in os.listdir(folder):
+        if filename_re.match(filename) and filename not in current:
+            os.remove(os.path.join(folder, filename))
+            removed += 1
+    return removed
@@ -0,0 +1,100 @@
+"""
+Düzen tabanlı tablo çıkarma
+pdfplumber'ın geometrik tablo bulucusu (find_tables) çizgi ve dikdörtgenlerden
+tabloları sayfa başına bir kez tespit eder. Tablo bölgelerindeki karakterler
+metin akışından çıkarılır, tablolar sayfadaki konumlarında Markdown tablosu
+olarak yazılır. Çizgi/dikdörtgen içermeyen sayfalarda tablo araması yapılmaz.
+"""
+
+from typing import List, Optional
+
+TABLE_ENGINES = ('text', 'layout')
+
+# Tablo sayılması için en az satır/sütun (tek hücreli çerçeveler metin kalır)
+MIN_TABLE_ROWS = 2
+MIN_TABLE_COLUMNS = 2
+
+
+def has_ruling(page) -> bool:
+    """Sayfada tablo çizgisi olabilecek çizgi veya dikdörtgen var mı (hızlı yol)"""
+    return bool(page.lines or page.rects)
+
+
+def _cell_text(cell: Optional[str]) -> str:
+    """Hücre metnini tek satırlık Markdown hücresine çevirir"""
+    if not cell:
+        return ''
+    return ' '.join(cell.split()).replace('|', '\\|')
+
+
+def table_to_markdown(rows: List[List[Optional[str]]]) -> Optional[str]:
+    """Hücre satırlarını Markdown tablosuna çevirir (ilk satır başlık)
+
+    Boş satırlar atlanır; tablo olmaya yetmeyen girdiler için None döner.
+    """
+    rows = [[_cell_text(cell) for cell in row] for row in rows]
+    rows = [row for row in rows if any(row)]
+    if len(rows) < MIN_TABLE_ROWS:
+        return None
+    width = max(len(row) for row in rows)
+    if width < MIN_TABLE_COLUMNS:
+        return None
+
+    lines = []
+    for index, row in enumerate(rows):
+        row = row + [''] * (width - len(row))
+        lines.append('| ' + ' | '.join(row) + ' |')
+        if index == 0:
+            lines.append('| ' + ' | '.join(['---'] * width) + ' |')
+    return '\n'.join(lines)
+
+
+def _center_inside(obj, bbox) -> bool:
+    x0, top, x1, bottom = bbox
+    x = (obj['x0'] + obj['x1']) / 2
+    y = (obj['top'] + obj['bottom']) / 2
+    return x0 <= x <= x1 and top <= y <= bottom
+
+
+def extract_text_with_tables(page, table_settings: Optional[dict] = None) -> Optional[str]:
+    """Tablo bölgelerini metinden çıkarıp Markdown tablolarıyla birlikte sayfa metnini döndürür
+
+    Sayfada çizgi yoksa veya geçerli tablo bulunamazsa None döner; çağıran
+    normal extract_text yolunu kullanır.
+    """
+    if not has_ruling(page):
+        return None
+
+    tables = []
+    for table in page.find_tables(table_settings or {}):
+        markdown = table_to_markdown(table.extract())
+        if markdown is not None:
+            tables.append((table.bbox, markdown))
+    if not tables:
+        return None
+    tables.sort(key=lambda item: item[0][1])
+
+    # Tablo dışındaki karakterler, tablolar arasındaki dikey bantlara göre yazılır
+    bboxes = [bbox for bbox, _ in tables]
+    text_page = page.filter(
+        lambda obj: obj.get('object_type') != 'char' or not any(_center_inside(obj, bbox) for bbox in bboxes)
+    )
+
+    def band_text(top: float, bottom: float) -> str:
+        band = text_page.filter(
+            lambda obj: obj.get('object_type') != 'char' or top <= (obj['top'] + obj['bottom']) / 2 < bottom
+        )
+        return (band.extract_text() or '').strip('\n')
+
+    parts = []
+    top = float('-inf')
+    for bbox, markdown in tables:
+        text = band_text(top, bbox[1])
+        if text.strip():
+            parts.append(text)
+        parts.append(markdown)
+        top = bbox[3]
+    text = band_text(top, float('inf'))
+    if text.strip():
+        parts.append(text)
+    return '\n\n'.join(parts)
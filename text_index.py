@@ -0,0 +1,295 @@
+"""
+Kalıcı sayfa metni dizini (SQLite + FTS5)
+Çıkarılan sayfa metinleri, görüntü kayıtları ve tespit edilen başlıklar yerel
+bir SQLite veritabanında saklanır. Aynı PDF (içerik özeti ve çıkarma
+seçenekleri aynıysa) başka bir çıktı biçiminde yeniden dönüştürülürken
+pdfplumber çalıştırılmaz, sayfalar dizinden okunur. Sayfa metinleri FTS5 ile
+dizinlenir; dönüştürülmüş tüm belgelerde arama yapılabilir.
+"""
+
+import datetime
+import json
+import os
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from conversion_cache import DEFAULT_CACHE_DIR
+from records import ImageEntry, PageRecord, TocEntry
+
+DEFAULT_INDEX_PATH = os.path.join(DEFAULT_CACHE_DIR, 'index.sqlite3')
+DEFAULT_SEARCH_LIMIT = 20
+# Sayfa kayıtları dizinden bu büyüklükte gruplar halinde okunur
+READ_BATCH_PAGES = 256
+# Arama sonucundaki metin kesitinin kelime sayısı
+SNIPPET_WORDS = 12
+# Arama sonucuna bağlam olarak eklenen en derin başlık seviyesi
+CONTEXT_HEADING_LEVEL = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    digest TEXT NOT NULL,
+    extract_key TEXT NOT NULL,
+    name TEXT,
+    page_count INTEGER NOT NULL,
+    updated TEXT NOT NULL,
+    UNIQUE (digest, extract_key)
+);
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    page_num INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    fonts TEXT,
+    UNIQUE (document_id, page_num)
+);
+CREATE TABLE IF NOT EXISTS images (
+    page_id INTEGER NOT NULL REFERENCES pages(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    filename TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (page_id, position)
+);
+CREATE TABLE IF NOT EXISTS headings (
+    page_id INTEGER NOT NULL REFERENCES pages(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    anchor TEXT NOT NULL,
+    PRIMARY KEY (page_id, position)
+);
+"""
+
+# unicode61 ı/İ harflerini i'ye indirgemez; dizinlenen metin ve sorgu bu
+# eşlemeyle katlanır (tek harf yerine tek harf, snippet konumları değişmez)
+TURKISH_I_FOLD = str.maketrans({'ı': 'i', 'İ': 'i'})
+FOLD_SQL = "replace(replace({}, 'ı', 'i'), 'İ', 'i')"
+# Dizin şeması sürümü (PRAGMA user_version); FTS tetikleyicileri değişince artırılır
+SCHEMA_VERSION = 1
+
+# Harici içerikli FTS5 tablosu: metin pages tablosunda bir kez saklanır
+FTS_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+    text, content='pages', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS pages_fts_insert AFTER INSERT ON pages BEGIN
+    INSERT INTO pages_fts(rowid, text) VALUES (new.id, {FOLD_SQL.format('new.text')});
+END;
+CREATE TRIGGER IF NOT EXISTS pages_fts_delete AFTER DELETE ON pages BEGIN
+    INSERT INTO pages_fts(pages_fts, rowid, text) VALUES ('delete', old.id, {FOLD_SQL.format('old.text')});
+END;
+"""
+
+# Katlamasız tetikleyicilerle oluşturulmuş eski dizinlerin FTS tablosu yeniden kurulur
+FTS_MIGRATE = f"""
+DROP TRIGGER IF EXISTS pages_fts_insert;
+DROP TRIGGER IF EXISTS pages_fts_delete;
+INSERT INTO pages_fts(pages_fts) VALUES ('delete-all');
+INSERT INTO pages_fts(rowid, text) SELECT id, {FOLD_SQL.format('text')} FROM pages;
+"""
+
+
+def _match_query(query: str) -> str:
+    """Kullanıcı sorgusunu FTS5 ifadesine çevirir: her kelime tırnaklı, hepsi aranır (AND)"""
+    return ' '.join('"' + term.replace('"', '""') + '"' for term in query.translate(TURKISH_I_FOLD).split())
+
+
+def _plain_snippet(text: str, terms: List[str]) -> str:
+    """FTS5 yoksa ilk eşleşmenin çevresinden kesit (eşleşme [köşeli parantez] içinde)"""
+    words = text.split()
+    lowered = [word.lower() for word in words]
+    for index, word in enumerate(lowered):
+        if any(term in word for term in terms):
+            start = max(0, index - SNIPPET_WORDS // 2)
+            part = words[start:start + SNIPPET_WORDS]
+            part[index - start] = f"[{part[index - start]}]"
+            return ('…' if start else '') + ' '.join(part) + ('…' if start + SNIPPET_WORDS < len(words) else '')
+    return ' '.join(words[:SNIPPET_WORDS])
+
+
+class TextIndex:
+    """Sayfa metni, görüntü ve başlık kayıtlarını saklayan SQLite dizini
+
+    Bağlantı ilk kullanımda açılır; nesne işçi işlemlerine gönderilebilir
+    (her işlem kendi bağlantısını açar). Yazmalar commit() çağrılana kadar
+    tek işlemde (transaction) toplanır.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or DEFAULT_INDEX_PATH
+        # SQLite FTS5 olmadan derlenmişse arama LIKE ile yapılır
+        self.fts = True
+        self._conn = None
+
+    def __getstate__(self) -> Dict:
+        return {'path': self.path}
+
+    def __setstate__(self, state: Dict):
+        self.__init__(state['path'])
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA foreign_keys=ON')
+            conn.executescript(SCHEMA)
+            try:
+                conn.executescript(FTS_SCHEMA)
+                if conn.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION:
+                    conn.executescript(FTS_MIGRATE + FTS_SCHEMA + f'PRAGMA user_version = {SCHEMA_VERSION};')
+            except sqlite3.OperationalError:
+                self.fts = False
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+
+    def commit(self):
+        if self._conn is not None:
+            self._conn.commit()
+
+    def __enter__(self) -> "TextIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def document(self, digest: str, extract_key: str) -> Optional[Dict]:
+        """İçerik özeti ve çıkarma seçenekleriyle eşleşen belge kaydı ({'id', 'name', 'page_count'})"""
+        row = self.connection.execute(
+            'SELECT id, name, page_count FROM documents WHERE digest = ? AND extract_key = ?',
+            (digest, extract_key)
+        ).fetchone()
+        if row is None:
+            return None
+        return {'id': row[0], 'name': row[1], 'page_count': row[2]}
+
+    def add_document(self, digest: str, extract_key: str, name: Optional[str], page_count: int) -> int:
+        """Belge kaydını ekler veya adını/tarihini günceller, kimliğini döndürür"""
+        conn = self.connection
+        conn.execute(
+            'INSERT INTO documents (digest, extract_key, name, page_count, updated) VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT (digest, extract_key) DO UPDATE SET '
+            'name = COALESCE(excluded.name, name), page_count = excluded.page_count, updated = excluded.updated',
+            (digest, extract_key, name, page_count, datetime.datetime.now().isoformat(timespec='seconds'))
+        )
+        return conn.execute('SELECT id FROM documents WHERE digest = ? AND extract_key = ?',
+                            (digest, extract_key)).fetchone()[0]
+
+    def stored_pages(self, document_id: int) -> Set[int]:
+        """Belgenin dizindeki sayfa numaraları"""
+        return {row[0] for row in self.connection.execute(
+            'SELECT page_num FROM pages WHERE document_id = ?', (document_id,)
+        )}
+
+    def iter_pages(self, document_id: int, numbers: Optional[Iterable[int]] = None) -> Iterator[PageRecord]:
+        """Dizindeki sayfa kayıtlarını sayfa sırasıyla üretir (görüntü baytları None)"""
+        conn = self.connection
+        wanted = None if numbers is None else set(numbers)
+        images: Dict[int, List[ImageEntry]] = {}
+        for page_id, page_num, position, filename, digest in conn.execute(
+                'SELECT p.id, p.page_num, i.position, i.filename, i.digest FROM images i '
+                'JOIN pages p ON p.id = i.page_id WHERE p.document_id = ? ORDER BY p.page_num, i.position',
+                (document_id,)):
+            images.setdefault(page_id, []).append(ImageEntry(filename, digest, page_num, position))
+
+        # Üretim arasında aynı bağlantıyla yazılabileceği için açık imleç tutulmaz;
+        # sayfalar READ_BATCH_PAGES'lik gruplar halinde okunur
+        last = 0
+        while True:
+            rows = conn.execute(
+                'SELECT id, page_num, text, fonts FROM pages WHERE document_id = ? AND page_num > ? '
+                'ORDER BY page_num LIMIT ?', (document_id, last, READ_BATCH_PAGES)
+            ).fetchall()
+            if not rows:
+                return
+            last = rows[-1][1]
+            for page_id, page_num, text, fonts in rows:
+                if wanted is not None and page_num not in wanted:
+                    continue
+                yield PageRecord(page_num, text, images.get(page_id, []),
+                                 json.loads(fonts) if fonts is not None else None)
+
+    def add_page(self, document_id: int, record: PageRecord):
+        """Sayfa kaydını (ve görüntü kayıtlarını) ekler; sayfa varsa yerine yazılır"""
+        conn = self.connection
+        conn.execute('DELETE FROM pages WHERE document_id = ? AND page_num = ?', (document_id, record.page_num))
+        page_id = conn.execute(
+            'INSERT INTO pages (document_id, page_num, text, fonts) VALUES (?, ?, ?, ?)',
+            (document_id, record.page_num, record.text,
+             json.dumps(record.fonts, ensure_ascii=False) if record.fonts is not None else None)
+        ).lastrowid
+        conn.executemany(
+            'INSERT OR IGNORE INTO images (page_id, position, filename, digest) VALUES (?, ?, ?, ?)',
+            [(page_id, image.index, image.filename, image.digest) for image in record.images]
+        )
+
+    def set_headings(self, document_id: int, page_num: int, entries: List[TocEntry]):
+        """Sayfada tespit edilen başlıkları kaydeder (öncekilerin yerine)"""
+        conn = self.connection
+        row = conn.execute('SELECT id FROM pages WHERE document_id = ? AND page_num = ?',
+                           (document_id, page_num)).fetchone()
+        if row is None:
+            return
+        conn.execute('DELETE FROM headings WHERE page_id = ?', (row[0],))
+        conn.executemany(
+            'INSERT INTO headings (page_id, position, level, title, anchor) VALUES (?, ?, ?, ?, ?)',
+            [(row[0], position, entry.level, entry.title, entry.anchor) for position, entry in enumerate(entries)]
+        )
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Dict]:
+        """Tüm belgelerde sayfa metni araması
+
+        Sorgudaki her kelime aranır; Türkçe aksanlar (ı/İ dahil) ve büyük/küçük
+        harf yok sayılır. FTS5 yoksa LIKE kullanılır ve yalnızca ASCII harflerde
+        büyük/küçük harf yok sayılır. Sonuçlar {'name', 'digest', 'page_num',
+        'heading', 'snippet'} sözlükleridir; aynı PDF farklı seçeneklerle dizinlendiyse
+        sayfa bir kez listelenir.
+        """
+        terms = query.split()
+        if not terms:
+            return []
+        conn = self.connection
+        context = (
+            '(SELECT h.title FROM headings h JOIN pages hp ON hp.id = h.page_id '
+            f'WHERE hp.document_id = p.document_id AND hp.page_num <= p.page_num AND h.level <= {CONTEXT_HEADING_LEVEL} '
+            'ORDER BY hp.page_num DESC, h.position DESC LIMIT 1)'
+        )
+        if self.fts:
+            rows = conn.execute(
+                f"SELECT d.name, d.digest, p.page_num, {context}, "
+                f"snippet(pages_fts, 0, '[', ']', '…', {SNIPPET_WORDS}) "
+                'FROM pages_fts JOIN pages p ON p.id = pages_fts.rowid JOIN documents d ON d.id = p.document_id '
+                'WHERE pages_fts MATCH ? ORDER BY rank LIMIT ?',
+                (_match_query(query), limit * 2)
+            ).fetchall()
+        else:
+            lowered = [term.lower() for term in terms]
+            rows = [
+                (name, digest, page_num, heading, _plain_snippet(text, lowered))
+                for name, digest, page_num, heading, text in conn.execute(
+                    f"SELECT d.name, d.digest, p.page_num, {context}, p.text "
+                    'FROM pages p JOIN documents d ON d.id = p.document_id WHERE '
+                    + ' AND '.join(['p.text LIKE ?'] * len(terms)) + ' ORDER BY d.name, p.page_num LIMIT ?',
+                    [f'%{term}%' for term in terms] + [limit * 2]
+                )
+            ]
+
+        results = []
+        seen = set()
+        for name, digest, page_num, heading, snippet in rows:
+            if (digest, page_num) in seen:
+                continue
+            seen.add((digest, page_num))
+            results.append({'name': name, 'digest': digest, 'page_num': page_num,
+                            'heading': heading, 'snippet': ' '.join(snippet.split())})
+        return results[:limit]
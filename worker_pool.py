@@ -0,0 +1,309 @@
+"""
+Önceden başlatılmış işlemlerden oluşan görev havuzu
+Her işçi kendi Pipe bağlantısıyla beslenir; böylece zaman aşımına uğrayan
+bir işçi diğerlerini etkilemeden sonlandırılıp yerine yenisi başlatılabilir.
+İşçiler daemon değildir: görevler kendi havuzlarını (ör. sayfa süresi sınırı
+için sayfa işçisi) açabilir; program çıkarken işçiler sonlandırılır.
+Süresi dolan veya iptal edilen görev önce task_cancel_token ile iş birlikçi
+olarak durdurulur; cancel_grace içinde bitmezse işçisi sonlandırılır.
+"""
+
+import collections
+import multiprocessing
+import multiprocessing.util
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+from typing import Callable, Optional
+
+from cancellation import CancellationToken
+
+# İş birlikçi iptalden sonra işçi sonlandırılmadan önce beklenen süre (saniye)
+DEFAULT_CANCEL_GRACE = 2.0
+
+# İşçi işleminde çalışan görevin iptal olayı (_worker_main ayarlar)
+_cancel_event = None
+
+
+class TaskTimeoutError(TimeoutError):
+    """Görev zaman sınırını aştı (iptal isteğiyle durdu veya işçisi sonlandırıldı)"""
+
+
+class WorkerCrashedError(RuntimeError):
+    """İşçi işlem görev sırasında beklenmedik şekilde sonlandı"""
+
+
+class TaskCancelledError(RuntimeError):
+    """Çalışan görev iptal edildi (iptal isteğiyle durdu veya işçisi sonlandırıldı)"""
+
+
+def task_cancel_token() -> Optional[CancellationToken]:
+    """İşçi işleminde çalışan görevin iptal token'ı (havuz dışında None)
+
+    Görev zaman sınırını aştığında veya cancel ile iptal edildiğinde iptal
+    edilir; token'ı dönüştürme metotlarına veren görev sayfalar arasında durur.
+    """
+    if _cancel_event is None:
+        return None
+    return CancellationToken(_cancel_event)
+
+
+def _worker_main(conn, cancel_event, initializer, initargs):
+    """İşçi döngüsü: (func, args, kwargs) alır, ('ok'|'error', değer) gönderir"""
+    global _cancel_event
+    _cancel_event = cancel_event
+    if initializer is not None:
+        initializer(*initargs)
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        func, args, kwargs = message
+        try:
+            reply = ('ok', func(*args, **kwargs))
+        except Exception as e:
+            reply = ('error', e)
+
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # Sonuç veya hata pickle edilemiyorsa metin olarak gönder
+            conn.send(('error', RuntimeError(f"{reply[0]}: {e}")))
+
+
+class _Worker:
+    def __init__(self, process, conn, cancel_event):
+        self.process = process
+        self.conn = conn
+        self.cancel_event = cancel_event
+        self.future = None
+        self.deadline = None
+        self.cancelled = False
+        # İş birlikçi iptal istendi; deadline artık sonlandırma zamanı
+        self.stopping = False
+
+
+class WorkerPool:
+    """Görev başına zaman aşımı destekleyen sıcak işlem havuzu
+
+    submit bir concurrent.futures.Future döndürür. Zaman sınırını aşan
+    görevin token'ı iptal edilir; görev cancel_grace saniyede bitmezse
+    işçisi sonlandırılır. Her iki durumda Future TaskTimeoutError ile
+    tamamlanır ve havuz boyutu korunur. Çalışan görevler cancel ile aynı
+    şekilde durdurulabilir (TaskCancelledError).
+    """
+
+    def __init__(self, size: int, initializer: Optional[Callable] = None, initargs: tuple = (),
+                 cancel_grace: float = DEFAULT_CANCEL_GRACE):
+        self._ctx = multiprocessing.get_context()
+        self._initializer = initializer
+        self._initargs = initargs
+        self.cancel_grace = cancel_grace
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._terminated = False
+        self._wakeup_reader, self._wakeup_writer = self._ctx.Pipe(duplex=False)
+        self._workers = [self._spawn() for _ in range(max(1, size))]
+        self._thread = threading.Thread(target=self._dispatch, daemon=True)
+        self._thread.start()
+        # Kapatılmadan kalan havuzun işçileri, çıkışta alt işlemler beklenmeden önce sonlandırılır
+        self._finalizer = multiprocessing.util.Finalize(self, self.terminate, exitpriority=10)
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        cancel_event = self._ctx.Event()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, cancel_event, self._initializer, self._initargs)
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn, cancel_event)
+
+    def submit(self, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Future:
+        """Görevi kuyruğa ekler; timeout saniye cinsinden, işçiye verildiği andan itibaren"""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Havuz kapatıldı")
+            self._pending.append((future, func, args, kwargs, timeout))
+        self._wakeup()
+        return future
+
+    def cancel(self, future: Future) -> bool:
+        """Görevi iptal eder: kuyruktaysa sıradan çıkarır, çalışıyorsa önce token'ını iptal eder"""
+        if future.cancel():
+            return True
+        with self._lock:
+            for worker in self._workers:
+                if worker.future is future:
+                    worker.cancelled = True
+                    if not worker.stopping:
+                        worker.deadline = time.monotonic()
+                    break
+            else:
+                return False
+        self._wakeup()
+        return True
+
+    @property
+    def queued(self) -> int:
+        """Henüz bir işçiye verilmemiş görev sayısı"""
+        with self._lock:
+            return len(self._pending)
+
+    def _wakeup(self):
+        try:
+            self._wakeup_writer.send_bytes(b'')
+        except OSError:
+            pass
+
+    def _assign(self):
+        """Boştaki işçilere bekleyen görevleri dağıtır"""
+        with self._lock:
+            for worker in self._workers:
+                if worker.future is not None:
+                    continue
+                while self._pending:
+                    future, func, args, kwargs, timeout = self._pending.popleft()
+                    if not future.set_running_or_notify_cancel():
+                        continue  # Kuyruktayken iptal edildi
+                    # İşçi boşta: önceki görevin iptal isteği yeni göreve taşınmaz
+                    worker.cancel_event.clear()
+                    try:
+                        worker.conn.send((func, args, kwargs))
+                    except Exception as e:
+                        future.set_exception(e)
+                        continue
+                    worker.future = future
+                    worker.deadline = None if timeout is None else time.monotonic() + timeout
+                    worker.cancelled = False
+                    worker.stopping = False
+                    break
+
+    def _replace(self, worker: _Worker):
+        """İşçiyi sonlandırıp yerine yenisini başlatır (havuz terminate edildiyse başlatmaz)"""
+        if worker.process.is_alive():
+            worker.process.terminate()
+        worker.process.join()
+        worker.conn.close()
+        if not self._terminated:
+            self._workers[self._workers.index(worker)] = self._spawn()
+
+    def _dispatch(self):
+        while True:
+            self._assign()
+
+            busy = [worker for worker in self._workers if worker.future is not None]
+            with self._lock:
+                if self._closed and not busy and not self._pending:
+                    break
+
+            deadlines = [worker.deadline for worker in busy if worker.deadline is not None]
+            wait_timeout = max(0, min(deadlines) - time.monotonic()) if deadlines else None
+
+            handles = [self._wakeup_reader]
+            for worker in busy:
+                handles.extend([worker.conn, worker.process.sentinel])
+            ready = wait(handles, wait_timeout)
+
+            if self._wakeup_reader in ready:
+                while self._wakeup_reader.poll():
+                    self._wakeup_reader.recv_bytes()
+
+            for worker in busy:
+                if worker.conn in ready or worker.process.sentinel in ready:
+                    self._collect(worker)
+
+            now = time.monotonic()
+            for worker in busy:
+                if worker.future is None or worker.deadline is None or now < worker.deadline:
+                    continue
+                if not worker.stopping and self.cancel_grace > 0:
+                    # Önce iş birlikçi iptal; görev süre içinde bitmezse işçi sonlandırılır
+                    worker.stopping = True
+                    worker.cancel_event.set()
+                    worker.deadline = now + self.cancel_grace
+                    continue
+                future = worker.future
+                worker.future = None
+                self._replace(worker)
+                future.set_exception(self._stop_error(worker))
+
+        for worker in self._workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.conn.close()
+
+    def _collect(self, worker: _Worker):
+        """İşçiden gelen sonucu Future'a aktarır"""
+        future = worker.future
+        try:
+            if not worker.conn.poll():
+                raise EOFError
+            status, value = worker.conn.recv()
+        except (EOFError, OSError):
+            worker.future = None
+            self._replace(worker)
+            future.set_exception(WorkerCrashedError("İşçi işlem beklenmedik şekilde sonlandı"))
+            return
+
+        worker.future = None
+        if status == 'ok':
+            future.set_result(value)
+        elif worker.stopping:
+            # Görev iptal isteğiyle durdu (ör. ConversionCancelled)
+            future.set_exception(self._stop_error(worker))
+        else:
+            future.set_exception(value)
+
+    @staticmethod
+    def _stop_error(worker: _Worker) -> Exception:
+        if worker.cancelled:
+            return TaskCancelledError("Görev iptal edildi")
+        return TaskTimeoutError("Görev zaman sınırını aştı")
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """Yeni görev kabulünü durdurur; wait ise çalışan görevlerin bitmesini bekler"""
+        with self._lock:
+            self._closed = True
+            if cancel_pending:
+                while self._pending:
+                    self._pending.popleft()[0].cancel()
+        self._wakeup()
+        if wait:
+            self._thread.join()
+            self._finalizer.cancel()
+
+    def terminate(self):
+        """Bekleyen görevleri iptal eder ve çalışanlar dahil tüm işçileri hemen sonlandırır"""
+        self._terminated = True
+        self.shutdown(wait=False, cancel_pending=True)
+        for worker in list(self._workers):
+            if worker.process.is_alive():
+                worker.process.terminate()
+        self._thread.join(timeout=5)
+        for worker in list(self._workers):
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.process.join()
+        self._finalizer.cancel()
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()